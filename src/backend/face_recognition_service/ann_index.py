@@ -0,0 +1,244 @@
+"""Approximate nearest-neighbour indexes over face encodings.
+
+HNSWIndex wraps hnswlib when it is installed; IVFIndex is a NumPy inverted-file
+index (k-means coarse quantizer, exact distances inside the probed lists) used
+otherwise. Both take stable integer labels, support incremental inserts and
+deletes, and save/load a snapshot next to a path prefix.
+"""
+
+import hashlib
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+
+def encoding_label(person_id: str, ordinal: int) -> int:
+    """Stable 63-bit label of a person's n-th encoding, the same across restarts"""
+    digest = hashlib.blake2b(f"{person_id}\0{ordinal}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') >> 1
+
+
+def _empty_result(queries: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    return np.full((queries, k), -1, dtype=np.int64), np.full((queries, k), np.inf, dtype=np.float32)
+
+
+class IVFIndex:
+    """Inverted-file index: vectors are bucketed by their nearest k-means
+    centroid and a query scans only the `nprobe` closest buckets
+
+    Until `min_train_size` vectors are present everything sits in one bucket
+    (an exact scan). The quantizer is retrained whenever the index has grown
+    4x since the last training, which also drops deleted vectors.
+    """
+
+    kind = 'ivf'
+
+    def __init__(self, dimensions: int = 128, nprobe: int = 8, min_train_size: int = 4096, seed: int = 0):
+        self.dimensions = dimensions
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self._rng = np.random.default_rng(seed)
+        self._centroids = np.zeros((1, dimensions), dtype=np.float32)
+        self._trained_size = 0
+        self._vectors = np.empty((0, dimensions), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)
+        self._labels = np.empty(0, dtype=np.int64)
+        self._size = 0                         # positions used, deleted ones included
+        self._positions: Dict[int, int] = {}   # live label -> position
+        self._members: List[Set[int]] = [set()]
+        self._cache: Dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def add(self, labels: Iterable[int], vectors: np.ndarray):
+        labels = [int(label) for label in labels]
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimensions)
+        self.remove(labels)
+
+        needed = self._size + len(labels)
+        if needed > len(self._vectors):
+            capacity = max(needed, 2 * len(self._vectors), 1024)
+            self._vectors = np.concatenate([self._vectors[:self._size], np.empty((capacity - self._size, self.dimensions), dtype=np.float32)])
+            self._norms = np.concatenate([self._norms[:self._size], np.empty(capacity - self._size, dtype=np.float32)])
+            self._labels = np.concatenate([self._labels[:self._size], np.empty(capacity - self._size, dtype=np.int64)])
+
+        positions = np.arange(self._size, needed)
+        self._vectors[positions] = vectors
+        self._norms[positions] = (vectors * vectors).sum(axis=1)
+        self._labels[positions] = labels
+        self._size = needed
+        for label, position, bucket in zip(labels, positions.tolist(), self._assign(vectors).tolist()):
+            self._positions[label] = position
+            self._members[bucket].add(position)
+            self._cache.pop(bucket, None)
+
+        if len(self) >= max(self.min_train_size, 4 * self._trained_size):
+            self._train()
+
+    def remove(self, labels: Iterable[int]):
+        for label in labels:
+            position = self._positions.pop(int(label), None)
+            if position is None:
+                continue
+            bucket = int(self._assign(self._vectors[position:position + 1])[0])
+            self._members[bucket].discard(position)
+            self._cache.pop(bucket, None)
+
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Labels and distances of up to k nearest vectors per query, padded with -1/inf"""
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dimensions)
+        labels, distances = _empty_result(len(queries), k)
+        nprobe = min(self.nprobe, len(self._centroids))
+        for row, query in enumerate(queries):
+            buckets = np.argpartition(self._centroid_distances(query[None, :])[0], nprobe - 1)[:nprobe]
+            positions = np.concatenate([self._bucket(int(bucket)) for bucket in buckets])
+            if not len(positions):
+                continue
+            squared = self._norms[positions] - 2 * self._vectors[positions] @ query + query @ query
+            found = min(k, len(positions))
+            nearest = np.argpartition(squared, found - 1)[:found]
+            nearest = nearest[np.argsort(squared[nearest])]
+            labels[row, :found] = self._labels[positions[nearest]]
+            distances[row, :found] = np.sqrt(np.maximum(squared[nearest], 0))
+        return labels, distances
+
+    def save(self, path: str):
+        positions = np.fromiter(self._positions.values(), dtype=np.int64, count=len(self._positions))
+        np.savez(f"{path}.npz", centroids=self._centroids, trained_size=self._trained_size,
+                 vectors=self._vectors[positions], labels=self._labels[positions])
+
+    @classmethod
+    def load(cls, path: str, dimensions: int = 128) -> 'IVFIndex':
+        index = cls(dimensions)
+        with np.load(f"{path}.npz") as snapshot:
+            index._centroids = snapshot['centroids']
+            index._trained_size = int(snapshot['trained_size'])
+            index._members = [set() for _ in range(len(index._centroids))]
+            index.add(snapshot['labels'], snapshot['vectors'])
+        return index
+
+    def _bucket(self, bucket: int) -> np.ndarray:
+        if bucket not in self._cache:
+            self._cache[bucket] = np.fromiter(self._members[bucket], dtype=np.int64, count=len(self._members[bucket]))
+        return self._cache[bucket]
+
+    def _centroid_distances(self, vectors: np.ndarray) -> np.ndarray:
+        # Squared distances up to a per-vector constant, enough for argmin/argpartition
+        return (self._centroids * self._centroids).sum(axis=1)[None, :] - 2 * vectors @ self._centroids.T
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return self._centroid_distances(vectors).argmin(axis=1) if len(vectors) else np.empty(0, dtype=np.int64)
+
+    def _train(self, iterations: int = 10):
+        positions = np.fromiter(self._positions.values(), dtype=np.int64, count=len(self._positions))
+        vectors = self._vectors[positions]
+        buckets = max(1, min(4096, int(np.sqrt(len(vectors)))))
+        sample = vectors[self._rng.choice(len(vectors), size=min(len(vectors), 64 * buckets), replace=False)]
+
+        self._centroids = sample[self._rng.choice(len(sample), size=buckets, replace=False)].copy()
+        for _ in range(iterations):
+            assigned = self._assign(sample)
+            counts = np.bincount(assigned, minlength=buckets)
+            filled = counts > 0
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+            sums = np.add.reduceat(sample[np.argsort(assigned, kind='stable')], starts, axis=0)
+            self._centroids[filled] = sums / counts[filled, None]
+            self._centroids[~filled] = sample[self._rng.choice(len(sample), size=int((~filled).sum()))]
+
+        # Compact to live vectors and rebuild the inverted lists
+        self._vectors, self._norms, self._labels = vectors, self._norms[positions], self._labels[positions]
+        self._size = len(vectors)
+        self._positions = {int(label): position for position, label in enumerate(self._labels.tolist())}
+        self._members = [set() for _ in range(buckets)]
+        for position, bucket in enumerate(self._assign(vectors).tolist()):
+            self._members[bucket].add(position)
+        self._cache = {}
+        self._trained_size = len(vectors)
+        logger.info(f"Trained IVF index: {len(vectors)} vectors in {buckets} lists")
+
+
+class HNSWIndex:
+    """hnswlib graph index; deleted labels are masked and reused on re-insert"""
+
+    kind = 'hnsw'
+
+    def __init__(self, dimensions: int = 128, m: int = 16, ef_construction: int = 200, ef_search: int = 256,
+                 capacity: int = 1024, snapshot: Optional[str] = None):
+        if not HNSWLIB_AVAILABLE:
+            raise ImportError("hnswlib is not installed")
+        self.dimensions = dimensions
+        self.ef_search = ef_search
+        self._index = hnswlib.Index(space='l2', dim=dimensions)
+        if snapshot:
+            self._index.load_index(f"{snapshot}.hnsw")
+            self._labels: Set[int] = set(np.load(f"{snapshot}.labels.npy").tolist())
+        else:
+            self._index.init_index(max_elements=capacity, ef_construction=ef_construction, M=m)
+            self._labels = set()
+        self._index.set_ef(ef_search)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def add(self, labels: Iterable[int], vectors: np.ndarray):
+        labels = np.asarray([int(label) for label in labels], dtype=np.uint64)
+        if not len(labels):
+            return
+        needed = self._index.get_current_count() + len(labels)
+        if needed > self._index.get_max_elements():
+            self._index.resize_index(max(needed, 2 * self._index.get_max_elements()))
+        self._index.add_items(np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimensions), labels)
+        self._labels.update(labels.tolist())
+
+    def remove(self, labels: Iterable[int]):
+        for label in labels:
+            label = int(label)
+            if label in self._labels:
+                self._index.mark_deleted(label)
+                self._labels.discard(label)
+
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Labels and distances of up to k nearest vectors per query, padded with -1/inf"""
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dimensions)
+        labels, distances = _empty_result(len(queries), k)
+        found = min(k, len(self))
+        if found and len(queries):
+            self._index.set_ef(max(self.ef_search, found))
+            nearest, squared = self._index.knn_query(queries, k=found)
+            labels[:, :found] = nearest.astype(np.int64)
+            distances[:, :found] = np.sqrt(np.maximum(squared, 0))
+        return labels, distances
+
+    def save(self, path: str):
+        self._index.save_index(f"{path}.hnsw")
+        np.save(f"{path}.labels.npy", np.fromiter(self._labels, dtype=np.int64, count=len(self._labels)))
+
+    @classmethod
+    def load(cls, path: str, dimensions: int = 128) -> 'HNSWIndex':
+        return cls(dimensions, snapshot=path)
+
+
+INDEX_TYPES = {'hnsw': HNSWIndex, 'ivf': IVFIndex}
+
+
+def create_ann_index(kind: str = 'auto', dimensions: int = 128):
+    """HNSW when hnswlib is available (for 'auto'/'hnsw'), otherwise IVF; None for 'off'"""
+    kind = (kind or 'off').lower()
+    if kind in ('off', 'none', 'exact'):
+        return None
+    if kind in ('auto', 'hnsw') and HNSWLIB_AVAILABLE:
+        return HNSWIndex(dimensions)
+    if kind == 'hnsw':
+        logger.warning("hnswlib is not installed, using the NumPy IVF index")
+    return IVFIndex(dimensions)
@@ -2,16 +2,19 @@ from flask import Flask, request, jsonify
 import face_recognition
 import cv2
 import numpy as np
-from PIL import Image
-import io
-import base64
 import redis
 import json
 import os
+import atexit
 import logging
+import threading
 from typing import List, Dict, Tuple, Optional
 import time
 
+from ann_index import INDEX_TYPES, create_ann_index, encoding_label
+import face_encoding
+from face_encoding import BatchFaceEncoder
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,6 +29,14 @@ redis_client = redis.Redis(
     decode_responses=True
 )
 
+# Same server without response decoding, for the raw float32 encoding bytes
+redis_binary_client = redis.Redis(
+    host=os.getenv('REDIS_HOST', 'localhost'),
+    port=int(os.getenv('REDIS_PORT', 6379)),
+    db=int(os.getenv('REDIS_DB', 0)),
+    decode_responses=False
+)
+
 class FaceRecognitionService:
     def __init__(self):
         self.model = 'hog'  # Use 'cnn' for better accuracy but slower processing
@@ -34,26 +45,7 @@ class FaceRecognitionService:
     def encode_face_from_base64(self, base64_image: str) -> List[List[float]]:
         """Extract face encodings from base64 image"""
         try:
-            # Remove data URL prefix if present
-            if base64_image.startswith('data:image'):
-                base64_image = base64_image.split(',')[1]
-            
-            # Decode base64 image
-            image_data = base64.b64decode(base64_image)
-            image = Image.open(io.BytesIO(image_data))
-            
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Convert PIL image to numpy array
-            image_array = np.array(image)
-            
-            # Find face locations and encodings
-            face_locations = face_recognition.face_locations(image_array, model=self.model)
-            face_encodings = face_recognition.face_encodings(image_array, face_locations)
-            
-            return [encoding.tolist() for encoding in face_encodings]
+            return face_encoding.encode_faces(face_encoding.load_image(base64_image), self.model)
             
         except Exception as e:
             logger.error(f"Error encoding face from base64: {str(e)}")
@@ -62,24 +54,7 @@ class FaceRecognitionService:
     def encode_face_from_url(self, image_url: str) -> List[List[float]]:
         """Extract face encodings from image URL"""
         try:
-            import requests
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
-            image = Image.open(io.BytesIO(response.content))
-            
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Convert PIL image to numpy array
-            image_array = np.array(image)
-            
-            # Find face locations and encodings
-            face_locations = face_recognition.face_locations(image_array, model=self.model)
-            face_encodings = face_recognition.face_encodings(image_array, face_locations)
-            
-            return [encoding.tolist() for encoding in face_encodings]
+            return face_encoding.encode_faces(face_encoding.load_image(image_url), self.model)
             
         except Exception as e:
             logger.error(f"Error encoding face from URL: {str(e)}")
@@ -105,60 +80,482 @@ class FaceRecognitionService:
     def detect_faces_with_locations(self, base64_image: str) -> Dict:
         """Detect faces and return locations and encodings"""
         try:
-            # Remove data URL prefix if present
-            if base64_image.startswith('data:image'):
-                base64_image = base64_image.split(',')[1]
-            
-            # Decode base64 image
-            image_data = base64.b64decode(base64_image)
-            image = Image.open(io.BytesIO(image_data))
-            
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Convert PIL image to numpy array
-            image_array = np.array(image)
-            
-            # Get image dimensions
-            height, width = image_array.shape[:2]
-            
-            # Find face locations and encodings
-            face_locations = face_recognition.face_locations(image_array, model=self.model)
-            face_encodings = face_recognition.face_encodings(image_array, face_locations)
-            
-            faces = []
-            for i, (location, encoding) in enumerate(zip(face_locations, face_encodings)):
-                top, right, bottom, left = location
-                faces.append({
-                    'id': i,
-                    'encoding': encoding.tolist(),
-                    'location': {
-                        'top': top,
-                        'right': right,
-                        'bottom': bottom,
-                        'left': left
-                    },
-                    'bounding_box': {
-                        'x': left,
-                        'y': top,
-                        'width': right - left,
-                        'height': bottom - top
-                    }
-                })
-            
-            return {
-                'faces_detected': len(faces),
-                'image_dimensions': {'width': width, 'height': height},
-                'faces': faces
-            }
+            return face_encoding.detect_faces(face_encoding.load_image(base64_image), self.model)
             
         except Exception as e:
             logger.error(f"Error detecting faces: {str(e)}")
             raise Exception(f"Failed to detect faces: {str(e)}")
 
+# Person records are Redis hashes: metadata fields plus the encodings as one
+# field of little-endian float32 bytes (rows of 128), instead of a JSON string
+PERSON_REGISTRY_KEY = 'person_registry'              # set of registered person IDs
+PERSON_REGISTRY_BUILT_KEY = 'person_registry_built'  # set once records predating the registry were added
+PERSON_METADATA_FIELDS = ('personId', 'personName', 'trainingImages', 'processedImages', 'totalFaces', 'registeredAt')
+PERSON_FIELD_TYPES = {'trainingImages': int, 'processedImages': int, 'totalFaces': int, 'registeredAt': float}
+ENCODING_DTYPE = np.dtype('<f4')
+
+def _person_mapping(person_info: Dict, encodings) -> Dict:
+    mapping = {field: str(person_info[field]) for field in PERSON_METADATA_FIELDS}
+    mapping['encodings'] = np.asarray(encodings, dtype=ENCODING_DTYPE).tobytes()
+    return mapping
+
+def save_person_record(redis_key: str, person_info: Dict, encodings) -> None:
+    """Write a person record as a hash, replacing any previous record"""
+    pipe = redis_binary_client.pipeline(transaction=True)
+    pipe.delete(redis_key)
+    pipe.hset(redis_key, mapping=_person_mapping(person_info, encodings))
+    pipe.sadd(PERSON_REGISTRY_KEY, person_info['personId'])
+    pipe.execute()
+
+def delete_person_record(person_id: str) -> bool:
+    """Delete a person record and drop it from the registry"""
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.delete(f"person_encodings:{person_id}")
+    pipe.srem(PERSON_REGISTRY_KEY, person_id)
+    deleted, _ = pipe.execute()
+    return bool(deleted)
+
+def registered_person_ids() -> List[str]:
+    """IDs of every registered person, from the registry set instead of KEYS"""
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.smembers(PERSON_REGISTRY_KEY)
+    pipe.exists(PERSON_REGISTRY_BUILT_KEY)
+    person_ids, built = pipe.execute()
+    if not built:
+        # One-time backfill of records written before the registry existed (SCAN, never KEYS)
+        legacy_ids = {key.split(':', 1)[1] for key in redis_client.scan_iter(match='person_encodings:*', count=500)}
+        pipe = redis_client.pipeline(transaction=True)
+        if legacy_ids:
+            pipe.sadd(PERSON_REGISTRY_KEY, *legacy_ids)
+        pipe.set(PERSON_REGISTRY_BUILT_KEY, 1)
+        pipe.execute()
+        logger.info(f"Backfilled person registry with {len(legacy_ids)} existing records")
+        person_ids = set(person_ids) | legacy_ids
+    return sorted(person_ids)
+
+def load_person_record(redis_key: str, with_encodings: bool = True) -> Optional[Dict]:
+    """Read a person record; encodings come back as a float32 (n, 128) array
+    
+    Legacy JSON string records are converted to the hash layout on first read.
+    """
+    fields = PERSON_METADATA_FIELDS + (('encodings',) if with_encodings else ())
+    try:
+        values = redis_binary_client.hmget(redis_key, fields)
+    except redis.ResponseError:
+        return _migrate_person_record(redis_key, with_encodings)
+    return _parse_person_fields(values, with_encodings)
+
+def load_person_records(person_ids: List[str], with_encodings: bool = True, batch_size: int = 1000) -> List[Dict]:
+    """Read many person records with one pipelined round-trip per batch
+    
+    IDs whose record no longer exists are dropped from the registry.
+    """
+    fields = PERSON_METADATA_FIELDS + (('encodings',) if with_encodings else ())
+    records, missing = [], []
+    for start in range(0, len(person_ids), batch_size):
+        batch = person_ids[start:start + batch_size]
+        pipe = redis_binary_client.pipeline(transaction=False)
+        for person_id in batch:
+            pipe.hmget(f"person_encodings:{person_id}", fields)
+        for person_id, values in zip(batch, pipe.execute(raise_on_error=False)):
+            try:
+                if isinstance(values, redis.ResponseError):
+                    person_info = _migrate_person_record(f"person_encodings:{person_id}", with_encodings)
+                else:
+                    person_info = _parse_person_fields(values, with_encodings)
+            except Exception as e:
+                logger.warning(f"Error reading person data for {person_id}: {str(e)}")
+                continue
+            if person_info is None:
+                missing.append(person_id)
+            else:
+                records.append(person_info)
+    
+    if missing:
+        redis_client.srem(PERSON_REGISTRY_KEY, *missing)
+    return records
+
+def _parse_person_fields(values: List[Optional[bytes]], with_encodings: bool) -> Optional[Dict]:
+    if values[0] is None:
+        return None
+    
+    person_info = {}
+    for field, value in zip(PERSON_METADATA_FIELDS, values):
+        value = value.decode('utf-8')
+        person_info[field] = PERSON_FIELD_TYPES[field](value) if field in PERSON_FIELD_TYPES else value
+    if with_encodings:
+        person_info['encodings'] = np.frombuffer(values[-1], dtype=ENCODING_DTYPE).reshape(-1, 128)
+    return person_info
+
+def _migrate_person_record(redis_key: str, with_encodings: bool) -> Optional[Dict]:
+    with redis_binary_client.pipeline() as pipe:
+        try:
+            # WATCH so a registration racing with the migration is never overwritten
+            pipe.watch(redis_key)
+            person_data = pipe.get(redis_key)
+            if person_data is None:
+                return None
+            person_info = json.loads(person_data)
+            encodings = np.asarray(person_info.pop('encodings'), dtype=ENCODING_DTYPE).reshape(-1, 128)
+            pipe.multi()
+            pipe.delete(redis_key)
+            pipe.hset(redis_key, mapping=_person_mapping(person_info, encodings))
+            pipe.execute()
+            logger.info(f"Migrated {redis_key} from JSON to the binary hash layout")
+        except redis.WatchError:
+            return load_person_record(redis_key, with_encodings)
+    
+    if with_encodings:
+        person_info['encodings'] = encodings
+    return person_info
+
+class EncodingGallery:
+    """In-memory float32 matrix of every registered face encoding
+
+    Rows are kept grouped per person, so the closest encoding of every person
+    is one matrix product plus one reduceat over the row distances instead of
+    one Redis round-trip and comparison per person. The gallery mirrors Redis:
+    it loads at startup and is updated in place on register/delete. Every
+    change bumps the version counter and records the person in a change log
+    (person -> version of their latest change), so when another worker has
+    changed the registry only the persons changed since our version are
+    re-read.
+    
+    With an ANN index (HNSW, or the NumPy IVF fallback) unfiltered matches on
+    galleries of at least `ann_min_size` encodings only compute distances to
+    each face's `ann_neighbours` approximate nearest encodings. The index is
+    built on a background thread after a full load - matches stay exact until
+    it is ready - and snapshotted to `snapshot_path` so a restart with an
+    unchanged registry does not rebuild it.
+    """
+    
+    VERSION_KEY = 'person_encodings_version'
+    CHANGES_KEY = 'person_encodings_changes'
+    
+    def __init__(self, redis_conn, dimensions: int = 128, index_kind: str = 'off', ann_min_size: int = 20000,
+                 ann_neighbours: int = 64, snapshot_path: Optional[str] = None, snapshot_interval: float = 300):
+        self.redis = redis_conn
+        self.dimensions = dimensions
+        self.index_kind = index_kind
+        self.ann_min_size = ann_min_size
+        self.ann_neighbours = ann_neighbours
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self.index = None
+        self._snapshot_at = time.time()
+        self._lock = threading.RLock()
+        self._version = None  # None until loaded
+        self._index_builder = None
+        self._index_generation = 0
+        self._reset()
+    
+    def _reset(self):
+        self._matrix = np.empty((0, self.dimensions), dtype=np.float32)
+        self._norms = np.empty(0, dtype=np.float32)   # squared row norms
+        self._row_slots = np.empty(0, dtype=np.int64)  # person slot of each row
+        self._row_labels = np.empty(0, dtype=np.int64) # ANN index label of each row
+        self._size = 0
+        self._persons: List[Optional[Dict]] = []       # slot -> personId/personName, None once deleted
+        self._slots: Dict[str, int] = {}
+        self._label_slots: Dict[int, int] = {}
+        self._runs = None
+        self._pending_labels = None                    # labels changed while the index builds
+    
+    def reload(self):
+        """Rebuild the matrix from every person record in Redis and start an index build"""
+        with self._lock:
+            version = int(self.redis.get(self.VERSION_KEY) or 0)
+            self.index = None
+            self._reset()
+            for person_info in load_person_records(registered_person_ids()):
+                try:
+                    self._append(person_info['personId'], person_info['personName'], person_info['encodings'])
+                except Exception as e:
+                    logger.warning(f"Error loading person {person_info['personId']}: {str(e)}")
+            self._version = version
+            logger.info(f"Loaded {len(self._slots)} persons ({self._size} encodings) into the gallery")
+            self._start_index_build()
+    
+    def snapshot(self):
+        """Persist the ANN index with the registry version it reflects"""
+        with self._lock:
+            if self.index is None or not self.snapshot_path or self._version is None:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.snapshot_path) or '.', exist_ok=True)
+                self.index.save(self.snapshot_path)
+                with open(f"{self.snapshot_path}.json.tmp", 'w') as f:
+                    json.dump({'kind': self.index.kind, 'version': self._version, 'size': len(self.index)}, f)
+                os.replace(f"{self.snapshot_path}.json.tmp", f"{self.snapshot_path}.json")
+                self._snapshot_at = time.time()
+                logger.info(f"Saved {self.index.kind} index snapshot ({len(self.index)} encodings)")
+            except Exception as e:
+                logger.warning(f"Error saving index snapshot: {str(e)}")
+    
+    def register(self, person_id: str, person_name: str, encodings: List[List[float]]):
+        """Replace a person's encodings after their record was written to Redis"""
+        with self._lock:
+            if self._record_change(person_id):
+                self._remove(person_id)
+                self._append(person_id, person_name, encodings)
+            self._snapshot_if_due()
+    
+    def unregister(self, person_id: str):
+        """Drop a person's encodings after their record was deleted from Redis"""
+        with self._lock:
+            if self._record_change(person_id):
+                self._remove(person_id)
+            self._snapshot_if_due()
+    
+    def nearest(self, face_encodings: List[List[float]], person_ids: Optional[List[str]] = None) -> Tuple[List[Dict], np.ndarray]:
+        """Distance from each face to the closest encoding of each person
+        
+        Returns the persons considered and a faces x persons distance matrix.
+        """
+        if int(self.redis.get(self.VERSION_KEY) or 0) != self._version:
+            with self._lock:
+                self._sync()
+        
+        if self.index is not None and not person_ids and self._size >= self.ann_min_size and len(face_encodings):
+            try:
+                return self._nearest_approximate(face_encodings)
+            except Exception as e:
+                logger.warning(f"ANN search failed, falling back to exact matching: {str(e)}")
+        
+        # Rows below _size are never written in place, so this snapshot stays valid unlocked
+        with self._lock:
+            matrix = self._matrix[:self._size]
+            norms = self._norms[:self._size]
+            starts, slots = self._person_runs()
+            persons = [self._persons[slot] for slot in slots]
+        
+        if person_ids:
+            wanted = np.array([self._slots.get(pid, -1) for pid in person_ids])
+            keep = np.isin(slots, wanted)
+            ends = np.append(starts[1:], len(matrix))
+            rows = np.concatenate([np.arange(start, end) for start, end in zip(starts[keep], ends[keep])] or [np.empty(0, dtype=np.int64)])
+            matrix, norms = matrix[rows], norms[rows]
+            starts = np.concatenate(([0], np.cumsum((ends - starts)[keep])[:-1])).astype(np.int64)
+            persons = [person for person, kept in zip(persons, keep) if kept]
+        
+        faces = np.asarray(face_encodings, dtype=np.float32).reshape(-1, self.dimensions)
+        if not persons or not len(faces):
+            return persons, np.empty((len(faces), len(persons)), dtype=np.float32)
+        
+        # |a - b|^2 = |a|^2 - 2ab + |b|^2 for every face/row pair in one product
+        squared = (faces * faces).sum(axis=1)[:, None] - 2 * faces @ matrix.T + norms[None, :]
+        distances = np.sqrt(np.maximum(squared, 0))
+        return persons, np.minimum.reduceat(distances, starts, axis=1)
+    
+    def _nearest_approximate(self, face_encodings: List[List[float]]) -> Tuple[List[Dict], np.ndarray]:
+        # Only persons owning one of each face's approximate nearest encodings are scored
+        faces = np.asarray(face_encodings, dtype=np.float32).reshape(-1, self.dimensions)
+        with self._lock:
+            labels, distances = self.index.search(faces, min(self.ann_neighbours, self._size))
+            slots = np.array([self._label_slots.get(label, -1) for label in labels.ravel().tolist()]).reshape(labels.shape)
+            candidates = list(dict.fromkeys(slot for slot in slots.ravel().tolist() if slot >= 0))
+            persons = [self._persons[slot] for slot in candidates]
+        
+        columns = {slot: column for column, slot in enumerate(candidates)}
+        best = np.full((len(faces), len(candidates)), np.inf, dtype=np.float32)
+        found = slots >= 0
+        face_rows = np.nonzero(found)[0]
+        np.minimum.at(best, (face_rows, [columns[slot] for slot in slots[found].tolist()]), distances[found])
+        return persons, best
+    
+    def wait_for_index(self, timeout: Optional[float] = None) -> bool:
+        """Block until a running index build finishes; False on timeout"""
+        builder = self._index_builder
+        if builder is not None:
+            builder.join(timeout)
+            return not builder.is_alive()
+        return True
+    
+    def _sync(self):
+        # Caller holds self._lock. Re-read only the persons changed since our version
+        if self._version is None:
+            self.reload()
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.get(self.VERSION_KEY)
+        pipe.zrangebyscore(self.CHANGES_KEY, f"({self._version}", '+inf')
+        version, changed = pipe.execute()
+        version = int(version or 0)
+        if version == self._version:
+            return
+        if version < self._version:
+            # The registry was reset underneath us
+            self.reload()
+            return
+        
+        records = {person_info['personId']: person_info for person_info in load_person_records(changed)}
+        for person_id in changed:
+            self._remove(person_id)
+            person_info = records.get(person_id)
+            if person_info is not None:
+                self._append(person_id, person_info['personName'], person_info['encodings'])
+        self._version = version
+        logger.info(f"Applied {len(changed)} person changes from other workers (version {version})")
+    
+    def _start_index_build(self):
+        # Caller holds self._lock. Rows below _size are never written in place,
+        # so the builder can read them unlocked while matches stay exact
+        self._index_generation += 1
+        self._pending_labels = set()
+        self._index_builder = threading.Thread(
+            target=self._build_index,
+            args=(self._index_generation, self._version, self._row_labels[:self._size], self._matrix[:self._size]),
+            name='face-index-build',
+            daemon=True
+        )
+        self._index_builder.start()
+    
+    def _build_index(self, generation: int, version: int, labels: np.ndarray, rows: np.ndarray):
+        # Reuse the snapshot if it reflects this registry version, otherwise build from the rows
+        index, built = None, False
+        try:
+            index = self._restore_snapshot(version, len(labels))
+            if index is None:
+                index = create_ann_index(self.index_kind, self.dimensions)
+                if index is not None:
+                    index.add(labels, rows)
+                    built = True
+                    logger.info(f"Built {index.kind} index over {len(index)} encodings")
+        except Exception as e:
+            logger.warning(f"Error building ANN index, matching stays exact: {str(e)}")
+            index = None
+        
+        with self._lock:
+            if generation != self._index_generation:
+                return  # A newer reload superseded this build
+            if index is not None:
+                # Catch up with persons registered or deleted while building
+                touched = np.fromiter(self._pending_labels, dtype=np.int64, count=len(self._pending_labels))
+                if len(touched):
+                    index.remove(touched.tolist())
+                    current = np.isin(self._row_labels[:self._size], touched)
+                    index.add(self._row_labels[:self._size][current], self._matrix[:self._size][current])
+            self.index = index
+            self._pending_labels = None
+        if built:
+            self.snapshot()
+    
+    def _restore_snapshot(self, version: int, size: int):
+        if not self.snapshot_path or not os.path.exists(f"{self.snapshot_path}.json"):
+            return None
+        try:
+            with open(f"{self.snapshot_path}.json") as f:
+                meta = json.load(f)
+            expected = create_ann_index(self.index_kind, self.dimensions)
+            if expected is None or meta['kind'] != expected.kind or meta['version'] != version or meta['size'] != size:
+                return None
+            index = INDEX_TYPES[meta['kind']].load(self.snapshot_path, self.dimensions)
+            logger.info(f"Restored {index.kind} index snapshot ({len(index)} encodings)")
+            return index
+        except Exception as e:
+            logger.warning(f"Error restoring index snapshot: {str(e)}")
+            return None
+    
+    def _snapshot_if_due(self):
+        if time.time() - self._snapshot_at >= self.snapshot_interval:
+            self.snapshot()
+    
+    def _record_change(self, person_id: str) -> bool:
+        # Caller holds self._lock. Bump the version and log the person in one
+        # transaction; True if the caller should apply the change locally,
+        # False if it was picked up by syncing with changes made elsewhere
+        with self.redis.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(self.VERSION_KEY)
+                    version = int(pipe.get(self.VERSION_KEY) or 0) + 1
+                    pipe.multi()
+                    pipe.set(self.VERSION_KEY, version)
+                    pipe.zadd(self.CHANGES_KEY, {person_id: version})
+                    pipe.execute()
+                    break
+                except redis.WatchError:
+                    continue
+        
+        if self._version is not None and version == self._version + 1:
+            self._version = version
+            return True
+        self._sync()
+        return False
+    
+    def _append(self, person_id: str, person_name: str, encodings: List[List[float]]):
+        rows = np.asarray(encodings, dtype=np.float32).reshape(-1, self.dimensions)
+        needed = self._size + len(rows)
+        if needed > len(self._matrix):
+            capacity = max(needed, 2 * len(self._matrix), 64)
+            self._matrix = np.concatenate([self._matrix[:self._size], np.empty((capacity - self._size, self.dimensions), dtype=np.float32)])
+            self._norms = np.concatenate([self._norms[:self._size], np.empty(capacity - self._size, dtype=np.float32)])
+            self._row_slots = np.concatenate([self._row_slots[:self._size], np.empty(capacity - self._size, dtype=np.int64)])
+            self._row_labels = np.concatenate([self._row_labels[:self._size], np.empty(capacity - self._size, dtype=np.int64)])
+        
+        slot = len(self._persons)
+        labels = [encoding_label(person_id, ordinal) for ordinal in range(len(rows))]
+        self._persons.append({'personId': person_id, 'personName': person_name})
+        self._slots[person_id] = slot
+        self._label_slots.update((label, slot) for label in labels)
+        self._matrix[self._size:needed] = rows
+        self._norms[self._size:needed] = (rows * rows).sum(axis=1)
+        self._row_slots[self._size:needed] = slot
+        self._row_labels[self._size:needed] = labels
+        self._size = needed
+        self._runs = None
+        if self.index is not None:
+            self.index.add(labels, rows)
+        if self._pending_labels is not None:
+            self._pending_labels.update(labels)
+    
+    def _remove(self, person_id: str):
+        slot = self._slots.pop(person_id, None)
+        if slot is None:
+            return
+        self._persons[slot] = None
+        keep = self._row_slots[:self._size] != slot
+        labels = self._row_labels[:self._size][~keep].tolist()
+        for label in labels:
+            self._label_slots.pop(label, None)
+        if self.index is not None:
+            self.index.remove(labels)
+        if self._pending_labels is not None:
+            self._pending_labels.update(labels)
+        # Compact into new arrays so snapshots held by concurrent matches are untouched
+        self._matrix = self._matrix[:self._size][keep]
+        self._norms = self._norms[:self._size][keep]
+        self._row_slots = self._row_slots[:self._size][keep]
+        self._row_labels = self._row_labels[:self._size][keep]
+        self._size = len(self._row_slots)
+        self._runs = None
+    
+    def _person_runs(self) -> Tuple[np.ndarray, np.ndarray]:
+        # First row and slot of each person's contiguous block of rows
+        if self._runs is None:
+            row_slots = self._row_slots[:self._size]
+            starts = np.flatnonzero(np.r_[True, row_slots[1:] != row_slots[:-1]]) if self._size else np.empty(0, dtype=np.int64)
+            self._runs = (starts, row_slots[starts])
+        return self._runs
+
 # Initialize service
 face_service = FaceRecognitionService()
+batch_encoder = BatchFaceEncoder(model=face_service.model, workers=int(os.getenv('FACE_ENCODING_WORKERS', 0)) or None)
+# Fork the encoding workers before the gallery load, Redis connections and index threads exist
+batch_encoder.start()
+atexit.register(batch_encoder.shutdown)
+encoding_gallery = EncodingGallery(
+    redis_client,
+    index_kind=os.getenv('FACE_ANN_INDEX', 'auto'),
+    ann_min_size=int(os.getenv('FACE_ANN_MIN_SIZE', 20000)),
+    ann_neighbours=int(os.getenv('FACE_ANN_NEIGHBOURS', 64)),
+    snapshot_path=os.getenv('FACE_ANN_SNAPSHOT_PATH', '/app/uploads/face_index')
+)
+atexit.register(encoding_gallery.snapshot)
+try:
+    encoding_gallery.reload()
+except Exception as e:
+    logger.warning(f"Gallery not loaded at startup, will load on first match: {str(e)}")
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -197,39 +594,38 @@ def register_person():
         
         all_encodings = []
         processed_images = 0
+        failed_images = []
         
-        for i, image_data in enumerate(training_images):
-            try:
-                if image_data.startswith('http'):
-                    encodings = face_service.encode_face_from_url(image_data)
-                else:
-                    encodings = face_service.encode_face_from_base64(image_data)
-                
+        # Training images are encoded in parallel on the worker pool
+        for image_result in batch_encoder.encode_images(training_images):
+            i = image_result['index']
+            if image_result['success']:
+                encodings = image_result['encodings']
                 all_encodings.extend(encodings)
                 processed_images += 1
                 logger.info(f"Processed training image {i+1} for {person_name}: {len(encodings)} faces found")
-                
-            except Exception as e:
-                logger.warning(f"Failed to process training image {i+1} for {person_name}: {str(e)}")
-                continue
+            else:
+                logger.warning(f"Failed to process training image {i+1} for {person_name}: {image_result['error']}")
+                failed_images.append({'index': i, 'error': image_result['error']})
         
         if not all_encodings:
             return jsonify({
                 'success': False,
-                'error': 'No faces found in training images'
+                'error': 'No faces found in training images',
+                'failedImages': failed_images
             }), 400
         
         # Store encodings in Redis
         redis_key = f"person_encodings:{person_id}"
-        redis_client.set(redis_key, json.dumps({
+        save_person_record(redis_key, {
             'personId': person_id,
             'personName': person_name,
-            'encodings': all_encodings,
             'trainingImages': len(training_images),
             'processedImages': processed_images,
             'totalFaces': len(all_encodings),
             'registeredAt': time.time()
-        }))
+        }, all_encodings)
+        encoding_gallery.register(person_id, person_name, all_encodings)
         
         return jsonify({
             'success': True,
@@ -237,7 +633,8 @@ def register_person():
             'personName': person_name,
             'facesRegistered': len(all_encodings),
             'imagesProcessed': processed_images,
-            'totalImages': len(training_images)
+            'totalImages': len(training_images),
+            'failedImages': failed_images
         })
         
     except Exception as e:
@@ -277,6 +674,38 @@ def detect_faces():
             'error': str(e)
         }), 500
 
+@app.route('/api/face/detect/batch', methods=['POST'])
+def detect_faces_batch():
+    """Detect faces in many images in parallel, reporting each image separately"""
+    try:
+        data = request.json
+        images = data.get('images', [])
+        
+        if not images or not isinstance(images, list):
+            return jsonify({
+                'success': False,
+                'error': 'Missing images list'
+            }), 400
+        
+        start_time = time.time()
+        results = batch_encoder.detect_images(images)
+        processing_time = time.time() - start_time
+        
+        return jsonify({
+            'success': True,
+            'processingTime': processing_time,
+            'imagesProcessed': sum(1 for result in results if result['success']),
+            'totalImages': len(images),
+            'results': results
+        })
+        
+    except Exception as e:
+        logger.error(f"Error detecting faces in batch: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/face/match', methods=['POST'])
 def match_faces():
     """Match detected faces against registered persons"""
@@ -298,50 +727,22 @@ def match_faces():
         detection_result = face_service.detect_faces_with_locations(image_data)
         detected_faces = detection_result['faces']
         
+        # Closest encoding of every specified (or registered) person, for all faces at once
+        persons, best_distances = encoding_gallery.nearest([face['encoding'] for face in detected_faces], person_ids)
+        
         matches = []
         
-        # For each detected face, check against registered persons
-        for face in detected_faces:
-            face_encoding = face['encoding']
-            face_matches = []
-            
-            # Check against specified persons or all registered persons
-            if person_ids:
-                keys_to_check = [f"person_encodings:{pid}" for pid in person_ids]
-            else:
-                keys_to_check = redis_client.keys("person_encodings:*")
-            
-            for redis_key in keys_to_check:
-                try:
-                    person_data = redis_client.get(redis_key)
-                    if not person_data:
-                        continue
-                    
-                    person_info = json.loads(person_data)
-                    known_encodings = person_info['encodings']
-                    
-                    # Compare with all encodings for this person
-                    matches_list, distances = face_service.compare_faces(known_encodings, face_encoding)
-                    
-                    # Find best match for this person
-                    if any(matches_list):
-                        best_match_idx = np.argmin(distances)
-                        if matches_list[best_match_idx]:
-                            confidence = 1 - distances[best_match_idx]
-                            if confidence >= confidence_threshold:
-                                face_matches.append({
-                                    'personId': person_info['personId'],
-                                    'personName': person_info['personName'],
-                                    'confidence': float(confidence),
-                                    'distance': float(distances[best_match_idx])
-                                })
-                
-                except Exception as e:
-                    logger.warning(f"Error checking person {redis_key}: {str(e)}")
-                    continue
+        for face, distances in zip(detected_faces, best_distances):
+            # A person matches when their closest encoding is within tolerance and confident enough
+            matched = np.flatnonzero((distances <= face_service.tolerance) & (1 - distances >= confidence_threshold))
             
             # Sort matches by confidence (highest first)
-            face_matches.sort(key=lambda x: x['confidence'], reverse=True)
+            face_matches = [{
+                'personId': persons[index]['personId'],
+                'personName': persons[index]['personName'],
+                'confidence': float(1 - distances[index]),
+                'distance': float(distances[index])
+            } for index in matched[np.argsort(distances[matched], kind='stable')]]
             
             matches.append({
                 'faceId': face['id'],
@@ -371,24 +772,14 @@ def match_faces():
 def list_registered_persons():
     """List all registered persons"""
     try:
-        keys = redis_client.keys("person_encodings:*")
-        persons = []
-        
-        for key in keys:
-            try:
-                person_data = redis_client.get(key)
-                if person_data:
-                    person_info = json.loads(person_data)
-                    persons.append({
-                        'personId': person_info['personId'],
-                        'personName': person_info['personName'],
-                        'facesRegistered': person_info['totalFaces'],
-                        'trainingImages': person_info['trainingImages'],
-                        'registeredAt': person_info['registeredAt']
-                    })
-            except Exception as e:
-                logger.warning(f"Error reading person data from {key}: {str(e)}")
-                continue
+        # Metadata fields only; the encodings are never transferred here
+        persons = [{
+            'personId': person_info['personId'],
+            'personName': person_info['personName'],
+            'facesRegistered': person_info['totalFaces'],
+            'trainingImages': person_info['trainingImages'],
+            'registeredAt': person_info['registeredAt']
+        } for person_info in load_person_records(registered_person_ids(), with_encodings=False)]
         
         return jsonify({
             'success': True,
@@ -407,8 +798,9 @@ def list_registered_persons():
 def delete_person(person_id):
     """Delete a registered person"""
     try:
-        redis_key = f"person_encodings:{person_id}"
-        deleted = redis_client.delete(redis_key)
+        deleted = delete_person_record(person_id)
+        if deleted:
+            encoding_gallery.unregister(person_id)
         
         return jsonify({
             'success': bool(deleted),
@@ -0,0 +1,188 @@
+"""Face detection and encoding for single images and batches.
+
+Kept free of Flask/Redis state so batch work can run in a process pool: the
+dlib calls behind face_locations/face_encodings are CPU-bound and hold the
+GIL, so threads would still encode one image at a time.
+"""
+
+import base64
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+import face_recognition
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+def load_image(image_data: str) -> np.ndarray:
+    """RGB pixel array from an http(s) URL, a data URL or plain base64"""
+    if image_data.startswith('http'):
+        import requests
+        response = requests.get(image_data, timeout=10)
+        response.raise_for_status()
+        image = Image.open(io.BytesIO(response.content))
+    else:
+        # Remove data URL prefix if present
+        if image_data.startswith('data:image'):
+            image_data = image_data.split(',')[1]
+        image = Image.open(io.BytesIO(base64.b64decode(image_data)))
+
+    # Convert to RGB if necessary
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    return np.array(image)
+
+
+def encode_faces(image_array: np.ndarray, model: str = 'hog') -> List[List[float]]:
+    """Encodings of every face in the image"""
+    face_locations = face_recognition.face_locations(image_array, model=model)
+    face_encodings = face_recognition.face_encodings(image_array, face_locations)
+    return [encoding.tolist() for encoding in face_encodings]
+
+
+def detect_faces(image_array: np.ndarray, model: str = 'hog') -> Dict:
+    """Locations, bounding boxes and encodings of every face in the image"""
+    height, width = image_array.shape[:2]
+    face_locations = face_recognition.face_locations(image_array, model=model)
+    face_encodings = face_recognition.face_encodings(image_array, face_locations)
+
+    faces = []
+    for i, (location, encoding) in enumerate(zip(face_locations, face_encodings)):
+        top, right, bottom, left = location
+        faces.append({
+            'id': i,
+            'encoding': encoding.tolist(),
+            'location': {
+                'top': top,
+                'right': right,
+                'bottom': bottom,
+                'left': left
+            },
+            'bounding_box': {
+                'x': left,
+                'y': top,
+                'width': right - left,
+                'height': bottom - top
+            }
+        })
+
+    return {
+        'faces_detected': len(faces),
+        'image_dimensions': {'width': width, 'height': height},
+        'faces': faces
+    }
+
+
+def _encode_job(image_data: str, model: str) -> List[List[float]]:
+    return encode_faces(load_image(image_data), model)
+
+
+def _detect_job(image_data: str, model: str) -> Dict:
+    return detect_faces(load_image(image_data), model)
+
+
+def _wait_for_siblings(started, timeout: float):
+    # Worker initializer: no worker takes a job until the whole pool exists, so
+    # the warm-up jobs in BatchFaceEncoder.start fork every worker at once
+    started.wait(timeout)
+
+
+class BatchFaceEncoder:
+    """Runs detection/encoding for many images on a pool of worker processes
+
+    Every image gets its own result entry ({'index', 'success', ...} with
+    either the payload or an 'error'), so one unreadable image never fails
+    the batch.
+
+    Workers are forked (spawn and forkserver would re-import the Flask app
+    and reload the gallery in every worker), and a fork only copies the
+    calling thread: a lock another thread holds at that moment - the gallery
+    lock, a Redis pool, a BLAS or hnswlib thread pool - stays locked forever
+    in the child. Call `start` at import time, before any of those exist, to
+    fork every worker up front. A pool that replaces one broken by a crashed
+    worker is forked from the request thread; its workers only run the image
+    code in this module, which takes none of the app's locks.
+    """
+
+    def __init__(self, model: str = 'hog', workers: Optional[int] = None):
+        self.model = model
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def start(self, timeout: float = 60.0):
+        """Fork all worker processes now rather than on the first batch"""
+        with self._lock:
+            if self._pool is None:
+                try:
+                    self._pool = self._create_pool(timeout)
+                except Exception as e:
+                    logger.warning(f"Face encoding pool not started, will start on first batch: {str(e)}")
+
+    def encode_images(self, images: List[str]) -> List[Dict]:
+        """Face encodings per image: {'index', 'success', 'encodings'} or {'index', 'success', 'error'}"""
+        return self._run(_encode_job, images, 'encodings')
+
+    def detect_images(self, images: List[str]) -> List[Dict]:
+        """Detection result per image: {'index', 'success', 'result'} or {'index', 'success', 'error'}"""
+        return self._run(_detect_job, images, 'result')
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _run(self, job, images: List[str], payload: str) -> List[Dict]:
+        if not images:
+            return []
+        pool = self._get_pool()
+        futures = [pool.submit(job, image_data, self.model) for image_data in images]
+
+        results = []
+        for index, future in enumerate(futures):
+            try:
+                results.append({'index': index, 'success': True, payload: future.result()})
+            except BrokenProcessPool as e:
+                # A worker died (e.g. dlib crashed on a bad image); start a fresh pool next time
+                self._discard(pool)
+                results.append({'index': index, 'success': False, 'error': f"Worker process failed: {str(e)}"})
+            except Exception as e:
+                results.append({'index': index, 'success': False, 'error': str(e)})
+        return results
+
+    def _discard(self, pool: ProcessPoolExecutor):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._create_pool()
+            return self._pool
+
+    def _create_pool(self, timeout: float = 60.0) -> ProcessPoolExecutor:
+        # Caller holds self._lock
+        context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else multiprocessing.get_context()
+        started = context.Barrier(self.workers)
+        pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                   initializer=_wait_for_siblings, initargs=(started, timeout))
+        # Workers are otherwise forked one at a time as jobs arrive; with every
+        # worker held in the initializer, each warm-up job forks a new one
+        try:
+            pids = {future.result() for future in [pool.submit(os.getpid) for _ in range(self.workers)]}
+        except Exception:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        logger.info(f"Started face encoding pool with {len(pids)} workers")
+        return pool
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test ANN index recall against a brute-force scan of the same encodings
+"""
+
+import numpy as np
+
+from ann_index import HNSWIndex, IVFIndex, encoding_label
+
+
+def face_like_encodings(count: int, persons: int = 500, seed: int = 0) -> np.ndarray:
+    # Encodings cluster per person, like several photos of the same face
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(scale=0.1, size=(persons, 128))
+    rows = centres[rng.integers(0, persons, size=count)] + rng.normal(scale=0.03, size=(count, 128))
+    return rows.astype(np.float32)
+
+
+def brute_force(vectors: np.ndarray, labels: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    distances = np.linalg.norm(queries[:, None, :] - vectors[None, :, :], axis=2)
+    return labels[np.argsort(distances, axis=1)[:, :k]]
+
+
+def recall(index, vectors: np.ndarray, labels: np.ndarray, queries: np.ndarray, k: int = 10) -> float:
+    found, _ = index.search(queries, k)
+    expected = brute_force(vectors, labels, queries, k)
+    return np.mean([len(set(row) & set(truth)) / k for row, truth in zip(found.tolist(), expected.tolist())])
+
+
+def build(index, count: int = 5000):
+    vectors = face_like_encodings(count)
+    labels = np.array([encoding_label(f"person{i}", 0) for i in range(count)], dtype=np.int64)
+    index.add(labels, vectors)
+    queries = vectors[::50] + np.random.default_rng(1).normal(scale=0.01, size=(count // 50, 128)).astype(np.float32)
+    return vectors, labels, queries
+
+
+def test_ivf_recall_matches_brute_force():
+    index = IVFIndex(min_train_size=1000, nprobe=8)
+    vectors, labels, queries = build(index)
+
+    value = recall(index, vectors, labels, queries)
+    assert len(index._centroids) > 1, "The quantizer should have been trained"
+    assert value >= 0.9, f"IVF recall@10 {value:.3f}"
+    print(f"✅ IVF recall@10 {value:.3f} over {len(index._centroids)} lists")
+
+
+def test_hnsw_recall_matches_brute_force():
+    index = HNSWIndex()
+    vectors, labels, queries = build(index)
+
+    value = recall(index, vectors, labels, queries)
+    assert value >= 0.95, f"HNSW recall@10 {value:.3f}"
+    print(f"✅ HNSW recall@10 {value:.3f}")
+
+
+def test_removed_labels_are_never_returned():
+    for index in (IVFIndex(min_train_size=1000), HNSWIndex()):
+        vectors, labels, queries = build(index)
+        removed = labels[::2]
+        index.remove(removed.tolist())
+
+        found, _ = index.search(queries, 10)
+        assert not set(found.ravel().tolist()) & set(removed.tolist()), f"{index.kind} returned a removed label"
+        assert recall(index, vectors[1::2], labels[1::2], queries, k=1) >= 0.95
+        assert len(index) == len(labels) - len(removed)
+    print("✅ Removed labels dropped from IVF and HNSW results")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing ANN index recall...")
+    print("=" * 60)
+    test_ivf_recall_matches_brute_force()
+    test_hnsw_recall_matches_brute_force()
+    test_removed_labels_are_never_returned()
+    print("=" * 60)
+    print("🎉 All ANN index tests passed")
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Test the face service routes and encoding gallery against an in-memory Redis
+
+face_recognition is replaced by a stub that reads faces from the test images
+themselves: every non-black pixel of the top row is one face, and its red
+value picks the face's encoding from ENCODINGS. The stub is installed before
+the app is imported, so the forked encoding workers share it.
+
+Needs the dev requirements: pip install -r requirements-dev.txt
+"""
+
+import base64
+import io
+import json
+import os
+import sys
+import tempfile
+import types
+
+import numpy as np
+import pytest
+import redis
+from PIL import Image
+
+fakeredis = pytest.importorskip("fakeredis")
+
+rng = np.random.default_rng(7)
+PERSON_FACES = {'ann': [1, 2], 'bob': [3], 'cat': [4, 5], 'dan': [6]}
+CENTRES = {person: rng.normal(scale=0.1, size=128) for person in PERSON_FACES}
+ENCODINGS = {}
+for person, faces in PERSON_FACES.items():
+    for face in faces:
+        ENCODINGS[face] = CENTRES[person] + rng.normal(scale=0.02, size=128)
+# Query faces: close to ann, near the tolerance of bob, nobody, halfway between cat and dan
+ENCODINGS[20] = CENTRES['ann'] + rng.normal(scale=0.01, size=128)
+ENCODINGS[21] = CENTRES['bob'] + rng.normal(scale=0.045, size=128)
+ENCODINGS[22] = rng.normal(scale=0.1, size=128)
+ENCODINGS[23] = (CENTRES['cat'] + CENTRES['dan']) / 2
+# Replacement training faces
+ENCODINGS[30] = rng.normal(scale=0.1, size=128)
+ENCODINGS[31] = rng.normal(scale=0.1, size=128)
+
+
+def _face_locations(image, model='hog'):
+    return [(0, column + 1, 1, column) for column in range(image.shape[1]) if image[0, column].any()]
+
+
+def _face_encodings(image, locations):
+    return [np.array(ENCODINGS[int(image[0, left, 0])]) for _, _, _, left in locations]
+
+
+face_recognition_stub = types.ModuleType('face_recognition')
+face_recognition_stub.face_locations = _face_locations
+face_recognition_stub.face_encodings = _face_encodings
+sys.modules['face_recognition'] = face_recognition_stub
+try:
+    import cv2  # noqa: F401 - imported by the app, unused by these routes
+except ImportError:
+    sys.modules['cv2'] = types.ModuleType('cv2')
+
+REDIS_SERVER = fakeredis.FakeServer()
+
+
+class FakeRedis(fakeredis.FakeRedis):
+    def __init__(self, host=None, port=None, db=0, **kwargs):
+        super().__init__(server=REDIS_SERVER, **kwargs)
+
+
+redis.Redis = FakeRedis
+os.environ['FACE_ENCODING_WORKERS'] = '2'
+os.environ['FACE_ANN_SNAPSHOT_PATH'] = os.path.join(tempfile.mkdtemp(), 'face_index')
+
+import app as service  # noqa: E402 - needs the stubs above
+from app import EncodingGallery  # noqa: E402
+
+client = service.app.test_client()
+
+
+def image(*faces: int) -> str:
+    """Base64 PNG holding the given faces (0 leaves a column without a face)"""
+    picture = Image.new('RGB', (max(len(faces), 1), 1))
+    for column, face in enumerate(faces):
+        picture.putpixel((column, 0), (face, 0, 0))
+    buffer = io.BytesIO()
+    picture.save(buffer, 'PNG')
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def fresh_registry():
+    service.redis_client.flushall()
+    service.encoding_gallery.reload()
+    service.encoding_gallery.wait_for_index()
+    for person, faces in PERSON_FACES.items():
+        response = client.post('/api/face/register', json={
+            'personId': person, 'personName': person.title(), 'trainingImages': [image(face) for face in faces]
+        })
+        assert response.status_code == 200, response.json
+
+
+def compare_faces_matches(face: int, person_ids=None, threshold: float = 0.6):
+    """What the original per-person compare_faces loop returned for one face"""
+    matches = []
+    for person_id in person_ids or service.registered_person_ids():
+        record = service.load_person_record(f"person_encodings:{person_id}")
+        if record is None:
+            continue
+        distances = np.linalg.norm(record['encodings'] - np.array(ENCODINGS[face]), axis=1)
+        best = int(np.argmin(distances))
+        if distances[best] <= 0.6 and 1 - distances[best] >= threshold:
+            matches.append((person_id, float(distances[best])))
+    return sorted(matches, key=lambda match: match[1])
+
+
+def matched(response, face_index: int):
+    return [(match['personId'], match['distance']) for match in response.json['matches'][face_index]['matches']]
+
+
+def assert_same_matches(actual, expected):
+    assert [person for person, _ in actual] == [person for person, _ in expected], (actual, expected)
+    assert np.allclose([distance for _, distance in actual], [distance for _, distance in expected], atol=1e-5)
+
+
+def test_match_agrees_with_compare_faces():
+    fresh_registry()
+    queries = [20, 21, 22, 23]
+
+    for person_ids, threshold in ((None, 0.6), (None, 0.3), (['bob', 'dan', 'nobody'], 0.3)):
+        payload = {'image': image(*queries), 'confidenceThreshold': threshold}
+        if person_ids:
+            payload['personIds'] = person_ids
+        response = client.post('/api/face/match', json=payload)
+
+        assert response.json['facesDetected'] == len(queries)
+        for face_index, face in enumerate(queries):
+            assert_same_matches(matched(response, face_index), compare_faces_matches(face, person_ids, threshold))
+
+    response = client.post('/api/face/match', json={'image': image(20), 'confidenceThreshold': 0.3})
+    assert matched(response, 0)[0][0] == 'ann'
+    print("✅ Matches, distances and order agree with compare_faces, with and without personIds")
+
+
+def test_register_replace_and_delete_keep_the_gallery_in_sync():
+    fresh_registry()
+    gallery = EncodingGallery(service.redis_client, index_kind='ivf', ann_min_size=0)
+    gallery.reload()
+    gallery.wait_for_index()
+
+    def assert_in_sync():
+        records = {record['personId']: record for record in service.load_person_records(service.registered_person_ids())}
+        size = gallery._size
+        rows, labels = gallery._matrix[:size], gallery._row_labels[:size]
+        persons = [gallery._persons[slot]['personId'] for slot in gallery._row_slots[:size]]
+        assert sorted(set(persons)) == sorted(records) == sorted(gallery._slots)
+        for person_id, record in records.items():
+            assert np.array_equal(rows[[p == person_id for p in persons]], record['encodings'])
+        assert {label: persons[row] for row, label in enumerate(labels.tolist())} == \
+            {label: gallery._persons[slot]['personId'] for label, slot in gallery._label_slots.items()}
+        # Every row is in the index under its own label, and nothing else is
+        assert len(gallery.index) == size
+        found, distances = gallery.index.search(rows, 1)
+        assert found[:, 0].tolist() == labels.tolist() and np.allclose(distances[:, 0], 0, atol=1e-3)
+
+    assert_in_sync()
+    client.post('/api/face/register', json={'personId': 'eve', 'personName': 'Eve', 'trainingImages': [image(30)]})
+    gallery.register('eve', 'Eve', [ENCODINGS[30]])
+    assert_in_sync()
+    client.post('/api/face/register', json={'personId': 'ann', 'personName': 'Ann', 'trainingImages': [image(31)]})
+    gallery.register('ann', 'Ann', [ENCODINGS[31]])
+    assert_in_sync()
+    client.delete('/api/face/persons/cat')
+    gallery.unregister('cat')
+    assert_in_sync()
+
+    # Changes made by another worker are picked up on the next match
+    client.delete('/api/face/persons/bob')
+    gallery.nearest([ENCODINGS[20]])
+    assert_in_sync()
+    assert 'bob' not in gallery._slots
+    persons, distances = gallery.nearest([ENCODINGS[31]])
+    assert persons[int(np.argmin(distances[0]))]['personId'] == 'ann'
+    print("✅ Matrix, labels and index follow register, replace, delete and remote changes")
+
+
+def test_legacy_json_record_is_migrated():
+    fresh_registry()
+    legacy = {
+        'personId': 'old', 'personName': 'Old Timer', 'encodings': [ENCODINGS[30].tolist()],
+        'trainingImages': 1, 'processedImages': 1, 'totalFaces': 1, 'registeredAt': 1700000000.5
+    }
+    service.redis_client.set('person_encodings:old', json.dumps(legacy))
+    service.redis_client.sadd(service.PERSON_REGISTRY_KEY, 'old')
+    service.encoding_gallery.reload()
+
+    record = service.load_person_record('person_encodings:old')
+    assert service.redis_client.type('person_encodings:old') == 'hash'
+    assert record['personName'] == 'Old Timer' and record['registeredAt'] == 1700000000.5
+    assert np.allclose(record['encodings'], [ENCODINGS[30]], atol=1e-6)
+    response = client.post('/api/face/match', json={'image': image(30), 'personIds': ['old']})
+    assert matched(response, 0)[0][0] == 'old'
+    print("✅ Legacy JSON record converted to the hash layout and matched")
+
+
+def test_registry_backfill_and_dangling_ids():
+    fresh_registry()
+    # A record written before the registry existed, and an ID whose record is gone
+    service.redis_client.delete(service.PERSON_REGISTRY_BUILT_KEY)
+    service.redis_client.srem(service.PERSON_REGISTRY_KEY, 'dan')
+    service.redis_client.sadd(service.PERSON_REGISTRY_KEY, 'ghost')
+
+    persons = client.get('/api/face/persons').json['persons']
+
+    assert sorted(person['personId'] for person in persons) == ['ann', 'bob', 'cat', 'dan']
+    assert service.redis_client.smembers(service.PERSON_REGISTRY_KEY) == {'ann', 'bob', 'cat', 'dan'}
+    assert service.redis_client.exists(service.PERSON_REGISTRY_BUILT_KEY)
+    print("✅ Registry backfilled from existing records, dangling ID pruned")
+
+
+def test_batch_reports_each_image():
+    fresh_registry()
+
+    response = client.post('/api/face/detect/batch', json={'images': [image(20, 21), 'not an image', image(0)]})
+    results = response.json['results']
+    assert [result['success'] for result in results] == [True, False, True]
+    assert results[0]['result']['faces_detected'] == 2 and results[2]['result']['faces_detected'] == 0
+    assert results[1]['error'] and response.json['imagesProcessed'] == 2
+
+    response = client.post('/api/face/register', json={
+        'personId': 'eve', 'personName': 'Eve', 'trainingImages': [image(30), 'not an image', image(31)]
+    })
+    assert response.json['success'] and response.json['facesRegistered'] == 2
+    assert [failure['index'] for failure in response.json['failedImages']] == [1]
+    print("✅ One unreadable image reported on its own, the rest processed")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing face service...")
+    print("=" * 60)
+    test_match_agrees_with_compare_faces()
+    test_register_replace_and_delete_keep_the_gallery_in_sync()
+    test_legacy_json_record_is_migrated()
+    test_registry_backfill_and_dangling_ids()
+    test_batch_reports_each_image()
+    print("=" * 60)
+    print("🎉 All face service tests passed")
@@ -5,12 +5,23 @@ Provides deep competitor analysis, market positioning insights, and strategic op
 
 import json
 import logging
+import os
+import sys
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import re
 from enum import Enum
 
+# Add tools directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from content_corpus import ContentCorpus
+from pattern_matcher import PatternMatcher
+
 logger = logging.getLogger(__name__)
 
 class CompetitorTier(Enum):
@@ -116,13 +127,13 @@ class CompetitiveIntelligenceAgent:
         ]
         
         # Competitive analysis frameworks
-        self.analysis_frameworks = {
-            "porters_five_forces": self._analyze_porters_five_forces,
-            "competitive_positioning": self._analyze_competitive_positioning,
-            "value_chain_analysis": self._analyze_value_chain,
-            "competitor_response_prediction": self._predict_competitor_responses,
-            "market_disruption_assessment": self._assess_disruption_potential
-        }
+        self.analysis_frameworks = [
+            "porters_five_forces",
+            "competitive_positioning",
+            "value_chain_analysis",
+            "competitor_response_prediction",
+            "market_disruption_assessment"
+        ]
         
         # Strategic pattern recognition
         self.competitive_patterns = {
@@ -143,6 +154,14 @@ class CompetitiveIntelligenceAgent:
                 "customer behavior shift", "new market entrant", "value chain reconfiguration"
             ]
         }
+        
+        # Market signal vocabulary, matched in a single scan
+        self.market_signal_patterns = {
+            "growth_indicators": ["growth", "expansion", "increasing", "rising", "surge"],
+            "consolidation_signals": ["merger", "acquisition", "consolidation", "partnership"],
+            "innovation_trends": ["innovation", "breakthrough", "new technology", "AI", "automation"]
+        }
+        self.market_signal_matcher = PatternMatcher(self.market_signal_patterns)
 
     def ultra_analyze_competitive_landscape(
         self, 
@@ -164,6 +183,9 @@ class CompetitiveIntelligenceAgent:
         logger.info(f"{self.agent_name}: Starting ultra-competitive analysis for topics: {topics}")
         
         try:
+            # Every phase reads the same pre-normalized corpus
+            content = ContentCorpus.of(content, topics)
+            
             # Phase 1: Market Landscape Analysis
             market_landscape = self._analyze_market_landscape(content, topics, industry_context)
             
@@ -472,27 +494,21 @@ class CompetitiveIntelligenceAgent:
             "customer_behavior_shifts": []
         }
         
-        content_text = self._extract_text_from_content(content)
+        content_text = ContentCorpus.of(content, topics).text
         
         # Pattern matching for different signal types
-        growth_patterns = ["growth", "expansion", "increasing", "rising", "surge"]
-        consolidation_patterns = ["merger", "acquisition", "consolidation", "partnership"]
-        innovation_patterns = ["innovation", "breakthrough", "new technology", "AI", "automation"]
-        
-        for pattern_type, patterns in [
-            ("growth_indicators", growth_patterns),
-            ("consolidation_signals", consolidation_patterns),
-            ("innovation_trends", innovation_patterns)
-        ]:
+        found = self.market_signal_matcher.matched(content_text)
+        
+        for pattern_type, patterns in self.market_signal_patterns.items():
             for pattern in patterns:
-                if pattern.lower() in content_text.lower():
+                if pattern in found:
                     signals[pattern_type].append(f"Detected {pattern} signals in market content")
         
         return signals
 
     def _extract_competitor_mentions(self, content: Dict[str, Any], topics: List[str]) -> List[str]:
         """Extract competitor mentions from content"""
-        content_text = self._extract_text_from_content(content)
+        content_text = ContentCorpus.of(content, topics).text
         
         # Common company/competitor name patterns
         competitor_patterns = [
@@ -512,23 +528,6 @@ class CompetitiveIntelligenceAgent:
         
         return list(competitors)[:20]  # Limit to top 20
 
-    def _extract_text_from_content(self, content: Dict[str, Any]) -> str:
-        """Extract text content for analysis"""
-        text_parts = []
-        
-        if isinstance(content, dict):
-            for key, value in content.items():
-                if isinstance(value, str):
-                    text_parts.append(value)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, str):
-                            text_parts.append(item)
-                        elif isinstance(item, dict) and 'content' in item:
-                            text_parts.append(str(item['content']))
-        
-        return " ".join(text_parts)
-
     def _calculate_intelligence_confidence(
         self,
         market_landscape: CompetitiveLandscape,
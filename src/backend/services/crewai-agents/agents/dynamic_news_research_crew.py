@@ -4,7 +4,6 @@ Configurable agents for comprehensive news monitoring with URL validation and ta
 """
 
 import os
-import requests
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import json
@@ -90,24 +89,38 @@ except ImportError as e:
     def list_available_crewai_tools():
         return []
 
+from http_client import get_http_client
+from hn_client import get_hn_client
+from url_validation import get_url_validator
+from feed_cache import get_feed_cache
+from topic_index import TopicIndex
+from near_duplicates import get_near_duplicate_detector
+
 class URLValidator:
     """Advanced URL validation and cleaning"""
     
     @staticmethod
     def is_valid_url(url: str) -> bool:
-        """Check if URL is valid and accessible"""
+        """Check if URL is valid and accessible (verdicts are cached)"""
         try:
-            parsed = urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
-                return False
-            
-            # Check if URL is accessible
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            return response.status_code < 400
-            
+            return get_url_validator().is_valid(url)
         except Exception:
             return False
     
+    @staticmethod
+    def validate_urls(urls: List[str]) -> Dict[str, bool]:
+        """Check many URLs concurrently - returns {url: is_valid} for every input URL"""
+        try:
+            return get_url_validator().validate_many(urls)
+        except Exception as e:
+            logger.error(f"Batch URL validation failed: {str(e)}")
+            return {url: False for url in urls}
+    
+    @staticmethod
+    def known_reachable(url: str) -> bool:
+        """Cached verdict only - never touches the network (False if the URL was never checked)"""
+        return get_url_validator().cached_verdict(url) is True
+    
     @staticmethod
     def clean_url(url: str) -> str:
         """Clean and normalize URL"""
@@ -141,10 +154,11 @@ class URLValidator:
     def validate_and_clean_urls(urls: List[str]) -> List[str]:
         """Validate and clean a list of URLs"""
         valid_urls = []
+        cleaned_urls = [URLValidator.clean_url(url) for url in urls]
+        verdicts = URLValidator.validate_urls([url for url in cleaned_urls if url])
         
-        for url in urls:
-            cleaned_url = URLValidator.clean_url(url)
-            if cleaned_url and URLValidator.is_valid_url(cleaned_url):
+        for url, cleaned_url in zip(urls, cleaned_urls):
+            if cleaned_url and verdicts.get(cleaned_url):
                 valid_urls.append(cleaned_url)
             else:
                 logger.warning(f"Invalid or inaccessible URL: {url}")
@@ -174,7 +188,13 @@ class ContentValidator:
         return True
     
     @staticmethod
-    def extract_key_information(content: Dict[str, Any]) -> Dict[str, Any]:
+    def build_reachability_map(articles: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Validate every article URL in one concurrent pass, for use by the scorer"""
+        return URLValidator.validate_urls([article['url'] for article in articles if article.get('url')])
+    
+    @staticmethod
+    def extract_key_information(content: Dict[str, Any],
+                                reachability: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """Extract and structure key information from content"""
         return {
             'title': content.get('title', '').strip(),
@@ -184,12 +204,17 @@ class ContentValidator:
             'published_date': content.get('published_date', datetime.now().isoformat()),
             'author': content.get('author', 'Unknown'),
             'tags': content.get('tags', []),
-            'quality_score': ContentValidator.calculate_quality_score(content)
+            'quality_score': ContentValidator.calculate_quality_score(content, reachability)
         }
     
     @staticmethod
-    def calculate_quality_score(content: Dict[str, Any]) -> float:
-        """Calculate content quality score (0-1)"""
+    def calculate_quality_score(content: Dict[str, Any],
+                                reachability: Optional[Dict[str, bool]] = None) -> float:
+        """Calculate content quality score (0-1)
+        
+        Pure CPU: URL reachability comes from `reachability` (see build_reachability_map)
+        or, for URLs it does not cover, from the cached validation verdicts.
+        """
         score = 0.5  # Base score
         
         title = content.get('title', '')
@@ -211,8 +236,13 @@ class ContentValidator:
         if content.get('author') and content.get('author') != 'Unknown':
             score += 0.1
         
-        # Has valid URL
-        if URLValidator.is_valid_url(content.get('url', '')):
+        # Has reachable URL - looked up, never fetched here
+        url = content.get('url', '')
+        reachable = reachability.get(url) if reachability is not None else None
+        if reachable is None:
+            # Not in the map (or no map): fall back to the cached verdicts
+            reachable = URLValidator.known_reachable(url)
+        if reachable:
             score += 0.1
         
         return min(score, 1.0)
@@ -377,8 +407,7 @@ class EnhancedNewsScraperAgent:
     """Enhanced news scraper with dynamic topic-based source selection"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = get_http_client().session(headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
@@ -585,21 +614,12 @@ class EnhancedNewsScraperAgent:
         articles = []
         
         try:
-            # Get top stories
-            response = self.session.get(self.news_sources['hackernews']['api_url'], timeout=10)
-            response.raise_for_status()
-            
-            top_stories = response.json()[:50]  # Get top 50 stories
-            
-            for story_id in top_stories[:20]:  # Process first 20
+            # Top 20 stories, hydrated concurrently through the shared item cache
+            hn = get_hn_client()
+            for item_data in hn.get_items(hn.top_story_ids(20)):
+                story_id = item_data.get('id')
                 try:
-                    item_url = self.news_sources['hackernews']['item_url'].format(story_id)
-                    item_response = self.session.get(item_url, timeout=5)
-                    item_response.raise_for_status()
-                    
-                    item_data = item_response.json()
-                    
-                    if item_data and item_data.get('type') == 'story':
+                    if item_data.get('type') == 'story':
                         # Validate URL if present
                         url = item_data.get('url', f'https://news.ycombinator.com/item?id={story_id}')
                         cleaned_url = URLValidator.clean_url(url)
@@ -822,7 +842,7 @@ class EnhancedNewsScraperAgent:
         articles = []
         
         try:
-            feed = feedparser.parse(feed_url)
+            feed = get_feed_cache().fetch(feed_url)
             
             # Sort entries by published date (most recent first)
             sorted_entries = sorted(
@@ -917,12 +937,15 @@ class EnhancedNewsScraperAgent:
         """Validate articles for quality and accessibility"""
         validated_articles = []
         
+        # One concurrent validation pass up front keeps scoring free of network I/O
+        reachability = ContentValidator.build_reachability_map(articles)
+        
         for article in articles:
             try:
                 # Check content quality
                 if ContentValidator.is_quality_content(article):
                     # Extract and structure key information
-                    validated_article = ContentValidator.extract_key_information(article)
+                    validated_article = ContentValidator.extract_key_information(article, reachability)
                     validated_articles.append(validated_article)
                 else:
                     logger.debug(f"Article failed quality check: {article.get('title', 'Unknown')}")
@@ -1176,6 +1199,9 @@ class DynamicNewsResearchCrew:
             all_articles.extend(telegram_messages)
             logger.info(f"✅ Found {len(telegram_messages)} Telegram messages")
         
+        # Collapse syndicated copies of one story across sources before matching and analysis
+        all_articles = get_near_duplicate_detector().collapse(all_articles)
+        
         # Add topic matching to all articles based on content analysis
         articles = self._match_articles_to_topics(all_articles, topics)
         
@@ -1254,37 +1280,56 @@ class DynamicNewsResearchCrew:
     
     def _match_articles_to_topics(self, articles: List[Dict[str, Any]], topics: List[str]) -> List[Dict[str, Any]]:
         """Match articles to requested topics based on content analysis"""
-        for article in articles:
-            title = (article.get('title', '') + ' ' + article.get('content', '')).lower()
-            best_topic = 'general'
-            max_score = 0
+        # Tokenize every title and body once; each topic score is then an index lookup
+        index = TopicIndex()
+        for position, article in enumerate(articles):
+            index.add((position, 'title'), article.get('title', ''))
+            index.add((position, 'content'), article.get('content', ''))
+        
+        def occurrences(phrase: str) -> Dict[int, int]:
+            # Occurrences per article across title and content
+            counts = {}
+            for (position, _), count in index.postings(phrase).items():
+                counts[position] = counts.get(position, 0) + count
+            return counts
+        
+        # Extra terms that count towards compound topics
+        related_terms = {
+            'vibe coding': ['vibe', 'coding', 'collaborative'],
+            'ai': ['artificial intelligence', 'machine learning', 'ai'],
+            'n8n': ['workflow', 'automation', 'n8n'],
+            'tech': ['technology', 'software', 'development']
+        }
+        
+        best_matches = {}  # article position -> (score, topic)
+        for topic in topics:
+            # Simple keyword matching - count occurrences
+            scores = occurrences(topic)
             
-            for topic in topics:
-                topic_lower = topic.lower()
-                # Simple keyword matching - count occurrences
-                score = title.count(topic_lower)
-                
-                # Add bonus for exact matches in title
-                if topic_lower in article.get('title', '').lower():
-                    score += 2
-                
-                # Special handling for compound topics
-                if topic_lower == 'vibe coding':
-                    score += title.count('vibe') + title.count('coding') + title.count('collaborative')
-                elif topic_lower == 'ai':
-                    score += title.count('artificial intelligence') + title.count('machine learning') + title.count('ai ')
-                elif topic_lower == 'n8n':
-                    score += title.count('workflow') + title.count('automation') + title.count('n8n')
-                elif topic_lower == 'tech':
-                    score += title.count('technology') + title.count('software') + title.count('development')
-                
-                if score > max_score:
-                    max_score = score
-                    best_topic = topic
+            # Add bonus for exact matches in title
+            for position, field in index.keys_for(topic):
+                if field == 'title':
+                    scores[position] += 2
+            
+            # Special handling for compound topics
+            for term in related_terms.get(topic.lower(), []):
+                for position, count in occurrences(term).items():
+                    scores[position] = scores.get(position, 0) + count
+            
+            for position, score in scores.items():
+                if score > best_matches.get(position, (0, None))[0]:
+                    best_matches[position] = (score, topic)
+        
+        tech_positions = set()
+        for tech_word in ['ai', 'tech', 'software', 'app', 'digital', 'data', 'algorithm']:
+            tech_positions.update(occurrences(tech_word))
+        
+        for position, article in enumerate(articles):
+            max_score, best_topic = best_matches.get(position, (0, 'general'))
             
             # If no good match found, try to infer from source or content
             if max_score == 0:
-                if any(tech_word in title for tech_word in ['ai', 'tech', 'software', 'app', 'digital', 'data', 'algorithm']):
+                if position in tech_positions:
                     best_topic = 'tech'
                 else:
                     best_topic = topics[0] if topics else 'general'
@@ -1551,6 +1596,7 @@ class DynamicNewsResearchCrew:
         
         # Calculate quality metrics
         quality_scores = [article.get('quality_score', 0) for article in articles]
+        url_verdicts = URLValidator.validate_urls([a['url'] for a in articles if a.get('url')])
         avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
         
         # Analyze sources
@@ -1575,7 +1621,7 @@ class DynamicNewsResearchCrew:
             'topic_distribution': topic_distribution,
             'url_validation_stats': {
                 'total_urls_processed': len(articles),
-                'valid_urls': len([a for a in articles if a.get('url') and URLValidator.is_valid_url(a.get('url'))]),
+                'valid_urls': len([a for a in articles if url_verdicts.get(a.get('url'))]),
                 'cleaned_urls': len([a for a in articles if a.get('url')])
             },
             'content_insights': {
@@ -1606,7 +1652,8 @@ class DynamicNewsResearchCrew:
             recommendations.append("Consider adding more news sources for better coverage diversity")
         
         # URL validation recommendations
-        invalid_urls = len([a for a in articles if a.get('url') and not URLValidator.is_valid_url(a.get('url'))])
+        url_verdicts = URLValidator.validate_urls([a['url'] for a in articles if a.get('url')])
+        invalid_urls = len([a for a in articles if a.get('url') and not url_verdicts.get(a['url'])])
         if invalid_urls > 0:
             recommendations.append(f"Found {invalid_urls} articles with invalid URLs - consider improving source reliability")
         
@@ -4,7 +4,6 @@ Specialized agents for comprehensive news monitoring with URL validation and tas
 """
 
 import os
-import requests
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import json
@@ -49,6 +48,14 @@ except ImportError as e:
     logger.error(f"❌ Failed to import custom tools: {str(e)}")
     CUSTOM_TOOLS_AVAILABLE = False
 
+from fetch_engine import FanOutFetchEngine, FetchJob
+from http_client import get_http_client
+from hn_client import get_hn_client
+from url_validation import get_url_validator
+from feed_cache import get_feed_cache
+from topic_index import TopicIndex
+from near_duplicates import get_near_duplicate_detector
+
 # Import social media scrapers with absolute imports
 try:
     from .reddit_agent import RedditScraperTool
@@ -94,19 +101,26 @@ class URLValidator:
     
     @staticmethod
     def is_valid_url(url: str) -> bool:
-        """Check if URL is valid and accessible"""
+        """Check if URL is valid and accessible (verdicts are cached)"""
         try:
-            parsed = urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
-                return False
-            
-            # Check if URL is accessible
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            return response.status_code < 400
-            
+            return get_url_validator().is_valid(url)
         except Exception:
             return False
     
+    @staticmethod
+    def validate_urls(urls: List[str]) -> Dict[str, bool]:
+        """Check many URLs concurrently - returns {url: is_valid} for every input URL"""
+        try:
+            return get_url_validator().validate_many(urls)
+        except Exception as e:
+            logger.error(f"Batch URL validation failed: {str(e)}")
+            return {url: False for url in urls}
+    
+    @staticmethod
+    def known_reachable(url: str) -> bool:
+        """Cached verdict only - never touches the network (False if the URL was never checked)"""
+        return get_url_validator().cached_verdict(url) is True
+    
     @staticmethod
     def clean_url(url: str) -> str:
         """Clean and normalize URL"""
@@ -140,10 +154,11 @@ class URLValidator:
     def validate_and_clean_urls(urls: List[str]) -> List[str]:
         """Validate and clean a list of URLs"""
         valid_urls = []
+        cleaned_urls = [URLValidator.clean_url(url) for url in urls]
+        verdicts = URLValidator.validate_urls([url for url in cleaned_urls if url])
         
-        for url in urls:
-            cleaned_url = URLValidator.clean_url(url)
-            if cleaned_url and URLValidator.is_valid_url(cleaned_url):
+        for url, cleaned_url in zip(urls, cleaned_urls):
+            if cleaned_url and verdicts.get(cleaned_url):
                 valid_urls.append(cleaned_url)
             else:
                 logger.warning(f"Invalid or inaccessible URL: {url}")
@@ -174,7 +189,12 @@ class ContentValidator:
         
         return True
     
-    def extract_key_information(self, content: Dict[str, Any]) -> Dict[str, Any]:
+    def build_reachability_map(self, articles: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Validate every article URL in one concurrent pass, for use by the scorer"""
+        return self.url_validator.validate_urls([article['url'] for article in articles if article.get('url')])
+    
+    def extract_key_information(self, content: Dict[str, Any],
+                                reachability: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """Extract and structure key information from content"""
         return {
             'title': content.get('title', '').strip(),
@@ -184,11 +204,16 @@ class ContentValidator:
             'published_date': content.get('published_date', datetime.now().isoformat()),
             'author': content.get('author', 'Unknown'),
             'tags': content.get('tags', []),
-            'quality_score': self.calculate_quality_score(content)
+            'quality_score': self.calculate_quality_score(content, reachability)
         }
     
-    def calculate_quality_score(self, content: Dict[str, Any]) -> float:
-        """Calculate content quality score (0-1)"""
+    def calculate_quality_score(self, content: Dict[str, Any],
+                                reachability: Optional[Dict[str, bool]] = None) -> float:
+        """Calculate content quality score (0-1)
+        
+        Pure CPU: URL reachability comes from `reachability` (see build_reachability_map)
+        or, for URLs it does not cover, from the cached validation verdicts.
+        """
         score = 0.5  # Base score
         
         title = content.get('title', '')
@@ -210,8 +235,13 @@ class ContentValidator:
         if content.get('author') and content.get('author') != 'Unknown':
             score += 0.1
         
-        # Has valid URL
-        if self.url_validator.is_valid_url(content.get('url', '')):
+        # Has reachable URL - looked up, never fetched here
+        url = content.get('url', '')
+        reachable = reachability.get(url) if reachability is not None else None
+        if reachable is None:
+            # Not in the map (or no map): fall back to the cached verdicts
+            reachable = self.url_validator.known_reachable(url)
+        if reachable:
             score += 0.1
         
         return min(score, 1.0)
@@ -276,8 +306,7 @@ class EnhancedNewsScraperAgent:
     """Enhanced news scraper with URL validation and error handling"""
     
     def __init__(self, url_validator: URLValidator, content_validator: ContentValidator):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = get_http_client().session(headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.url_validator = url_validator
@@ -315,37 +344,48 @@ class EnhancedNewsScraperAgent:
             'reuters_tech': 'https://feeds.reuters.com/reuters/technologyNews',
             'bbc_tech': 'https://feeds.bbci.co.uk/news/technology/rss.xml'
         }
+        
+        # Concurrent fetch settings - the deadline bounds a whole scrape pass
+        self.fetch_engine = FanOutFetchEngine(
+            max_workers=int(os.getenv('NEWS_FETCH_MAX_WORKERS', '8')),
+            per_host_limit=int(os.getenv('NEWS_FETCH_PER_HOST_LIMIT', '2')),
+            deadline_seconds=float(os.getenv('NEWS_FETCH_DEADLINE_SECONDS', '45'))
+        )
     
     def scrape_news_with_validation(self, topics: List[str], max_articles: int = 50) -> List[Dict[str, Any]]:
-        """Scrape news with comprehensive validation"""
+        """Scrape news with comprehensive validation
+        
+        All API sources and RSS feeds are fetched concurrently; sources that miss
+        the fetch deadline are dropped so latency tracks the slowest source that
+        finishes in time rather than the sum of every source.
+        """
         all_articles = []
         
         try:
-            # Scrape from API sources
+            jobs = []
             for source_name, source_config in self.news_sources.items():
-                try:
-                    articles = self._scrape_api_source(source_name, source_config, topics)
-                    validated_articles = self._validate_articles(articles)
-                    all_articles.extend(validated_articles)
-                    
-                    logger.info(f"Scraped {len(validated_articles)} validated articles from {source_name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping {source_name}: {str(e)}")
-                    continue
-            
-            # Scrape from RSS feeds
+                jobs.append(FetchJob(
+                    name=source_name,
+                    url=source_config['api_url'],
+                    func=lambda name=source_name, config=source_config: self._validate_articles(
+                        self._scrape_api_source(name, config, topics))
+                ))
             for feed_name, feed_url in self.rss_feeds.items():
-                try:
-                    articles = self._scrape_rss_feed(feed_name, feed_url, topics)
-                    validated_articles = self._validate_articles(articles)
-                    all_articles.extend(validated_articles)
-                    
-                    logger.info(f"Scraped {len(validated_articles)} validated articles from {feed_name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping RSS feed {feed_name}: {str(e)}")
-                    continue
+                jobs.append(FetchJob(
+                    name=feed_name,
+                    url=feed_url,
+                    func=lambda name=feed_name, url=feed_url: self._validate_articles(
+                        self._scrape_rss_feed(name, url, topics))
+                ))
+            
+            report = self.fetch_engine.run(jobs)
+            
+            for outcome in report.outcomes:
+                if outcome.status == 'ok':
+                    all_articles.extend(outcome.result)
+                    logger.info(f"Scraped {len(outcome.result)} validated articles from {outcome.name} in {outcome.elapsed:.1f}s")
+                else:
+                    logger.error(f"Error scraping {outcome.name}: {outcome.error}")
             
             # Filter by topics and quality
             filtered_articles = self._filter_and_rank_articles(all_articles, topics)
@@ -380,21 +420,12 @@ class EnhancedNewsScraperAgent:
         articles = []
         
         try:
-            # Get top stories
-            response = self.session.get(self.news_sources['hackernews']['api_url'], timeout=10)
-            response.raise_for_status()
-            
-            top_stories = response.json()[:50]  # Get top 50 stories
-            
-            for story_id in top_stories[:20]:  # Process first 20
+            # Top 20 stories, hydrated concurrently through the shared item cache
+            hn = get_hn_client()
+            for item_data in hn.get_items(hn.top_story_ids(20)):
+                story_id = item_data.get('id')
                 try:
-                    item_url = self.news_sources['hackernews']['item_url'].format(story_id)
-                    item_response = self.session.get(item_url, timeout=5)
-                    item_response.raise_for_status()
-                    
-                    item_data = item_response.json()
-                    
-                    if item_data and item_data.get('type') == 'story':
+                    if item_data.get('type') == 'story':
                         # Validate URL if present
                         url = item_data.get('url', f'https://news.ycombinator.com/item?id={story_id}')
                         cleaned_url = self.url_validator.clean_url(url)
@@ -577,7 +608,7 @@ class EnhancedNewsScraperAgent:
         articles = []
         
         try:
-            feed = feedparser.parse(feed_url)
+            feed = get_feed_cache().fetch(feed_url)
             
             for entry in feed.entries[:10]:  # Get top 10 entries
                 try:
@@ -648,12 +679,15 @@ class EnhancedNewsScraperAgent:
         """Validate articles for quality and accessibility"""
         validated_articles = []
         
+        # One concurrent validation pass up front keeps scoring free of network I/O
+        reachability = self.content_validator.build_reachability_map(articles)
+        
         for article in articles:
             try:
                 # Check content quality
                 if self.content_validator.is_quality_content(article):
                     # Extract and structure key information
-                    validated_article = self.content_validator.extract_key_information(article)
+                    validated_article = self.content_validator.extract_key_information(article, reachability)
                     validated_articles.append(validated_article)
                 else:
                     logger.debug(f"Article failed quality check: {article.get('title', 'Unknown')}")
@@ -735,6 +769,18 @@ class EnhancedNewsResearchCrew:
         self.task_delegator = TaskDelegator()
         self.news_scraper = EnhancedNewsScraperAgent(self.url_validator, self.content_validator)
         
+        # Source stages of research_news_with_social_media run concurrently, each under its own deadline
+        default_stage_deadline = os.getenv('SOURCE_STAGE_DEADLINE_SECONDS', '90')
+        self.stage_deadlines = {
+            stage: float(os.getenv(f'{stage.upper()}_STAGE_DEADLINE_SECONDS', default_stage_deadline))
+            for stage in ('reddit', 'telegram', 'linkedin', 'news_websites')
+        }
+        self.stage_engine = FanOutFetchEngine(
+            max_workers=len(self.stage_deadlines),
+            per_host_limit=1,
+            deadline_seconds=max(self.stage_deadlines.values())
+        )
+        
         # Initialize agents
         self.agents = self._create_agents()
         
@@ -1092,195 +1138,90 @@ class EnhancedNewsResearchCrew:
                 'news_articles': []
             }
             
-            # 1. Scrape Reddit if enabled and available
+            # 1-4. Scrape Reddit, Telegram, LinkedIn and news websites as concurrent stages.
+            # Each stage has its own deadline; a stage that misses it is reported as failed and
+            # the report is built from the stages that finished, so latency is max(stages), not sum.
+            stage_steps = {'reddit': 1, 'telegram': 2, 'linkedin': 3, 'news_websites': 4}
+            stage_labels = {'reddit': 'Reddit', 'telegram': 'Telegram', 'linkedin': 'LinkedIn', 'news_websites': 'News'}
+            stage_funcs = {
+                'reddit': self._scrape_reddit_stage,
+                'telegram': self._scrape_telegram_stage,
+                'linkedin': self._scrape_linkedin_stage,
+                'news_websites': self._scrape_news_websites_stage
+            }
+            jobs = []
+            
             if sources.get('reddit', True) and REDDIT_SCRAPER_AVAILABLE:
                 update_progress(1, 'in_progress', 'Connecting to Reddit JSON endpoints...')
-                try:
-                    reddit_scraper = RedditScraperTool()
-                    topics_str = ','.join(topics)
-                    
-                    logger.info(f"🔴 [Reddit] Starting scrape for topics: {topics_str}")
-                    reddit_result = reddit_scraper._run(topics_str)
-                    reddit_data = json.loads(reddit_result)
-                    
-                    logger.info(f"🔴 [Reddit] Raw result: success={reddit_data.get('success')}, posts_found={reddit_data.get('posts_found', 0)}")
-                    
-                    if reddit_data.get('success') and reddit_data.get('posts'):
-                        posts = reddit_data['posts']
-                        # Filter out any obviously simulated posts
-                        real_posts = [p for p in posts if not p.get('simulated', False)]
-                        
-                        organized_content['reddit_posts'] = real_posts
-                        update_progress(1, 'completed', f"Found {len(real_posts)} real Reddit posts")
-                        logger.info(f"✅ Successfully scraped {len(real_posts)} real Reddit posts")
-                        
-                        if len(posts) != len(real_posts):
-                            logger.info(f"🔍 Filtered out {len(posts) - len(real_posts)} simulated posts")
-                    else:
-                        error_msg = reddit_data.get('error', reddit_data.get('message', 'Unknown error'))
-                        update_progress(1, 'completed', f"No Reddit posts found")
-                        logger.warning(f"❌ No Reddit posts found: {error_msg}")
-                        
-                        # Add diagnostic info
-                        if 'rate limit' in error_msg.lower():
-                            logger.info("💡 Reddit rate limited - try again in a few minutes")
-                        elif 'network' in error_msg.lower() or 'connection' in error_msg.lower():
-                            logger.info("💡 Network issues with Reddit - check connectivity")
-                        else:
-                            logger.info("💡 Reddit may be temporarily unavailable or no matching posts found")
-                        
-                except Exception as e:
-                    update_progress(1, 'failed', f"Reddit scraping failed: {str(e)}")
-                    logger.error(f"❌ Reddit scraping exception: {str(e)}")
-                    logger.error(f"📋 Exception type: {type(e).__name__}")
+                jobs.append('reddit')
+            elif not REDDIT_SCRAPER_AVAILABLE:
+                update_progress(1, 'skipped', 'Reddit scraper not available (missing dependencies)')
+                logger.warning("⚠️ Reddit scraper not available - check dependencies")
             else:
-                if not REDDIT_SCRAPER_AVAILABLE:
-                    update_progress(1, 'skipped', 'Reddit scraper not available (missing dependencies)')
-                    logger.warning("⚠️ Reddit scraper not available - check dependencies")
-                else:
-                    update_progress(1, 'skipped', 'Reddit disabled in sources')
-                    logger.info("📭 Reddit scraping disabled by user")
+                update_progress(1, 'skipped', 'Reddit disabled in sources')
+                logger.info("📭 Reddit scraping disabled by user")
             
-            # 2. Scrape Telegram if enabled and available
             if sources.get('telegram', True) and TELEGRAM_SCRAPER_AVAILABLE:
                 update_progress(2, 'in_progress', 'Connecting to Telegram channels via web scraping...')
-                try:
-                    telegram_scraper = TelegramMonitorTool()
-                    topics_str = ','.join(topics)
-                    
-                    logger.info(f"📱 [Telegram] Starting scrape for topics: {topics_str}")
-                    telegram_result = telegram_scraper._run(topics_str)
-                    telegram_data = json.loads(telegram_result)
-                    
-                    logger.info(f"📱 [Telegram] Raw result: success={telegram_data.get('success')}, messages_found={telegram_data.get('messages_found', 0)}")
-                    
-                    if telegram_data.get('success') and telegram_data.get('messages'):
-                        messages = telegram_data['messages']
-                        # Filter out any obviously simulated messages  
-                        real_messages = [m for m in messages if not m.get('simulated', False)]
-                        
-                        # Enhance Telegram messages with card metadata
-                        enhanced_messages = []
-                        for msg in real_messages:
-                            enhanced_msg = {
-                                **msg,
-                                'card_type': 'telegram',
-                                'display_type': 'telegram_card',
-                                'platform': 'telegram',
-                                'show_full_content': True,
-                                'channel_info': {
-                                    'name': msg.get('channel_name', msg.get('channel', '')),
-                                    'username': msg.get('channel', ''),
-                                    'verified': False  # Could be enhanced with real channel data
-                                },
-                                'message_info': {
-                                    'has_media': msg.get('media_type') not in [None, 'text'],
-                                    'is_forwarded': msg.get('is_forwarded', False),
-                                    'engagement_stats': {
-                                        'views': msg.get('views', 0),
-                                        'forwards': msg.get('forwards', 0),
-                                        'reactions_count': sum(msg.get('reactions', {}).values()) if msg.get('reactions') else 0
-                                    }
-                                }
-                            }
-                            enhanced_messages.append(enhanced_msg)
-                        
-                        organized_content['telegram_messages'] = enhanced_messages
-                        update_progress(2, 'completed', f"Found {len(enhanced_messages)} real Telegram messages")
-                        logger.info(f"✅ Successfully scraped {len(enhanced_messages)} real Telegram messages with rich metadata")
-                        
-                        if len(messages) != len(real_messages):
-                            logger.info(f"🔍 Filtered out {len(messages) - len(real_messages)} simulated messages")
-                        
-                        # Log channel sources
-                        channels = list(set(msg.get('channel', 'Unknown') for msg in enhanced_messages))
-                        logger.info(f"📡 Sources: {', '.join(channels[:5])}")
-                        
-                    else:
-                        error_msg = telegram_data.get('error', 'Unknown error')
-                        limitations = telegram_data.get('limitations', [])
-                        
-                        update_progress(2, 'completed', f"Telegram failed: {error_msg}")
-                        logger.warning(f"Telegram scraping failed: {error_msg}")
-                        
-                        if limitations:
-                            logger.info(f"📋 Telegram limitations: {', '.join(limitations)}")
-                        
-                        # Add diagnostic info
-                        if 'bot api' in error_msg.lower():
-                            logger.info("💡 Using web scraping instead of Bot API for better channel access")
-                        elif 'network' in error_msg.lower():
-                            logger.info("💡 Network issues with Telegram - check connectivity")
-                        else:
-                            logger.info("💡 Telegram channels may be temporarily unavailable")
-                        
-                except Exception as e:
-                    update_progress(2, 'failed', f"Telegram scraping failed: {str(e)}")
-                    logger.error(f"❌ Telegram scraping exception: {str(e)}")
-                    logger.error(f"📋 Exception type: {type(e).__name__}")
+                jobs.append('telegram')
+            elif not TELEGRAM_SCRAPER_AVAILABLE:
+                update_progress(2, 'skipped', 'Telegram scraper not available (missing dependencies)')
+                logger.warning("⚠️ Telegram scraper not available - check dependencies")
             else:
-                if not TELEGRAM_SCRAPER_AVAILABLE:
-                    update_progress(2, 'skipped', 'Telegram scraper not available (missing dependencies)')
-                    logger.warning("⚠️ Telegram scraper not available - check dependencies")
-                else:
-                    update_progress(2, 'skipped', 'Telegram disabled in sources')
-                    logger.info("📭 Telegram scraping disabled by user")
+                update_progress(2, 'skipped', 'Telegram disabled in sources')
+                logger.info("📭 Telegram scraping disabled by user")
             
-            # 3. Scrape real LinkedIn posts
             if sources.get('linkedin', True):
                 update_progress(3, 'in_progress', 'Scraping real LinkedIn professional content...')
                 logger.info(f"💼 [Social Media Monitor] Collecting LinkedIn posts - STARTING")
-                try:
-                    # Scrape professional content (may include news websites as fallback)
-                    professional_content = self._scrape_real_linkedin_posts(topics)
-                    logger.info(f"🔍 Professional content scraper returned {len(professional_content)} posts")
-                    
-                    # Separate actual LinkedIn posts from news website content
-                    actual_linkedin_posts = []
-                    news_website_posts = []
-                    
-                    for post in professional_content:
-                        source_type = post.get('source_type', 'linkedin')
-                        if source_type == 'news_website' or post.get('source', '').startswith('news_'):
-                            news_website_posts.append(post)
-                        else:
-                            actual_linkedin_posts.append(post)
-                    
-                    # Add to appropriate categories
-                    organized_content['linkedin_posts'] = actual_linkedin_posts
-                    if news_website_posts:
-                        # Add news website posts to news_articles instead of LinkedIn
-                        if 'news_articles' not in organized_content:
-                            organized_content['news_articles'] = []
-                        organized_content['news_articles'].extend(news_website_posts)
-                        logger.info(f"📰 Moved {len(news_website_posts)} news website posts from LinkedIn to news_articles")
-                    
-                    update_progress(3, 'completed', f"Found {len(actual_linkedin_posts)} LinkedIn posts + {len(news_website_posts)} news articles")
-                    logger.info(f"✅ Scraped {len(actual_linkedin_posts)} LinkedIn posts + {len(news_website_posts)} news articles")
-                except Exception as e:
-                    update_progress(3, 'failed', f"LinkedIn scraping failed: {str(e)}")
-                    logger.error(f"LinkedIn scraping failed: {str(e)}")
+                jobs.append('linkedin')
             else:
                 update_progress(3, 'skipped', 'LinkedIn disabled')
                 logger.warning(f"💼 [Social Media Monitor] Collecting LinkedIn posts - SKIPPED")
             
-            # 4. Scrape real news websites
             if sources.get('news_websites', True):
                 update_progress(4, 'in_progress', 'Scraping real news websites...')
                 logger.info(f"📰 [News Research Specialist] Scraping news websites - STARTING")
-                try:
-                    news_articles = self._scrape_real_news_websites(topics)
-                    logger.info(f"🔍 News scraper returned {len(news_articles)} articles")
-                    organized_content['news_articles'] = news_articles
-                    update_progress(4, 'completed', f"Scraped {len(news_articles)} real news articles")
-                    logger.info(f"✅ Scraped {len(news_articles)} real news articles")
-                except Exception as e:
-                    update_progress(4, 'failed', f"News scraping failed: {str(e)}")
-                    logger.error(f"News scraping failed: {str(e)}")
+                jobs.append('news_websites')
             else:
                 update_progress(4, 'skipped', 'News websites disabled')
                 logger.warning(f"📰 [News Research Specialist] Scraping news websites - SKIPPED")
             
+            def report_stage(outcome):
+                step, label = stage_steps[outcome.name], stage_labels[outcome.name]
+                if outcome.status == 'ok':
+                    update_progress(step, 'completed', outcome.result[1])
+                elif outcome.status == 'timeout':
+                    update_progress(step, 'failed', f"{label} scraping timed out ({outcome.error}) - continuing with partial results")
+                    logger.warning(f"⏱️ {label} stage dropped after {outcome.elapsed:.1f}s")
+                else:
+                    update_progress(step, 'failed', f"{label} scraping failed: {outcome.error}")
+                    logger.error(f"❌ {label} scraping exception: {outcome.error}")
+            
+            stage_report = self.stage_engine.run([
+                FetchJob(name=stage, url='', func=lambda stage=stage: stage_funcs[stage](topics),
+                         deadline_seconds=self.stage_deadlines[stage])
+                for stage in jobs
+            ], on_outcome=report_stage)
+            
+            # Merge in stage order so the result doesn't depend on which platform finished first
+            for outcome in stage_report.completed:
+                for content_type, items in outcome.result[0].items():
+                    organized_content[content_type].extend(items)
+            source_stages = {
+                outcome.name: {'status': outcome.status, 'elapsed': round(outcome.elapsed, 2), 'error': outcome.error}
+                for outcome in stage_report.outcomes
+            }
+            logger.info(f"📊 Source stages finished in {stage_report.elapsed:.1f}s: "
+                        f"{len(stage_report.completed)}/{len(jobs)} completed")
+            
+            # Collapse syndicated copies across platforms so every later stage sees each story once
+            deduplicated, duplicates_removed = get_near_duplicate_detector().collapse_groups({
+                content_type: organized_content[content_type]
+                for content_type in ('news_articles', 'reddit_posts', 'linkedin_posts', 'telegram_messages')
+            })
+            organized_content.update(deduplicated)
+            
             # 5. Analyze all content quality
             update_progress(5, 'in_progress', 'Analyzing content quality across all sources...')
             try:
@@ -1294,7 +1235,8 @@ class EnhancedNewsResearchCrew:
                     'reddit_items': len(organized_content['reddit_posts']),
                     'linkedin_items': len(organized_content['linkedin_posts']),
                     'telegram_items': len(organized_content['telegram_messages']),
-                    'has_news_analysis': bool(organized_content.get('news_analysis'))
+                    'has_news_analysis': bool(organized_content.get('news_analysis')),
+                    'near_duplicates_removed': duplicates_removed
                 }
                 
                 update_progress(5, 'completed', f"Analyzed {total_items} social media items + news analysis")
@@ -1404,6 +1346,7 @@ class EnhancedNewsResearchCrew:
                     },
                     "progress_steps": progress_steps,
                     "total_steps_completed": len([s for s in progress_steps if s['status'] == 'completed']),
+                    "source_stages": source_stages,
                     "current_date": current_date,
                     "execution_time": datetime.now().isoformat()
                 }
@@ -1429,6 +1372,142 @@ class EnhancedNewsResearchCrew:
                 "failed_at": datetime.now().isoformat()
             }
     
+    def _scrape_reddit_stage(self, topics: List[str]) -> Tuple[Dict[str, List[Dict[str, Any]]], str]:
+        """Reddit stage of research_news_with_social_media - returns (content, progress message)"""
+        reddit_scraper = RedditScraperTool()
+        topics_str = ','.join(topics)
+        
+        logger.info(f"🔴 [Reddit] Starting scrape for topics: {topics_str}")
+        reddit_result = reddit_scraper._run(topics_str)
+        reddit_data = json.loads(reddit_result)
+        
+        logger.info(f"🔴 [Reddit] Raw result: success={reddit_data.get('success')}, posts_found={reddit_data.get('posts_found', 0)}")
+        
+        if reddit_data.get('success') and reddit_data.get('posts'):
+            posts = reddit_data['posts']
+            # Filter out any obviously simulated posts
+            real_posts = [p for p in posts if not p.get('simulated', False)]
+            
+            logger.info(f"✅ Successfully scraped {len(real_posts)} real Reddit posts")
+            if len(posts) != len(real_posts):
+                logger.info(f"🔍 Filtered out {len(posts) - len(real_posts)} simulated posts")
+            return {'reddit_posts': real_posts}, f"Found {len(real_posts)} real Reddit posts"
+        
+        error_msg = reddit_data.get('error', reddit_data.get('message', 'Unknown error'))
+        logger.warning(f"❌ No Reddit posts found: {error_msg}")
+        
+        # Add diagnostic info
+        if 'rate limit' in error_msg.lower():
+            logger.info("💡 Reddit rate limited - try again in a few minutes")
+        elif 'network' in error_msg.lower() or 'connection' in error_msg.lower():
+            logger.info("💡 Network issues with Reddit - check connectivity")
+        else:
+            logger.info("💡 Reddit may be temporarily unavailable or no matching posts found")
+        return {}, "No Reddit posts found"
+    
+    def _scrape_telegram_stage(self, topics: List[str]) -> Tuple[Dict[str, List[Dict[str, Any]]], str]:
+        """Telegram stage of research_news_with_social_media - returns (content, progress message)"""
+        telegram_scraper = TelegramMonitorTool()
+        topics_str = ','.join(topics)
+        
+        logger.info(f"📱 [Telegram] Starting scrape for topics: {topics_str}")
+        telegram_result = telegram_scraper._run(topics_str)
+        telegram_data = json.loads(telegram_result)
+        
+        logger.info(f"📱 [Telegram] Raw result: success={telegram_data.get('success')}, messages_found={telegram_data.get('messages_found', 0)}")
+        
+        if telegram_data.get('success') and telegram_data.get('messages'):
+            messages = telegram_data['messages']
+            # Filter out any obviously simulated messages  
+            real_messages = [m for m in messages if not m.get('simulated', False)]
+            
+            # Enhance Telegram messages with card metadata
+            enhanced_messages = []
+            for msg in real_messages:
+                enhanced_msg = {
+                    **msg,
+                    'card_type': 'telegram',
+                    'display_type': 'telegram_card',
+                    'platform': 'telegram',
+                    'show_full_content': True,
+                    'channel_info': {
+                        'name': msg.get('channel_name', msg.get('channel', '')),
+                        'username': msg.get('channel', ''),
+                        'verified': False  # Could be enhanced with real channel data
+                    },
+                    'message_info': {
+                        'has_media': msg.get('media_type') not in [None, 'text'],
+                        'is_forwarded': msg.get('is_forwarded', False),
+                        'engagement_stats': {
+                            'views': msg.get('views', 0),
+                            'forwards': msg.get('forwards', 0),
+                            'reactions_count': sum(msg.get('reactions', {}).values()) if msg.get('reactions') else 0
+                        }
+                    }
+                }
+                enhanced_messages.append(enhanced_msg)
+            
+            logger.info(f"✅ Successfully scraped {len(enhanced_messages)} real Telegram messages with rich metadata")
+            
+            if len(messages) != len(real_messages):
+                logger.info(f"🔍 Filtered out {len(messages) - len(real_messages)} simulated messages")
+            
+            # Log channel sources
+            channels = list(set(msg.get('channel', 'Unknown') for msg in enhanced_messages))
+            logger.info(f"📡 Sources: {', '.join(channels[:5])}")
+            return {'telegram_messages': enhanced_messages}, f"Found {len(enhanced_messages)} real Telegram messages"
+        
+        error_msg = telegram_data.get('error', 'Unknown error')
+        limitations = telegram_data.get('limitations', [])
+        
+        logger.warning(f"Telegram scraping failed: {error_msg}")
+        
+        if limitations:
+            logger.info(f"📋 Telegram limitations: {', '.join(limitations)}")
+        
+        # Add diagnostic info
+        if 'bot api' in error_msg.lower():
+            logger.info("💡 Using web scraping instead of Bot API for better channel access")
+        elif 'network' in error_msg.lower():
+            logger.info("💡 Network issues with Telegram - check connectivity")
+        else:
+            logger.info("💡 Telegram channels may be temporarily unavailable")
+        return {}, f"Telegram failed: {error_msg}"
+    
+    def _scrape_linkedin_stage(self, topics: List[str]) -> Tuple[Dict[str, List[Dict[str, Any]]], str]:
+        """LinkedIn stage of research_news_with_social_media - returns (content, progress message)"""
+        # Scrape professional content (may include news websites as fallback)
+        professional_content = self._scrape_real_linkedin_posts(topics)
+        logger.info(f"🔍 Professional content scraper returned {len(professional_content)} posts")
+        
+        # Separate actual LinkedIn posts from news website content
+        actual_linkedin_posts = []
+        news_website_posts = []
+        
+        for post in professional_content:
+            source_type = post.get('source_type', 'linkedin')
+            if source_type == 'news_website' or post.get('source', '').startswith('news_'):
+                news_website_posts.append(post)
+            else:
+                actual_linkedin_posts.append(post)
+        
+        if news_website_posts:
+            # News website posts belong with news_articles, not LinkedIn
+            logger.info(f"📰 Moved {len(news_website_posts)} news website posts from LinkedIn to news_articles")
+        
+        logger.info(f"✅ Scraped {len(actual_linkedin_posts)} LinkedIn posts + {len(news_website_posts)} news articles")
+        return (
+            {'linkedin_posts': actual_linkedin_posts, 'news_articles': news_website_posts},
+            f"Found {len(actual_linkedin_posts)} LinkedIn posts + {len(news_website_posts)} news articles"
+        )
+    
+    def _scrape_news_websites_stage(self, topics: List[str]) -> Tuple[Dict[str, List[Dict[str, Any]]], str]:
+        """News website stage of research_news_with_social_media - returns (content, progress message)"""
+        news_articles = self._scrape_real_news_websites(topics)
+        logger.info(f"🔍 News scraper returned {len(news_articles)} articles")
+        logger.info(f"✅ Scraped {len(news_articles)} real news articles")
+        return {'news_articles': news_articles}, f"Scraped {len(news_articles)} real news articles"
+    
     def _scrape_real_linkedin_posts(self, topics: List[str]) -> List[Dict[str, Any]]:
         """Scrape real LinkedIn posts using web scraping with graceful degradation"""
         posts = []
@@ -1485,7 +1564,6 @@ class EnhancedNewsResearchCrew:
         posts = []
         
         try:
-            import requests
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
@@ -1505,43 +1583,41 @@ class EnhancedNewsResearchCrew:
             for source_url in working_sources[:4]:  # Try 4 sources
                 try:
                     logger.info(f"📡 Fetching professional content from: {source_url}")
-                    response = requests.get(source_url, headers=headers, timeout=10)
+                    feed = get_feed_cache().fetch(source_url, headers=headers, timeout=10)
                     
-                    if response.status_code == 200 and FEEDPARSER_AVAILABLE:
-                        feed = feedparser.parse(response.content)
-                        
-                        if feed.entries:
-                            for entry in feed.entries[:3]:  # 3 articles per source
-                                title = entry.get('title', '').lower()
-                                summary = entry.get('summary', '').lower()
-                                
-                                # Check relevance to any topic
-                                is_relevant = any(
-                                    topic.lower() in title or 
-                                    topic.lower() in summary or
-                                    any(kw in title or kw in summary for kw in self._get_topic_keywords(topic))
-                                    for topic in topics
-                                )
-                                
-                                # If no relevant posts yet, include anything professional
-                                if not is_relevant and len(posts) == 0:
-                                    is_relevant = True
-                                
-                                if is_relevant:
-                                    posts.append({
-                                        "id": f"prof_{len(posts)}",
-                                        "title": entry.get('title', ''),
-                                        "content": entry.get('summary', '')[:400] + "...",
-                                        "author": entry.get('author', 'Reporter'),
-                                        "source": self._extract_source_from_url(source_url),
-                                        "url": entry.get('link', ''),
-                                        "published_date": entry.get('published', datetime.now().isoformat()),
-                                        "simulated": False
-                                    })
+                    if feed.entries:
+                        for entry in feed.entries[:3]:  # 3 articles per source
+                            title = entry.get('title', '').lower()
+                            summary = entry.get('summary', '').lower()
+                            
+                            # Check relevance to any topic
+                            is_relevant = any(
+                                topic.lower() in title or 
+                                topic.lower() in summary or
+                                any(kw in title or kw in summary for kw in self._get_topic_keywords(topic))
+                                for topic in topics
+                            )
+                            
+                            # If no relevant posts yet, include anything professional
+                            if not is_relevant and len(posts) == 0:
+                                is_relevant = True
+                            
+                            if is_relevant:
+                                posts.append({
+                                    "id": f"prof_{len(posts)}",
+                                    "title": entry.get('title', ''),
+                                    "content": entry.get('summary', '')[:400] + "...",
+                                    "author": entry.get('author', 'Reporter'),
+                                    "source": self._extract_source_from_url(source_url),
+                                    "url": entry.get('link', ''),
+                                    "published_date": entry.get('published', datetime.now().isoformat()),
+                                    "simulated": False
+                                })
                     
-                    # Add small delay between sources
-                    import time
-                    time.sleep(0.5)
+                    # Add small delay between sources that actually hit the network
+                    if feed.cache_status in ('fetched', 'revalidated'):
+                        import time
+                        time.sleep(0.5)
                     
                 except Exception as e:
                     logger.debug(f"Source {source_url} failed: {e}")
@@ -1559,30 +1635,25 @@ class EnhancedNewsResearchCrew:
         articles = []
         
         try:
-            import requests
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
+            feed_cache = get_feed_cache()
             
             # Dynamic news feeds based on topics
             news_feeds = self._get_relevant_news_feeds(topics)
             
-            # Scrape from RSS feeds
+            # Scrape from RSS feeds (conditional GET - unchanged feeds reuse their parsed entries)
             for feed_url in news_feeds:  # Try all feeds
                 try:
-                    logger.info(f"📡 Fetching RSS feed: {feed_url}")
-                    response = requests.get(feed_url, headers=headers, timeout=15)
-                    logger.info(f"📊 Response status for {feed_url}: {response.status_code}")
-                    logger.info(f"📄 Response content length: {len(response.content)} bytes")
-                    
-                    if response.status_code != 200:
-                        logger.warning(f"⚠️  Non-200 status code for {feed_url}: {response.status_code}")
-                        continue
-                    
                     if FEEDPARSER_AVAILABLE:
-                        logger.info(f"🗜️ Parsing RSS feed with feedparser...")
-                        feed = feedparser.parse(response.content)
-                        logger.info(f"🔍 Feed parsed successfully: {len(feed.entries)} entries found")
+                        logger.info(f"📡 Fetching RSS feed: {feed_url}")
+                        feed = feed_cache.fetch(feed_url, headers=headers, timeout=15)
+                        logger.info(f"🔍 Feed {feed.cache_status} (HTTP {feed.http_status or '-'}): {len(feed.entries)} entries found")
+                        
+                        if feed.error and not feed.entries:
+                            logger.warning(f"⚠️  Failed to fetch {feed_url}: {feed.error}")
+                            continue
                         
                         if not feed.entries:
                             logger.warning(f"⚠️  No entries found in feed: {feed_url}")
@@ -1647,60 +1718,53 @@ class EnhancedNewsResearchCrew:
             # Try Hacker News API for all topics - it often has diverse content
             logger.info(f"📰 Trying Hacker News for topics: {topics}")
             try:
-                hn_response = requests.get('https://hacker-news.firebaseio.com/v0/topstories.json', 
-                                         headers=headers, timeout=10)
-                if hn_response.status_code == 200:
-                    story_ids = hn_response.json()[:20]  # Get top 20 stories
-                    
-                    for story_id in story_ids[:5]:  # Process first 5
-                        try:
-                            story_response = requests.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json',
-                                                        headers=headers, timeout=5)
-                            if story_response.status_code == 200:
-                                story = story_response.json()
+                hn = get_hn_client()
+                # First 5 top stories, hydrated concurrently through the shared item cache
+                for story in hn.get_items(hn.top_story_ids(5)):
+                    story_id = story.get('id')
+                    try:
+                        if story.get('title'):
+                            title = story.get('title', '').lower()
+                            # Relaxed relevance check for Hacker News
+                            is_relevant = True
+                            if topics:
+                                topic_match = False
+                                for topic in topics:
+                                    topic_words = topic.lower().split()
+                                    # Match if any topic word appears in title
+                                    if any(word in title for word in topic_words if len(word) > 2):
+                                        topic_match = True
+                                        break
+                                    # Also check for exact topic match
+                                    if topic.lower() in title:
+                                        topic_match = True
+                                        break
                                 
-                                if story and story.get('title'):
-                                    title = story.get('title', '').lower()
-                                    # Relaxed relevance check for Hacker News
-                                    is_relevant = True
-                                    if topics:
-                                        topic_match = False
-                                        for topic in topics:
-                                            topic_words = topic.lower().split()
-                                            # Match if any topic word appears in title
-                                            if any(word in title for word in topic_words if len(word) > 2):
-                                                topic_match = True
-                                                break
-                                            # Also check for exact topic match
-                                            if topic.lower() in title:
-                                                topic_match = True
-                                                break
-                                        
-                                        # If no topic match, include if it's tech/business related
-                                        if not topic_match:
-                                            tech_keywords = ['technology', 'startup', 'business', 'company', 'ai', 'tech', 'innovation']
-                                            topic_match = any(keyword in title for keyword in tech_keywords)
-                                        
-                                        is_relevant = topic_match
-                                    
-                                    if is_relevant:
-                                        articles.append({
-                                            "id": f"hn_real_{len(articles)}_{int(datetime.now().timestamp())}",
-                                            "title": story.get('title', 'Hacker News Story'),
-                                            "content": f"Hacker News discussion: {story.get('title', '')}",
-                                            "url": story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
-                                            "source": "Hacker News",
-                                            "author": story.get('by', 'HN User'),
-                                            "published_date": datetime.fromtimestamp(story.get('time', 0)).isoformat() if story.get('time') else datetime.now().isoformat(),
-                                            "score": story.get('score', 0),
-                                            "comments": story.get('descendants', 0),
-                                            "simulated": False,
-                                            "relevance_score": 0.8 if any(topic.lower() in story.get('title', '').lower() for topic in topics) else 0.5
-                                        })
-                                        
-                        except Exception as story_error:
-                            logger.warning(f"Failed to fetch HN story {story_id}: {str(story_error)}")
-                            continue
+                                # If no topic match, include if it's tech/business related
+                                if not topic_match:
+                                    tech_keywords = ['technology', 'startup', 'business', 'company', 'ai', 'tech', 'innovation']
+                                    topic_match = any(keyword in title for keyword in tech_keywords)
+                                
+                                is_relevant = topic_match
+                            
+                            if is_relevant:
+                                articles.append({
+                                    "id": f"hn_real_{len(articles)}_{int(datetime.now().timestamp())}",
+                                    "title": story.get('title', 'Hacker News Story'),
+                                    "content": f"Hacker News discussion: {story.get('title', '')}",
+                                    "url": story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
+                                    "source": "Hacker News",
+                                    "author": story.get('by', 'HN User'),
+                                    "published_date": datetime.fromtimestamp(story.get('time', 0)).isoformat() if story.get('time') else datetime.now().isoformat(),
+                                    "score": story.get('score', 0),
+                                    "comments": story.get('descendants', 0),
+                                    "simulated": False,
+                                    "relevance_score": 0.8 if any(topic.lower() in story.get('title', '').lower() for topic in topics) else 0.5
+                                })
+                                
+                    except Exception as story_error:
+                        logger.warning(f"Failed to process HN story {story_id}: {str(story_error)}")
+                        continue
                             
             except Exception as hn_error:
                 logger.warning(f"Failed to fetch Hacker News stories: {str(hn_error)}")
@@ -1773,29 +1837,26 @@ class EnhancedNewsResearchCrew:
         """Analyze trending topics across all platforms"""
         trending_topics = []
         
-        for i, topic in enumerate(topics):
-            # Count mentions across platforms - ONLY from real content
-            reddit_mentions = len([p for p in content.get('reddit_posts', []) 
-                                 if not p.get('simulated', False) and (
-                                     topic.lower() in p.get('title', '').lower() or 
-                                     topic.lower() in p.get('content', '').lower())
-                                 ])
-            
-            linkedin_mentions = len([p for p in content.get('linkedin_posts', [])
-                                   if not p.get('simulated', False) and (
-                                       topic.lower() in p.get('title', '').lower() or
-                                       topic.lower() in p.get('content', '').lower())
-                                   ])
-            
-            telegram_mentions = len([m for m in content.get('telegram_messages', [])
-                                   if not m.get('simulated', False) and 
-                                      topic.lower() in m.get('text', '').lower()])
-            
-            news_mentions = len([a for a in content.get('news_articles', [])
-                               if not a.get('simulated', False) and (
-                                   topic.lower() in a.get('title', '').lower() or
-                                   topic.lower() in a.get('content', '').lower())
-                               ])
+        # Tokenize every item once - ONLY real content - then count topics from the index
+        index = TopicIndex()
+        for platform, content_key, fields in [
+            ('reddit', 'reddit_posts', ('title', 'content')),
+            ('linkedin', 'linkedin_posts', ('title', 'content')),
+            ('telegram', 'telegram_messages', ('text',)),
+            ('news', 'news_articles', ('title', 'content'))
+        ]:
+            for position, item in enumerate(content.get(content_key, [])):
+                if not item.get('simulated', False):
+                    index.add((platform, position), *(item.get(field) for field in fields))
+        
+        for topic in topics:
+            mentions = {'reddit': 0, 'linkedin': 0, 'telegram': 0, 'news': 0}
+            for platform, _ in index.keys_for(topic):
+                mentions[platform] += 1
+            reddit_mentions = mentions['reddit']
+            linkedin_mentions = mentions['linkedin']
+            telegram_mentions = mentions['telegram']
+            news_mentions = mentions['news']
             
             total_mentions = reddit_mentions + linkedin_mentions + telegram_mentions + news_mentions
             
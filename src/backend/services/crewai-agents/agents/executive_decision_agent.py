@@ -5,12 +5,23 @@ Provides C-level strategic insights, executive decision support, and board-level
 
 import json
 import logging
+import os
+import sys
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import re
 from enum import Enum
 
+# Add tools directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from content_corpus import ContentCorpus
+from pattern_matcher import PatternMatcher
+
 logger = logging.getLogger(__name__)
 
 class StrategicPriority(Enum):
@@ -166,14 +177,14 @@ class ExecutiveDecisionAgent:
         ]
         
         # Executive decision frameworks
-        self.decision_frameworks = {
-            "strategic_planning": self._apply_strategic_planning_framework,
-            "investment_evaluation": self._apply_investment_evaluation_framework,
-            "risk_decision_matrix": self._apply_risk_decision_matrix,
-            "stakeholder_analysis": self._apply_stakeholder_analysis_framework,
-            "resource_optimization": self._apply_resource_optimization_framework,
-            "competitive_positioning": self._apply_competitive_positioning_framework
-        }
+        self.decision_frameworks = [
+            "strategic_planning",
+            "investment_evaluation",
+            "risk_decision_matrix",
+            "stakeholder_analysis",
+            "resource_optimization",
+            "competitive_positioning"
+        ]
         
         # Executive priorities by role
         self.role_priorities = {
@@ -220,6 +231,14 @@ class ExecutiveDecisionAgent:
                 "transformation": "fundamental business model change"
             }
         }
+        
+        # Strategic theme vocabulary, matched in a single scan
+        self.strategic_keywords = [
+            "growth", "expansion", "innovation", "transformation", "competitive advantage",
+            "market leadership", "digital transformation", "sustainability", "efficiency",
+            "customer experience", "operational excellence", "strategic partnership"
+        ]
+        self.strategic_theme_matcher = PatternMatcher(self.strategic_keywords)
 
     def ultra_executive_analysis(
         self, 
@@ -245,6 +264,9 @@ class ExecutiveDecisionAgent:
         logger.info(f"{self.agent_name}: Starting ultra-executive analysis for topics: {topics}")
         
         try:
+            # Every phase reads the same pre-normalized corpus
+            content = ContentCorpus.of(content, topics)
+            
             # Phase 1: Strategic Context Analysis & Synthesis
             strategic_synthesis = self._synthesize_strategic_context(content, topics, strategic_context)
             
@@ -323,10 +345,11 @@ class ExecutiveDecisionAgent:
         """Phase 1: Comprehensive strategic context synthesis"""
         logger.info(f"{self.agent_name}: Synthesizing strategic context")
         
-        content_text = self._extract_text_from_content(content)
+        corpus = ContentCorpus.of(content, topics)
+        content_text = corpus.text
         
         # Identify strategic themes
-        strategic_themes = self._identify_strategic_themes(content_text, topics)
+        strategic_themes = self._identify_strategic_themes(corpus, topics)
         
         # Analyze competitive dynamics
         competitive_landscape = self._analyze_competitive_dynamics(content_text, strategic_themes)
@@ -417,7 +440,7 @@ class ExecutiveDecisionAgent:
     ) -> Optional[ExecutiveInsight]:
         """Create insight for specific role priority"""
         
-        content_text = self._extract_text_from_content(content)
+        content_text = ContentCorpus.of(content, topics).text
         
         # Extract priority-relevant context
         priority_context = self._extract_priority_context(content_text, priority, topics)
@@ -583,41 +606,18 @@ class ExecutiveDecisionAgent:
         return recommendations
 
     # Helper methods for executive analysis
-    def _extract_text_from_content(self, content: Dict[str, Any]) -> str:
-        """Extract text content for executive analysis"""
-        text_parts = []
-        
-        if isinstance(content, dict):
-            for key, value in content.items():
-                if isinstance(value, str):
-                    text_parts.append(value)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, str):
-                            text_parts.append(item)
-                        elif isinstance(item, dict) and 'content' in item:
-                            text_parts.append(str(item['content']))
-        
-        return " ".join(text_parts)
-
-    def _identify_strategic_themes(self, content_text: str, topics: List[str]) -> List[str]:
+    def _identify_strategic_themes(self, corpus: ContentCorpus, topics: List[str]) -> List[str]:
         """Identify strategic themes from content"""
-        strategic_keywords = [
-            "growth", "expansion", "innovation", "transformation", "competitive advantage",
-            "market leadership", "digital transformation", "sustainability", "efficiency",
-            "customer experience", "operational excellence", "strategic partnership"
-        ]
-        
         themes = []
-        content_lower = content_text.lower()
+        found = self.strategic_theme_matcher.matched(corpus.text)
         
-        for keyword in strategic_keywords:
-            if keyword in content_lower:
+        for keyword in self.strategic_keywords:
+            if keyword in found:
                 themes.append(keyword.title())
         
         # Add topic-based themes
         for topic in topics:
-            if topic.lower() in content_lower:
+            if corpus.topic_spans(topic):
                 themes.append(f"{topic} Strategy")
         
         return list(set(themes))[:8]  # Return unique themes, max 8
@@ -3,7 +3,6 @@ import json
 import time
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
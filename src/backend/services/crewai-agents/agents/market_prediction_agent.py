@@ -5,6 +5,8 @@ Provides advanced trend forecasting, investment insights, and market prediction
 
 import json
 import logging
+import os
+import sys
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
@@ -12,6 +14,15 @@ import re
 from enum import Enum
 import math
 
+# Add tools directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from content_corpus import ContentCorpus
+from pattern_matcher import PatternHit, PatternMatcher
+
 logger = logging.getLogger(__name__)
 
 class TrendDirection(Enum):
@@ -162,14 +173,14 @@ class MarketPredictionAgent:
         ]
         
         # Predictive analysis frameworks
-        self.analysis_frameworks = {
-            "technical_analysis": self._perform_technical_analysis,
-            "fundamental_analysis": self._perform_fundamental_analysis,
-            "quantitative_modeling": self._perform_quantitative_modeling,
-            "behavioral_analysis": self._perform_behavioral_analysis,
-            "macro_economic_analysis": self._perform_macro_analysis,
-            "intermarket_analysis": self._perform_intermarket_analysis
-        }
+        self.analysis_frameworks = [
+            "technical_analysis",
+            "fundamental_analysis",
+            "quantitative_modeling",
+            "behavioral_analysis",
+            "macro_economic_analysis",
+            "intermarket_analysis"
+        ]
         
         # Market indicator libraries
         self.market_indicators = {
@@ -192,6 +203,7 @@ class MarketPredictionAgent:
                 "employment data", "manufacturing PMI", "consumer confidence"
             ]
         }
+        self.market_matcher = PatternMatcher(self.market_indicators)
         
         # Predictive pattern recognition
         self.predictive_patterns = {
@@ -234,6 +246,9 @@ class MarketPredictionAgent:
         logger.info(f"{self.agent_name}: Starting ultra-market prediction for topics: {topics}")
         
         try:
+            # Every phase reads the same pre-normalized corpus
+            content = ContentCorpus.of(content, topics)
+            
             # Phase 1: Market Data Analysis & Pattern Recognition
             market_patterns = self._analyze_market_patterns(content, topics)
             
@@ -302,15 +317,18 @@ class MarketPredictionAgent:
         """Phase 1: Comprehensive market pattern analysis"""
         logger.info(f"{self.agent_name}: Analyzing market patterns")
         
-        content_text = self._extract_text_from_content(content)
+        corpus = ContentCorpus.of(content, topics)
+        content_text = corpus.text
         
-        # Detect market signals
+        # Detect market signals - one scan for every signal type
+        pattern_hits = self.market_matcher.first_hits(content_text)
         market_signals = {}
         for signal_type, patterns in self.market_indicators.items():
             detected_signals = []
             for pattern in patterns:
-                if pattern.lower() in content_text.lower():
-                    signal_context = self._extract_signal_context(content_text, pattern)
+                hit = pattern_hits.get(pattern)
+                if hit:
+                    signal_context = self._extract_signal_context(corpus, hit)
                     detected_signals.append({
                         "pattern": pattern,
                         "context": signal_context,
@@ -341,6 +359,7 @@ class MarketPredictionAgent:
         logger.info(f"{self.agent_name}: Identifying and assessing trends")
         
         trends = []
+        content = ContentCorpus.of(content, topics)
         
         # Analyze each topic for trend signals
         for topic in topics:
@@ -368,10 +387,9 @@ class MarketPredictionAgent:
         """Analyze trends specific to a topic"""
         
         trends = []
-        content_text = self._extract_text_from_content(content)
         
-        # Extract topic-specific signals
-        topic_context = self._extract_topic_context(content_text, topic)
+        # Extract topic-specific signals from the precomputed topic spans
+        topic_context = ContentCorpus.of(content, [topic]).topic_context(topic)
         
         if not topic_context:
             return trends
@@ -551,23 +569,6 @@ class MarketPredictionAgent:
         return recommendations
 
     # Helper methods for market analysis
-    def _extract_text_from_content(self, content: Dict[str, Any]) -> str:
-        """Extract text content for market analysis"""
-        text_parts = []
-        
-        if isinstance(content, dict):
-            for key, value in content.items():
-                if isinstance(value, str):
-                    text_parts.append(value)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, str):
-                            text_parts.append(item)
-                        elif isinstance(item, dict) and 'content' in item:
-                            text_parts.append(str(item['content']))
-        
-        return " ".join(text_parts)
-
     def _determine_trend_direction(
         self, 
         topic_context: str, 
@@ -668,15 +669,9 @@ class MarketPredictionAgent:
         )
 
     # Additional placeholder implementations for comprehensive prediction
-    def _extract_signal_context(self, content_text: str, pattern: str) -> str:
+    def _extract_signal_context(self, corpus: ContentCorpus, hit: PatternHit) -> str:
         """Extract context around market signal"""
-        pattern_index = content_text.lower().find(pattern.lower())
-        if pattern_index == -1:
-            return ""
-        
-        start = max(0, pattern_index - 100)
-        end = min(len(content_text), pattern_index + len(pattern) + 100)
-        return content_text[start:end]
+        return corpus.window(hit.start, hit.end, radius=100)
 
     def _assess_signal_strength(self, pattern: str, context: str) -> float:
         """Assess the strength of a market signal"""
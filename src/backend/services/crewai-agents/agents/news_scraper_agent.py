@@ -1,6 +1,6 @@
 import os
+import sys
 import json
-import requests
 from typing import List, Dict, Any, TYPE_CHECKING
 from datetime import datetime, timedelta
 
@@ -17,7 +17,6 @@ except ImportError:
     BS4_AVAILABLE = False
     BeautifulSoup = None
     
-import feedparser
 from newspaper import Article
 from crewai import Agent
 from crewai_tools import BaseTool
@@ -25,6 +24,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Add tools directory to path for the shared HTTP client and feed cache
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from http_client import get_http_client
+from feed_cache import get_feed_cache
+
 class NewsScraperTool(BaseTool):
     """Tool for scraping news websites and tech blogs"""
     
@@ -151,8 +159,8 @@ class NewsScraperTool(BaseTool):
         articles = []
         
         try:
-            # Parse RSS feed
-            feed = feedparser.parse(source_info['rss'])
+            # Parse RSS feed (revalidated with a conditional GET, parsed entries are reused)
+            feed = get_feed_cache().fetch(source_info['rss'])
             
             for entry in feed.entries[:15]:  # Limit to 15 entries per source
                 try:
@@ -202,7 +210,7 @@ class NewsScraperTool(BaseTool):
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(source_info['url'], headers=headers, timeout=30)
+            response = get_http_client().get(source_info['url'], headers=headers, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
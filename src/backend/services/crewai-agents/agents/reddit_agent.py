@@ -27,9 +27,20 @@ except ImportError:
             def _run(self, *args, **kwargs):
                 pass
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Add tools directory to path for the shared HTTP client and rate limiter
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from http_client import get_http_client, HttpTimeoutError, HttpConnectionError
+from rate_limiter import get_rate_limiter
+from subreddit_cache import get_subreddit_cache
+
 class RedditScraperTool(BaseTool):
     """Tool for scraping Reddit posts and discussions"""
     
@@ -223,9 +234,14 @@ class RedditScraperTool(BaseTool):
         posts = []
         
         try:
-            import requests
             import random
-            import time
+            
+            http = get_http_client()
+            # Requests draw from a per-host token bucket that adapts to Reddit's
+            # X-Ratelimit-* headers and 429s, so we only sleep when the budget is spent
+            limiter = get_rate_limiter()
+            # Remembers which generated subreddit names exist so dead variants are skipped
+            subreddit_cache = get_subreddit_cache()
             
             # Enhanced user agent rotation to avoid detection
             user_agents = [
@@ -267,9 +283,9 @@ class RedditScraperTool(BaseTool):
                     f"{topic_clean}hub"
                 ])
                 
-                # Generate endpoints for each variation
+                # Generate endpoints for each variation not already known to be dead
                 endpoints = {}
-                for variation in variations:
+                for variation in subreddit_cache.rank(variations):
                     endpoints[variation] = [f'https://www.reddit.com/r/{variation}/hot.json?limit=15']
                 
                 return endpoints
@@ -298,7 +314,7 @@ class RedditScraperTool(BaseTool):
                 else:
                     variations.append(topic_lower + 's')
                 
-                return variations
+                return subreddit_cache.rank(variations)
             
             logger.info(f"🔍 Starting Reddit JSON fetch for topics: {topics}")
             
@@ -326,7 +342,11 @@ class RedditScraperTool(BaseTool):
                 # Combine dynamic endpoints with general ones
                 all_endpoints = {**subreddit_endpoints, **general_endpoints}
                 
-                for subreddit in set(all_subreddits):
+                # Known-good generated subreddits first, known-dead ones dropped; the fixed
+                # fallbacks always stay in the list and are never ranked out
+                ranked_subreddits = subreddit_cache.rank(relevant_subreddits)
+                ranked_subreddits += [s for s in general_subreddits if s not in ranked_subreddits]
+                for subreddit in ranked_subreddits:
                     if subreddit in all_endpoints:
                         endpoints = all_endpoints[subreddit]
                         
@@ -339,15 +359,14 @@ class RedditScraperTool(BaseTool):
                                         'User-Agent': random.choice(user_agents),
                                         'Accept': 'application/json, text/plain, */*',
                                         'Accept-Language': 'en-US,en;q=0.9',
-                                        'Accept-Encoding': 'gzip, deflate, br',
                                         'DNT': '1',
-                                        'Connection': 'keep-alive',
                                         'Upgrade-Insecure-Requests': '1',
                                     }
                                     
                                     logger.info(f"📡 Attempt {attempt + 1}: Fetching {endpoint_url}")
                                     
-                                    response = requests.get(
+                                    limiter.acquire(endpoint_url)
+                                    response = http.get(
                                         endpoint_url,
                                         headers=headers,
                                         timeout=15,  # Increased timeout
@@ -355,6 +374,13 @@ class RedditScraperTool(BaseTool):
                                     )
                                     
                                     logger.info(f"📊 Response: {response.status_code} for r/{subreddit}")
+                                    limiter.observe(endpoint_url, response.status_code, response.headers)
+                                    
+                                    if response.status_code == 200 and '/subreddits/search' in response.url:
+                                        # Reddit redirects unknown subreddit names to the search page
+                                        logger.info(f"🚫 r/{subreddit} does not exist")
+                                        subreddit_cache.mark(subreddit, False)
+                                        break
                                     
                                     if response.status_code == 200:
                                         try:
@@ -424,6 +450,7 @@ class RedditScraperTool(BaseTool):
                                                         continue
                                                 
                                                 logger.info(f"📊 Found {relevant_posts} relevant posts about '{topic}' from r/{subreddit}")
+                                                subreddit_cache.mark(subreddit, True)
                                                 success = True
                                                 break  # Success, no need to retry
                                             else:
@@ -432,40 +459,38 @@ class RedditScraperTool(BaseTool):
                                             logger.error(f"❌ JSON decode error for r/{subreddit}: {e}")
                                     
                                     elif response.status_code == 429:
+                                        # Backoff is applied by the limiter - the retry's acquire() waits it out
                                         logger.warning(f"⚠️ Rate limited by Reddit for r/{subreddit}")
-                                        # Exponential backoff for rate limits
-                                        wait_time = (2 ** attempt) + random.uniform(0, 1)
-                                        logger.info(f"⏱️ Waiting {wait_time:.1f}s before retry...")
-                                        time.sleep(wait_time)
                                         continue
                                     
                                     elif response.status_code == 403:
-                                        logger.warning(f"⚠️ Access forbidden for r/{subreddit} (subreddit may be private)")
+                                        # Not cached as dead: Reddit also answers 403 to blocked or
+                                        # datacenter IPs, which says nothing about the subreddit
+                                        logger.warning(f"⚠️ Access forbidden for r/{subreddit} (subreddit may be private or this IP blocked)")
                                         break  # Don't retry 403s
                                     
+                                    elif response.status_code == 404:
+                                        logger.info(f"🚫 r/{subreddit} does not exist")
+                                        subreddit_cache.mark(subreddit, False)
+                                        break  # Don't retry 404s
+                                    
                                     else:
                                         logger.warning(f"⚠️ HTTP {response.status_code} for r/{subreddit}")
                                         
-                                except requests.exceptions.Timeout:
+                                except HttpTimeoutError:
                                     logger.warning(f"⏱️ Timeout fetching r/{subreddit}, attempt {attempt + 1}")
-                                except requests.exceptions.ConnectionError:
+                                    limiter.record_failure(endpoint_url)
+                                except HttpConnectionError:
                                     logger.warning(f"🔌 Connection error for r/{subreddit}, attempt {attempt + 1}")
+                                    limiter.record_failure(endpoint_url)
                                 except Exception as e:
                                     logger.error(f"❌ Unexpected error for r/{subreddit}: {e}")
-                                
-                                # Wait between retries
-                                if attempt < 2:  # Don't wait after last attempt
-                                    time.sleep(random.uniform(1, 3))
                             
                             # If we got posts from this endpoint, try next subreddit
                             if success:
                                 break
-                            
-                            # Wait between different endpoints for same subreddit
-                            time.sleep(random.uniform(0.5, 1.5))
-                        
-                        # Wait between different subreddits
-                        time.sleep(random.uniform(1, 2))
+            
+            subreddit_cache.save()
             
             # Remove duplicates based on ID
             unique_posts = {}
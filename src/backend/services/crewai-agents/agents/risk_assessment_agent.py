@@ -5,6 +5,8 @@ Provides comprehensive risk analysis, pattern recognition, and threat assessment
 
 import json
 import logging
+import os
+import sys
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
@@ -12,6 +14,15 @@ import re
 from enum import Enum
 import math
 
+# Add tools directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from content_corpus import ContentCorpus
+from pattern_matcher import PatternHit, PatternMatcher
+
 logger = logging.getLogger(__name__)
 
 class RiskCategory(Enum):
@@ -143,13 +154,13 @@ class RiskAssessmentAgent:
         ]
         
         # Risk analysis frameworks
-        self.analysis_frameworks = {
-            "bow_tie_analysis": self._perform_bow_tie_analysis,
-            "fault_tree_analysis": self._perform_fault_tree_analysis,
-            "monte_carlo_simulation": self._perform_monte_carlo_risk,
-            "scenario_stress_testing": self._perform_scenario_stress_test,
-            "cascade_analysis": self._perform_cascade_analysis
-        }
+        self.analysis_frameworks = [
+            "bow_tie_analysis",
+            "fault_tree_analysis",
+            "monte_carlo_simulation",
+            "scenario_stress_testing",
+            "cascade_analysis"
+        ]
         
         # Risk pattern libraries
         self.risk_patterns = {
@@ -178,6 +189,7 @@ class RiskAssessmentAgent:
                 "brand damage", "trust erosion", "public relations crisis"
             ]
         }
+        self.risk_matcher = PatternMatcher(self.risk_patterns)
         
         # Risk interdependency mapping
         self.risk_interdependencies = {
@@ -209,6 +221,9 @@ class RiskAssessmentAgent:
         logger.info(f"{self.agent_name}: Starting ultra-risk assessment for topics: {topics}")
         
         try:
+            # Every phase reads the same pre-normalized corpus
+            content = ContentCorpus.of(content, topics)
+            
             # Phase 1: Risk Pattern Recognition & Classification
             risk_indicators = self._recognize_and_classify_risks(content, topics, domain_context)
             
@@ -269,11 +284,13 @@ class RiskAssessmentAgent:
         logger.info(f"{self.agent_name}: Recognizing and classifying risks")
         
         risk_indicators = []
-        content_text = self._extract_text_from_content(content)
+        corpus = ContentCorpus.of(content, topics)
+        content_text = corpus.text
         
-        # Pattern-based risk detection
+        # Pattern-based risk detection - one scan for every category
+        pattern_hits = self.risk_matcher.first_hits(content_text)
         for category, patterns in self.risk_patterns.items():
-            detected_risks = self._detect_risk_patterns(content_text, patterns, category)
+            detected_risks = self._detect_risk_patterns(corpus, patterns, category, pattern_hits)
             risk_indicators.extend(detected_risks)
         
         # Contextual risk analysis
@@ -291,18 +308,22 @@ class RiskAssessmentAgent:
 
     def _detect_risk_patterns(
         self, 
-        content_text: str, 
+        corpus: ContentCorpus, 
         patterns: List[str], 
-        category: str
+        category: str,
+        pattern_hits: Optional[Dict[str, PatternHit]] = None
     ) -> List[RiskIndicator]:
         """Detect specific risk patterns in content"""
         
         detected_risks = []
+        if pattern_hits is None:
+            pattern_hits = self.risk_matcher.first_hits(corpus.text)
         
         for pattern in patterns:
-            if pattern.lower() in content_text.lower():
+            hit = pattern_hits.get(pattern)
+            if hit:
                 # Extract context around the pattern
-                risk_context = self._extract_risk_context(content_text, pattern)
+                risk_context = self._extract_risk_context(corpus, hit)
                 
                 # Create risk indicator
                 risk_indicator = self._create_risk_indicator_from_pattern(
@@ -521,23 +542,6 @@ class RiskAssessmentAgent:
         return recommendations
 
     # Helper methods for risk analysis
-    def _extract_text_from_content(self, content: Dict[str, Any]) -> str:
-        """Extract text content for risk pattern analysis"""
-        text_parts = []
-        
-        if isinstance(content, dict):
-            for key, value in content.items():
-                if isinstance(value, str):
-                    text_parts.append(value)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, str):
-                            text_parts.append(item)
-                        elif isinstance(item, dict) and 'content' in item:
-                            text_parts.append(str(item['content']))
-        
-        return " ".join(text_parts)
-
     def _map_risk_category(self, category_str: str) -> RiskCategory:
         """Map category string to RiskCategory enum"""
         category_mapping = {
@@ -618,16 +622,10 @@ class RiskAssessmentAgent:
         )
 
     # Additional placeholder implementations for comprehensive risk analysis
-    def _extract_risk_context(self, content_text: str, pattern: str) -> str:
+    def _extract_risk_context(self, corpus: ContentCorpus, hit: PatternHit) -> str:
         """Extract context around risk pattern"""
-        pattern_index = content_text.lower().find(pattern.lower())
-        if pattern_index == -1:
-            return ""
-        
-        # Extract 100 characters before and after the pattern
-        start = max(0, pattern_index - 100)
-        end = min(len(content_text), pattern_index + len(pattern) + 100)
-        return content_text[start:end]
+        # 100 characters before and after the pattern
+        return corpus.window(hit.start, hit.end, radius=100)
 
     def _assess_pattern_likelihood(self, pattern: str, context: str) -> RiskLikelihood:
         """Assess risk likelihood based on pattern and context"""
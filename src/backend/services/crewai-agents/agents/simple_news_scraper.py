@@ -1,6 +1,6 @@
 import os
+import sys
 import json
-import requests
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 import logging
@@ -9,10 +9,21 @@ import urllib.parse as urlparse
 
 logger = logging.getLogger(__name__)
 
+# Add tools directory to path for the shared HTTP client
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from http_client import get_http_client
+from hn_client import get_hn_client
+
 class SimpleNewsScraperTool:
-    """Simplified news scraper using only requests and basic parsing"""
+    """Simplified news scraper using the shared HTTP client and basic parsing"""
     
     def __init__(self):
+        self.http = get_http_client().session(headers={'User-Agent': 'SynapseNewsBot/1.0'})
+        
         # News sources with RSS feeds that return JSON or simple text
         self.news_sources = {
             'hackernews': {
@@ -110,38 +121,24 @@ class SimpleNewsScraperTool:
         articles = []
         
         try:
-            headers = {'User-Agent': 'SynapseNewsBot/1.0'}
-            
-            # Get top stories
-            response = requests.get(self.news_sources['hackernews']['api_url'], 
-                                  headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            top_stories = response.json()[:30]  # Get top 30 stories
-            
-            for story_id in top_stories[:10]:  # Process first 10
+            # First 10 top stories, hydrated concurrently through the shared item cache
+            for item_data in get_hn_client().top_stories(10):
+                story_id = item_data.get('id')
                 try:
-                    item_url = self.news_sources['hackernews']['item_url'].format(story_id)
-                    item_response = requests.get(item_url, headers=headers, timeout=5)
-                    item_response.raise_for_status()
-                    
-                    item_data = item_response.json()
-                    
-                    if item_data and item_data.get('type') == 'story':
-                        article = {
-                            'title': item_data.get('title', ''),
-                            'url': item_data.get('url', f'https://news.ycombinator.com/item?id={story_id}'),
-                            'content': item_data.get('text', '')[:500] if item_data.get('text') else '',
-                            'summary': item_data.get('title', ''),  # Use title as summary
-                            'author': item_data.get('by', 'Unknown'),
-                            'published_date': datetime.fromtimestamp(item_data.get('time', 0)).isoformat() if item_data.get('time') else '',
-                            'source': 'Hacker News',
-                            'source_category': 'tech',
-                            'score': item_data.get('score', 0),
-                            'comments': item_data.get('descendants', 0),
-                            'scraped_at': datetime.now().isoformat()
-                        }
-                        articles.append(article)
+                    article = {
+                        'title': item_data.get('title', ''),
+                        'url': item_data.get('url', f'https://news.ycombinator.com/item?id={story_id}'),
+                        'content': item_data.get('text', '')[:500] if item_data.get('text') else '',
+                        'summary': item_data.get('title', ''),  # Use title as summary
+                        'author': item_data.get('by', 'Unknown'),
+                        'published_date': datetime.fromtimestamp(item_data.get('time', 0)).isoformat() if item_data.get('time') else '',
+                        'source': 'Hacker News',
+                        'source_category': 'tech',
+                        'score': item_data.get('score', 0),
+                        'comments': item_data.get('descendants', 0),
+                        'scraped_at': datetime.now().isoformat()
+                    }
+                    articles.append(article)
                         
                 except Exception as e:
                     logger.error(f"Error processing HN story {story_id}: {str(e)}")
@@ -158,10 +155,7 @@ class SimpleNewsScraperTool:
         articles = []
         
         try:
-            headers = {'User-Agent': 'SynapseNewsBot/1.0'}
-            
-            response = requests.get(self.news_sources['dev_to']['api_url'], 
-                                  headers=headers, timeout=10)
+            response = self.http.get(self.news_sources['dev_to']['api_url'], timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -200,8 +194,6 @@ class SimpleNewsScraperTool:
         articles = []
         
         try:
-            headers = {'User-Agent': 'SynapseNewsBot/1.0'}
-            
             # Try public news APIs (demo/free versions)
             test_urls = [
                 f'https://newsapi.org/v2/everything?q={topic}&apiKey=demo&pageSize=5',  # Will fail but worth trying
@@ -293,13 +285,11 @@ class SimpleNewsScraperTool:
         articles = []
         
         try:
-            headers = {'User-Agent': 'SynapseNewsBot/1.0'}
-            
             # Get repositories created in the last week
             last_week = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
             api_url = self.news_sources['github_trending']['api_url'].format(last_week)
             
-            response = requests.get(api_url, headers=headers, timeout=10)
+            response = self.http.get(api_url, timeout=10)
             response.raise_for_status()
             
             data = response.json()
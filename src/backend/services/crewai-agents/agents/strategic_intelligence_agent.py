@@ -4,15 +4,26 @@ Advanced strategic analysis, market predictions, and executive-level insights
 """
 
 import os
+import sys
 import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import re
-from crewai import Agent, Task
 import numpy as np
 
+if TYPE_CHECKING:
+    from crewai import Agent
+
+# Add tools directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from pattern_matcher import PatternMatcher
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -65,14 +76,14 @@ class StrategicIntelligenceAgent:
         self.prediction_accuracy = {}
         
         # Strategic analysis frameworks
-        self.frameworks = {
-            'porter_five_forces': self._analyze_porter_forces,
-            'swot_analysis': self._perform_swot_analysis,
-            'scenario_planning': self._scenario_planning,
-            'trend_impact_analysis': self._analyze_trend_impact,
-            'competitive_positioning': self._analyze_competitive_position,
-            'market_timing': self._analyze_market_timing
-        }
+        self.frameworks = [
+            'porter_five_forces',
+            'swot_analysis',
+            'scenario_planning',
+            'trend_impact_analysis',
+            'competitive_positioning',
+            'market_timing'
+        ]
         
         # Market intelligence patterns
         self.market_patterns = {
@@ -82,8 +93,17 @@ class StrategicIntelligenceAgent:
             'market_maturity_stages': ['emergence', 'growth', 'maturity', 'decline', 'transformation']
         }
         
-    def create_agent(self) -> Agent:
+        # Sentiment indicators for momentum analysis
+        self.sentiment_indicators = {
+            'positive': ['growth', 'opportunity', 'breakthrough', 'success', 'innovation', 'expansion'],
+            'negative': ['decline', 'risk', 'challenge', 'threat', 'disruption', 'uncertainty']
+        }
+        
+    def create_agent(self) -> "Agent":
         """Create the Strategic Intelligence Agent with ultra-thinking capabilities"""
+        # Imported here so the analysis itself (run by the orchestrator's step
+        # workers) does not need CrewAI
+        from crewai import Agent
         
         current_date = datetime.now().strftime('%Y-%m-%d')
         
@@ -163,7 +183,7 @@ class StrategicIntelligenceAgent:
             },
             'ultra_thinking_metadata': {
                 'analysis_depth': 'ultra_deep',
-                'frameworks_used': list(self.frameworks.keys()),
+                'frameworks_used': list(self.frameworks),
                 'reasoning_steps': len(reasoning_chain),
                 'insight_categories': list(set([insight.category for insight in strategic_insights])),
                 'generated_at': datetime.now().isoformat(),
@@ -239,9 +259,9 @@ class StrategicIntelligenceAgent:
         if len(items) < 5:
             return None
             
-        # Simulate sentiment analysis with strategic context
-        positive_indicators = ['growth', 'opportunity', 'breakthrough', 'success', 'innovation', 'expansion']
-        negative_indicators = ['decline', 'risk', 'challenge', 'threat', 'disruption', 'uncertainty']
+        # Simulate sentiment analysis with strategic context; indicators and
+        # topics are matched together in one scan per item
+        matcher = PatternMatcher({**self.sentiment_indicators, 'topic': topics})
         
         sentiment_scores = []
         topic_sentiments = {topic: [] for topic in topics}
@@ -249,10 +269,11 @@ class StrategicIntelligenceAgent:
         for item in items:
             content_text = (item.get('title', '') + ' ' + 
                           item.get('content', '') + ' ' + 
-                          item.get('summary', '')).lower()
+                          item.get('summary', ''))
+            found = matcher.matches_by_label(content_text)
             
-            positive_count = sum(1 for indicator in positive_indicators if indicator in content_text)
-            negative_count = sum(1 for indicator in negative_indicators if indicator in content_text)
+            positive_count = len(found.get('positive', []))
+            negative_count = len(found.get('negative', []))
             
             # Calculate sentiment score (-1 to 1)
             if positive_count + negative_count > 0:
@@ -260,9 +281,8 @@ class StrategicIntelligenceAgent:
                 sentiment_scores.append(score)
                 
                 # Track by topic
-                for topic in topics:
-                    if topic.lower() in content_text:
-                        topic_sentiments[topic].append(score)
+                for topic in found.get('topic', []):
+                    topic_sentiments[topic].append(score)
         
         if not sentiment_scores:
             return None
@@ -41,9 +41,19 @@ except ImportError:
             def _run(self, *args, **kwargs):
                 pass
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Add tools directory to path for the shared HTTP client
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from http_client import get_http_client
+from hn_client import get_hn_client
+
 class TelegramMonitorTool(BaseTool):
     """Tool for monitoring Telegram channels and groups for news"""
     
@@ -279,7 +289,7 @@ class TelegramMonitorTool(BaseTool):
         messages = []
         
         try:
-            import requests
+            http = get_http_client()
             try:
                 from bs4 import BeautifulSoup
                 BS4_AVAILABLE = True
@@ -320,7 +330,7 @@ class TelegramMonitorTool(BaseTool):
                     headers = {
                         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
                     }
-                    response = requests.get(rss_url, timeout=15, headers=headers)
+                    response = http.get(rss_url, timeout=15, headers=headers)
                     
                     if response.status_code == 200:
                         # Check if it's a Telegram web page or RSS feed
@@ -405,7 +415,7 @@ class TelegramMonitorTool(BaseTool):
         messages = []
         
         try:
-            import requests
+            http = get_http_client()
             try:
                 from bs4 import BeautifulSoup
                 BS4_AVAILABLE = True
@@ -421,14 +431,12 @@ class TelegramMonitorTool(BaseTool):
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
                 'DNT': '1',
-                'Connection': 'keep-alive',
             }
             
             logger.info(f"🕸️ Attempting to scrape Telegram web: {web_url}")
             
-            response = requests.get(web_url, headers=headers, timeout=15)
+            response = http.get(web_url, headers=headers, timeout=15)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -514,63 +522,50 @@ class TelegramMonitorTool(BaseTool):
         messages = []
         
         try:
-            import requests
-            
-            # Use real tech news APIs and format as Telegram-style messages
-            tech_apis = [
-                'https://hacker-news.firebaseio.com/v0/topstories.json',
-            ]
-            
             logger.info(f"📰 Fetching real tech news for {channel_username}...")
             
-            # Get Hacker News stories
+            # Get Hacker News stories - first 3, hydrated concurrently through the shared item cache
             try:
-                response = requests.get(tech_apis[0], timeout=10)
-                if response.status_code == 200:
-                    story_ids = response.json()[:10]  # Top 10 stories
-                    
-                    for story_id in story_ids[:3]:  # Process first 3
-                        story_response = requests.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json', timeout=5)
-                        if story_response.status_code == 200:
-                            story = story_response.json()
+                hn = get_hn_client()
+                for story in hn.get_items(hn.top_story_ids(3)):
+                    story_id = story.get('id')
+                    if story.get('title'):
+                        title = story.get('title', '').lower()
+                        
+                        # Check relevance to topics
+                        if any(topic.lower() in title for topic in topics):
+                            # Create rich Telegram-style message for tech news
+                            tech_content = f"🔥 {story.get('title', '')}\n\n💬 {story.get('descendants', 0)} comments | ⭐ {story.get('score', 0)} points\n\nDiscussion: https://news.ycombinator.com/item?id={story_id}"
                             
-                            if story and story.get('title'):
-                                title = story.get('title', '').lower()
-                                
-                                # Check relevance to topics
-                                if any(topic.lower() in title for topic in topics):
-                                    # Create rich Telegram-style message for tech news
-                                    tech_content = f"🔥 {story.get('title', '')}\n\n💬 {story.get('descendants', 0)} comments | ⭐ {story.get('score', 0)} points\n\nDiscussion: https://news.ycombinator.com/item?id={story_id}"
-                                    
-                                    messages.append({
-                                        'channel': '@techcrunch',
-                                        'channel_name': '@techcrunch',
-                                        'message_id': f"tech_news_{story_id}",
-                                        'title': story.get('title', ''),
-                                        'text': tech_content,
-                                        'full_content': tech_content,
-                                        'summary': f"{story.get('title', '')} - {story.get('descendants', 0)} comments, {story.get('score', 0)} points",
-                                        'timestamp': datetime.fromtimestamp(story.get('time', 0)).isoformat() if story.get('time') else datetime.now().isoformat(),
-                                        'date': datetime.fromtimestamp(story.get('time', 0)).isoformat() if story.get('time') else datetime.now().isoformat(),
-                                        'views': story.get('score', 0) * 10,
-                                        'forwards': story.get('descendants', 0),
-                                        'reactions': {'🔥': story.get('score', 0) // 10, '💡': story.get('descendants', 0) // 5, '🚀': 5},
-                                        'url': story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
-                                        'external_url': story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
-                                        'discussion_url': f"https://news.ycombinator.com/item?id={story_id}",
-                                        'source': 'hacker_news_telegram',
-                                        'source_type': 'telegram_tech_news',
-                                        'content_type': 'tech_discussion',
-                                        'simulated': False,
-                                        'is_forwarded': False,
-                                        'media_type': 'text',
-                                        'engagement': {
-                                            'comments': story.get('descendants', 0),
-                                            'score': story.get('score', 0)
-                                        }
-                                    })
-                                    
-                    logger.info(f"✅ Converted {len(messages)} tech news stories to Telegram format")
+                            messages.append({
+                                'channel': '@techcrunch',
+                                'channel_name': '@techcrunch',
+                                'message_id': f"tech_news_{story_id}",
+                                'title': story.get('title', ''),
+                                'text': tech_content,
+                                'full_content': tech_content,
+                                'summary': f"{story.get('title', '')} - {story.get('descendants', 0)} comments, {story.get('score', 0)} points",
+                                'timestamp': datetime.fromtimestamp(story.get('time', 0)).isoformat() if story.get('time') else datetime.now().isoformat(),
+                                'date': datetime.fromtimestamp(story.get('time', 0)).isoformat() if story.get('time') else datetime.now().isoformat(),
+                                'views': story.get('score', 0) * 10,
+                                'forwards': story.get('descendants', 0),
+                                'reactions': {'🔥': story.get('score', 0) // 10, '💡': story.get('descendants', 0) // 5, '🚀': 5},
+                                'url': story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
+                                'external_url': story.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
+                                'discussion_url': f"https://news.ycombinator.com/item?id={story_id}",
+                                'source': 'hacker_news_telegram',
+                                'source_type': 'telegram_tech_news',
+                                'content_type': 'tech_discussion',
+                                'simulated': False,
+                                'is_forwarded': False,
+                                'media_type': 'text',
+                                'engagement': {
+                                    'comments': story.get('descendants', 0),
+                                    'score': story.get('score', 0)
+                                }
+                            })
+                            
+                logger.info(f"✅ Converted {len(messages)} tech news stories to Telegram format")
                     
             except Exception as e:
                 logger.error(f"❌ Tech news fetching failed: {str(e)}")
@@ -4,22 +4,35 @@ Coordinates complex analysis across Strategic Intelligence, Competitive Intellig
 Market Prediction, and Executive Decision agents using multi-step reasoning chains.
 """
 
+import hashlib
 import json
 import logging
+import os
+import sys
+import time
 from typing import Dict, List, Any, Optional, Tuple, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime, timedelta
 import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
 import traceback
 
 # Import our ultra-thinking agents
-from .strategic_intelligence_agent import StrategicIntelligenceAgent, StrategicIntelligence
+from .strategic_intelligence_agent import StrategicIntelligenceAgent
 from .competitive_intelligence_agent import CompetitiveIntelligenceAgent, CompetitiveIntelligence
 from .risk_assessment_agent import RiskAssessmentAgent, RiskAssessment
 from .market_prediction_agent import MarketPredictionAgent, MarketPrediction
 from .executive_decision_agent import ExecutiveDecisionAgent, ExecutiveDecisionReport
 
+# Add tools directory to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+tools_dir = os.path.join(os.path.dirname(current_dir), 'tools')
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from content_corpus import ContentCorpus
+
 logger = logging.getLogger(__name__)
 
 class ReasoningChainType(Enum):
@@ -42,6 +55,46 @@ class AgentRole(Enum):
     MARKET_PREDICTION = "market_prediction"
     EXECUTIVE_DECISION = "executive_decision"
 
+# Analysis entry point and class for each agent role
+AGENT_METHODS = {
+    AgentRole.STRATEGIC_INTELLIGENCE: "ultra_analyze_content",
+    AgentRole.COMPETITIVE_INTELLIGENCE: "ultra_analyze_competitive_landscape",
+    AgentRole.RISK_ASSESSMENT: "ultra_assess_risks",
+    AgentRole.MARKET_PREDICTION: "ultra_predict_markets",
+    AgentRole.EXECUTIVE_DECISION: "ultra_executive_analysis"
+}
+
+AGENT_CLASSES = {
+    AgentRole.STRATEGIC_INTELLIGENCE: StrategicIntelligenceAgent,
+    AgentRole.COMPETITIVE_INTELLIGENCE: CompetitiveIntelligenceAgent,
+    AgentRole.RISK_ASSESSMENT: RiskAssessmentAgent,
+    AgentRole.MARKET_PREDICTION: MarketPredictionAgent,
+    AgentRole.EXECUTIVE_DECISION: ExecutiveDecisionAgent
+}
+
+# Agents built inside process-pool workers, reused across the steps each worker runs
+_worker_agents: Dict[AgentRole, Any] = {}
+
+def _run_agent_step(
+    role_value: str, 
+    content: Dict[str, Any], 
+    topics: List[str], 
+    agent: Any = None
+) -> Dict[str, Any]:
+    """Run one agent analysis in a pool worker
+    
+    Thread pools pass the orchestrator's own agent; process pools pass only
+    the role so the (unpicklable) agent is built once per worker process.
+    """
+    agent_role = AgentRole(role_value)
+    if agent is None:
+        agent = _worker_agents.get(agent_role)
+        if agent is None:
+            agent = _worker_agents[agent_role] = AGENT_CLASSES[agent_role]()
+    
+    result = getattr(agent, AGENT_METHODS[agent_role])(content, topics)
+    return asdict(result) if is_dataclass(result) else result
+
 @dataclass
 class ReasoningStep:
     """Individual step in multi-agent reasoning chain"""
@@ -72,7 +125,7 @@ class ReasoningChain:
 class UltraThinkingResult:
     """Final ultra-thinking analysis result with synthesized insights"""
     analysis_id: str
-    strategic_intelligence: Optional[StrategicIntelligence]
+    strategic_intelligence: Optional[Dict[str, Any]]
     competitive_intelligence: Optional[CompetitiveIntelligence]
     risk_assessment: Optional[RiskAssessment]
     market_prediction: Optional[MarketPrediction]
@@ -83,6 +136,111 @@ class UltraThinkingResult:
     ultra_recommendations: List[str]
     analysis_timestamp: str
 
+@dataclass
+class ChainBudget:
+    """Limits for the multi-round chain types (hierarchical, iterative, debate)"""
+    wall_clock_seconds: float = 300.0
+    max_steps: int = 20
+    max_rounds: int = 3
+    convergence_delta: float = 0.02
+
+class ChainScheduler:
+    """
+    Runs the steps of one reasoning chain under a ChainBudget.
+    
+    Agents only see content and topics, so each step's dependency outputs
+    are folded into its content as findings; a step whose content and topics
+    match an earlier step of the same agent reuses that output instead of
+    spending budget on a repeat run. Memoized steps are free; executed steps
+    count against max_steps, and every step's timeout is capped by the wall
+    clock left.
+    """
+    
+    def __init__(self, orchestrator: "UltraThinkingOrchestrator", budget: ChainBudget):
+        self.orchestrator = orchestrator
+        self.budget = budget
+        self.deadline = time.monotonic() + budget.wall_clock_seconds
+        self.memo: Dict[Tuple[AgentRole, str], Dict[str, Any]] = {}
+        self.steps_run = 0
+        self.memo_hits = 0
+        self.rounds = 0
+        self.stop_reason: Optional[str] = None
+    
+    @property
+    def remaining_seconds(self) -> float:
+        return self.deadline - time.monotonic()
+    
+    def can_afford(self, step_count: int) -> bool:
+        """Whether step_count more executed steps fit in the budget; records why not"""
+        if self.remaining_seconds <= 0:
+            self.stop_reason = self.stop_reason or "wall_clock_budget"
+            return False
+        if self.steps_run + step_count > self.budget.max_steps:
+            self.stop_reason = self.stop_reason or "step_budget"
+            return False
+        return True
+    
+    def converged(self, previous: Optional[float], current: float) -> bool:
+        if previous is not None and abs(current - previous) <= self.budget.convergence_delta:
+            self.stop_reason = self.stop_reason or "converged"
+            return True
+        return False
+    
+    async def run_step(self, step: ReasoningStep, step_outputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run (or replay from the memo) one step; returns None if it failed or was skipped"""
+        enhanced_input = self.orchestrator._with_dependency_findings(
+            self.orchestrator._enhance_input_with_dependencies(step.input_data, step.dependencies, step_outputs)
+        )
+        key = (step.agent_role, self._fingerprint(enhanced_input))
+        started = time.monotonic()
+        
+        if key in self.memo:
+            result = self.memo[key]
+            self.memo_hits += 1
+        elif not self.can_afford(1):
+            step.status = "skipped"
+            step.output_data = {"skipped": self.stop_reason}
+            return None
+        else:
+            self.steps_run += 1
+            step.status = "in_progress"
+            timeout = min(self.orchestrator.step_timeout_seconds, self.remaining_seconds)
+            result = await self.orchestrator._execute_agent_analysis(step.agent_role, enhanced_input, timeout=timeout)
+            if "error" not in result:
+                self.memo[key] = result
+        
+        step.output_data = result
+        step.execution_time = time.monotonic() - started
+        if "error" in result:
+            step.status = "failed"
+            return None
+        
+        step.status = "completed"
+        step.confidence_score = self.orchestrator._extract_confidence_score(result)
+        step_outputs[step.step_id] = result
+        return result
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "steps_run": self.steps_run,
+            "memo_hits": self.memo_hits,
+            "rounds": self.rounds,
+            "stop_reason": self.stop_reason or "completed",
+            "elapsed_seconds": round(self.budget.wall_clock_seconds - self.remaining_seconds, 2)
+        }
+    
+    @staticmethod
+    def _fingerprint(input_data: Dict[str, Any]) -> str:
+        # Only what the agent actually receives; a shared corpus is hashed once when built
+        content = input_data.get("content", {})
+        if isinstance(content, ContentCorpus):
+            content = content.digest
+        payload = json.dumps(
+            {"content": content, "topics": input_data.get("topics", [])},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
 class UltraThinkingOrchestrator:
     """
     Advanced orchestrator for coordinating ultra-thinking multi-agent reasoning chains.
@@ -104,6 +262,23 @@ class UltraThinkingOrchestrator:
             AgentRole.EXECUTIVE_DECISION: ExecutiveDecisionAgent()
         }
         
+        # Agent steps run in a worker pool so they never block the event loop.
+        # The agents are pure-Python and hold the GIL, so the default "thread"
+        # pool keeps the loop responsive and enforces timeouts but runs one
+        # step at a time; set "process" for steps that overlap across cores
+        self.step_pool_kind = os.getenv('ULTRA_THINKING_STEP_POOL', 'thread').lower()
+        self.step_workers = int(os.getenv('ULTRA_THINKING_STEP_WORKERS', str(len(self.agents))))
+        self.step_timeout_seconds = float(os.getenv('ULTRA_THINKING_STEP_TIMEOUT_SECONDS', '120'))
+        self._step_executor: Optional[Executor] = None
+        
+        # Budget for the hierarchical, iterative and debate chains
+        self.chain_budget = ChainBudget(
+            wall_clock_seconds=float(os.getenv('ULTRA_THINKING_CHAIN_BUDGET_SECONDS', '300')),
+            max_steps=int(os.getenv('ULTRA_THINKING_MAX_CHAIN_STEPS', '20')),
+            max_rounds=int(os.getenv('ULTRA_THINKING_MAX_ROUNDS', '3')),
+            convergence_delta=float(os.getenv('ULTRA_THINKING_CONVERGENCE_DELTA', '0.02'))
+        )
+        
         # Define reasoning chain templates
         self.reasoning_templates = {
             AnalysisDepth.RAPID: {
@@ -173,6 +348,9 @@ class UltraThinkingOrchestrator:
         analysis_id = f"ultra_thinking_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         try:
+            # Normalize the content once; every agent in the chain shares the corpus
+            content = ContentCorpus.of(content, topics)
+            
             # Design reasoning chain
             reasoning_chain = await self._design_reasoning_chain(
                 analysis_id, content, topics, analysis_depth, chain_type, custom_workflow
@@ -279,18 +457,19 @@ class UltraThinkingOrchestrator:
             execution_results = await self._execute_sequential_chain(reasoning_chain, step_outputs)
         elif reasoning_chain.chain_type == ReasoningChainType.PARALLEL:
             execution_results = await self._execute_parallel_chain(reasoning_chain, step_outputs)
-        elif reasoning_chain.chain_type == ReasoningChainType.HIERARCHICAL:
-            # Disable hierarchical chain due to performance issues
-            logger.warning("Ultra-thinking hierarchical chain disabled due to performance issues")
-            execution_results = {"error": "Hierarchical chain disabled", "status": "disabled"}
-        elif reasoning_chain.chain_type == ReasoningChainType.ITERATIVE:
-            # Disable iterative chain due to performance issues
-            logger.warning("Ultra-thinking iterative chain disabled due to performance issues")
-            execution_results = {"error": "Iterative chain disabled", "status": "disabled"}
-        elif reasoning_chain.chain_type == ReasoningChainType.DEBATE:
-            # Disable debate chain due to performance issues
-            logger.warning("Ultra-thinking debate chain disabled due to performance issues")
-            execution_results = {"error": "Debate chain disabled", "status": "disabled"}
+        else:
+            # Multi-round chain types run under the chain budget
+            scheduler = ChainScheduler(self, self.chain_budget)
+            if reasoning_chain.chain_type == ReasoningChainType.HIERARCHICAL:
+                execution_results = await self._execute_hierarchical_chain(reasoning_chain, step_outputs, scheduler)
+            elif reasoning_chain.chain_type == ReasoningChainType.ITERATIVE:
+                execution_results = await self._execute_iterative_chain(reasoning_chain, step_outputs, scheduler)
+            elif reasoning_chain.chain_type == ReasoningChainType.DEBATE:
+                execution_results = await self._execute_debate_chain(reasoning_chain, step_outputs, scheduler)
+            
+            reasoning_chain.execution_metadata["scheduler"] = scheduler.summary()
+            reasoning_chain.execution_metadata["step_count"] = len(reasoning_chain.reasoning_steps)
+            logger.info(f"{reasoning_chain.chain_type.value} chain finished: {scheduler.summary()}")
         
         # Update reasoning chain with results
         reasoning_chain.synthesis_result = execution_results
@@ -325,14 +504,21 @@ class UltraThinkingOrchestrator:
                     step.agent_role, enhanced_input
                 )
                 
-                # Store results
                 step.output_data = agent_result
+                step.execution_time = (datetime.now() - start_time).total_seconds()
+                
+                # Failed or timed-out steps are left out of downstream context
+                if "error" in agent_result:
+                    logger.warning(f"Step {step.step_id} failed: {agent_result.get('error')}")
+                    step.status = "failed"
+                    continue
+                
+                # Store results
                 step_outputs[step.step_id] = agent_result
                 execution_results[step.agent_role.value] = agent_result
                 
                 step.status = "completed"
                 step.confidence_score = self._extract_confidence_score(agent_result)
-                step.execution_time = (datetime.now() - start_time).total_seconds()
                 
                 logger.info(f"Completed {step.agent_role.value} with {step.confidence_score:.1%} confidence")
                 
@@ -368,18 +554,122 @@ class UltraThinkingOrchestrator:
             # Wait for all steps in this level to complete
             level_results = await asyncio.gather(*level_tasks, return_exceptions=True)
             
-            # Process results
+            # Process results - failed or timed-out steps are left out of downstream context
             for step, result in zip(steps, level_results):
                 if isinstance(result, Exception):
                     logger.error(f"Step {step.step_id} failed: {str(result)}")
                     step.status = "failed"
                     step.output_data = {"error": str(result)}
+                elif step.status == "failed":
+                    logger.warning(f"Step {step.step_id} failed: {result.get('error')}")
                 else:
                     step_outputs[step.step_id] = result
                     execution_results[step.agent_role.value] = result
         
         return execution_results
 
+    async def _execute_hierarchical_chain(
+        self, 
+        reasoning_chain: ReasoningChain, 
+        step_outputs: Dict[str, Any],
+        scheduler: ChainScheduler
+    ) -> Dict[str, Any]:
+        """Execute tiers top-down; steps within a tier run concurrently"""
+        
+        execution_results = {}
+        
+        for level, steps in self._group_steps_by_dependencies(reasoning_chain.reasoning_steps).items():
+            logger.info(f"Executing hierarchical tier {level} with {len(steps)} steps")
+            scheduler.rounds += 1
+            
+            level_results = await asyncio.gather(*(scheduler.run_step(step, step_outputs) for step in steps))
+            for step, result in zip(steps, level_results):
+                if result is not None:
+                    execution_results[step.agent_role.value] = result
+        
+        return execution_results
+
+    async def _execute_iterative_chain(
+        self, 
+        reasoning_chain: ReasoningChain, 
+        step_outputs: Dict[str, Any],
+        scheduler: ChainScheduler
+    ) -> Dict[str, Any]:
+        """Repeat the agent sequence, each round refining the previous one, until confidence converges"""
+        
+        execution_results = {}
+        round_steps = list(reasoning_chain.reasoning_steps)
+        previous_confidence = None
+        
+        for round_number in range(1, self.chain_budget.max_rounds + 1):
+            if round_number > 1:
+                if not scheduler.can_afford(len(round_steps)):
+                    break
+                round_steps = self._create_iteration_round(round_steps, round_number)
+                reasoning_chain.reasoning_steps.extend(round_steps)
+            
+            logger.info(f"Executing iterative round {round_number} with {len(round_steps)} steps")
+            scheduler.rounds = round_number
+            
+            for step in round_steps:
+                result = await scheduler.run_step(step, step_outputs)
+                if result is not None:
+                    execution_results[step.agent_role.value] = result
+            
+            round_confidence = self._calculate_chain_confidence(round_steps)
+            if scheduler.stop_reason or scheduler.converged(previous_confidence, round_confidence):
+                break
+            previous_confidence = round_confidence
+        
+        return execution_results
+
+    async def _execute_debate_chain(
+        self, 
+        reasoning_chain: ReasoningChain, 
+        step_outputs: Dict[str, Any],
+        scheduler: ChainScheduler
+    ) -> Dict[str, Any]:
+        """Debaters state positions, then rebut each other until confidence converges; the executive agent judges"""
+        
+        execution_results = {}
+        debate_steps = [step for step in reasoning_chain.reasoning_steps if step.agent_role != AgentRole.EXECUTIVE_DECISION]
+        judge = next((step for step in reasoning_chain.reasoning_steps if step.agent_role == AgentRole.EXECUTIVE_DECISION), None)
+        judge_cost = 1 if judge else 0
+        
+        round_steps = debate_steps
+        previous_confidence = None
+        
+        for round_number in range(1, self.chain_budget.max_rounds + 1):
+            if round_number > 1:
+                # Always keep room for the judge
+                if not scheduler.can_afford(len(round_steps) + judge_cost):
+                    break
+                round_steps = self._create_rebuttal_round(round_steps, round_number)
+                debate_steps.extend(round_steps)
+            
+            logger.info(f"Executing debate round {round_number} with {len(round_steps)} debaters")
+            scheduler.rounds = round_number
+            
+            round_results = await asyncio.gather(*(scheduler.run_step(step, step_outputs) for step in round_steps))
+            for step, result in zip(round_steps, round_results):
+                if result is not None:
+                    execution_results[step.agent_role.value] = result
+            
+            round_confidence = self._calculate_chain_confidence(round_steps)
+            if scheduler.stop_reason or scheduler.converged(previous_confidence, round_confidence):
+                break
+            previous_confidence = round_confidence
+        
+        if judge:
+            # The judge weighs every debater's final position
+            judge.dependencies = [step.step_id for step in round_steps]
+            result = await scheduler.run_step(judge, step_outputs)
+            if result is not None:
+                execution_results[judge.agent_role.value] = result
+        
+        reasoning_chain.reasoning_steps = debate_steps + ([judge] if judge else [])
+        return execution_results
+
     async def _execute_single_step(
         self, 
         step: ReasoningStep, 
@@ -401,7 +691,7 @@ class UltraThinkingOrchestrator:
             
             # Update step
             step.output_data = result
-            step.status = "completed"
+            step.status = "failed" if "error" in result else "completed"
             step.confidence_score = self._extract_confidence_score(result)
             step.execution_time = (datetime.now() - start_time).total_seconds()
             
@@ -415,42 +705,64 @@ class UltraThinkingOrchestrator:
     async def _execute_agent_analysis(
         self, 
         agent_role: AgentRole, 
-        input_data: Dict[str, Any]
+        input_data: Dict[str, Any],
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
-        """Execute analysis for specific agent"""
+        """Execute analysis for specific agent in the step pool, bounded by the step timeout
+        
+        The agents are synchronous and CPU-bound, so calling them inline would
+        block the event loop. Only the "process" pool runs the steps of one
+        level on several cores; with threads they take turns on the GIL. A step
+        that times out is cancelled if it has not started yet; a running worker
+        cannot be interrupted, so its result is simply discarded.
+        """
+        
+        if agent_role not in AGENT_METHODS:
+            raise ValueError(f"Unknown agent role: {agent_role}")
         
-        agent = self.agents[agent_role]
         content = input_data.get("content", {})
         topics = input_data.get("topics", [])
         
+        # Thread workers share the orchestrator's agents; process workers build their own
+        agent = self.agents[agent_role] if self.step_pool_kind != "process" else None
+        future = self._get_step_executor().submit(_run_agent_step, agent_role.value, content, topics, agent)
+        timeout = self.step_timeout_seconds if timeout is None else max(timeout, 0.0)
+        
         try:
-            if agent_role == AgentRole.STRATEGIC_INTELLIGENCE:
-                result = agent.ultra_analyze_content(content, topics)
-                return asdict(result)
-                
-            elif agent_role == AgentRole.COMPETITIVE_INTELLIGENCE:
-                result = agent.ultra_analyze_competitive_landscape(content, topics)
-                return asdict(result)
-                
-            elif agent_role == AgentRole.RISK_ASSESSMENT:
-                result = agent.ultra_assess_risks(content, topics)
-                return asdict(result)
-                
-            elif agent_role == AgentRole.MARKET_PREDICTION:
-                result = agent.ultra_predict_markets(content, topics)
-                return asdict(result)
-                
-            elif agent_role == AgentRole.EXECUTIVE_DECISION:
-                result = agent.ultra_executive_analysis(content, topics)
-                return asdict(result)
-                
-            else:
-                raise ValueError(f"Unknown agent role: {agent_role}")
-                
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+            
+        except asyncio.TimeoutError:
+            future.cancel()
+            logger.error(f"Agent {agent_role.value} analysis timed out after {timeout:g}s")
+            return {"error": f"timed out after {timeout:g}s", "agent": agent_role.value, "timed_out": True}
+            
+        except asyncio.CancelledError:
+            # Chain cancelled by the caller - don't leave queued steps behind
+            future.cancel()
+            raise
+            
         except Exception as e:
             logger.error(f"Agent {agent_role.value} analysis failed: {str(e)}")
             return {"error": str(e), "agent": agent_role.value}
 
+    def _get_step_executor(self) -> Executor:
+        """Lazily create the configured step pool"""
+        if self._step_executor is None:
+            if self.step_pool_kind == "process":
+                self._step_executor = ProcessPoolExecutor(max_workers=self.step_workers)
+            else:
+                self._step_executor = ThreadPoolExecutor(
+                    max_workers=self.step_workers, thread_name_prefix="ultra-step"
+                )
+            logger.info(f"{self.orchestrator_name}: {self.step_pool_kind} step pool with {self.step_workers} workers")
+        return self._step_executor
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Release the step pool, cancelling steps that have not started"""
+        if self._step_executor is not None:
+            self._step_executor.shutdown(wait=wait, cancel_futures=True)
+            self._step_executor = None
+
     async def _synthesize_cross_agent_insights(
         self,
         execution_results: Dict[str, Any],
@@ -517,6 +829,139 @@ class UltraThinkingOrchestrator:
             "confidence": self._calculate_synthesis_confidence(execution_results)
         }
 
+    def _synthesize_strategic_competitive(
+        self, 
+        execution_results: Dict[str, Any], 
+        topics: List[str]
+    ) -> Dict[str, Any]:
+        """Strategic direction checked against the competitive landscape"""
+        
+        strategic_insights = self._extract_strategic_insights(execution_results.get("strategic_intelligence"))
+        competitive_insights = self._extract_competitive_insights(execution_results.get("competitive_intelligence"))
+        
+        insights = [
+            f"🧠 **Strategic-Competitive Synthesis**: {strategic_insights[0] if strategic_insights else 'Strategic analysis'} + {competitive_insights[0] if competitive_insights else 'Competitive analysis'}"
+        ]
+        insights.extend(f"⚔️ **Competitive Move**: {insight}" for insight in competitive_insights[1:3])
+        
+        return self._pattern_synthesis("strategic_competitive", insights, execution_results, topics)
+
+    def _synthesize_risk_prediction(
+        self, 
+        execution_results: Dict[str, Any], 
+        topics: List[str]
+    ) -> Dict[str, Any]:
+        """Market outlook weighed against the risks that could derail it"""
+        
+        risk_insights = self._extract_risk_insights(execution_results.get("risk_assessment"))
+        market_insights = self._extract_market_insights(execution_results.get("market_prediction"))
+        
+        insights = [
+            f"⚖️ **Risk-Prediction Balance**: {risk_insights[0] if risk_insights else 'Risk assessment'} balanced with {market_insights[0] if market_insights else 'Market prediction'}"
+        ]
+        insights.extend(f"🛡️ **Risk Watch**: {insight}" for insight in risk_insights[1:3])
+        
+        return self._pattern_synthesis("risk_prediction", insights, execution_results, topics)
+
+    def _synthesize_competitive_market(
+        self, 
+        execution_results: Dict[str, Any], 
+        topics: List[str]
+    ) -> Dict[str, Any]:
+        """Competitive positioning read against where the market is heading"""
+        
+        competitive_insights = self._extract_competitive_insights(execution_results.get("competitive_intelligence"))
+        market_insights = self._extract_market_insights(execution_results.get("market_prediction"))
+        
+        insights = [
+            f"📈 **Competitive-Market Outlook**: {competitive_insights[0] if competitive_insights else 'Competitive analysis'} as {market_insights[0] if market_insights else 'Market prediction'}"
+        ]
+        insights.extend(f"💡 **Market Opportunity**: {insight}" for insight in market_insights[1:3])
+        
+        return self._pattern_synthesis("competitive_market", insights, execution_results, topics)
+
+    def _basic_synthesis(
+        self, 
+        execution_results: Dict[str, Any], 
+        topics: List[str]
+    ) -> Dict[str, Any]:
+        """Top insight of each agent that ran, without cross-agent pairing"""
+        
+        extractors = {
+            "strategic_intelligence": self._extract_strategic_insights,
+            "competitive_intelligence": self._extract_competitive_insights,
+            "risk_assessment": self._extract_risk_insights,
+            "market_prediction": self._extract_market_insights,
+            "executive_decision": self._extract_executive_insights
+        }
+        
+        insights = []
+        for agent, result in execution_results.items():
+            agent_insights = extractors[agent](result) if agent in extractors else []
+            if agent_insights:
+                insights.append(f"🔍 **{agent.replace('_', ' ').title()}**: {agent_insights[0]}")
+        
+        return self._pattern_synthesis("basic", insights, execution_results, topics)
+
+    def _pattern_synthesis(
+        self, 
+        synthesis_type: str, 
+        insights: List[str], 
+        execution_results: Dict[str, Any], 
+        topics: List[str]
+    ) -> Dict[str, Any]:
+        """Add the per-topic lines and wrap insights in the synthesis result shape"""
+        
+        for topic in topics[:3]:
+            topic_synthesis = self._synthesize_topic_across_agents(topic, execution_results)
+            if topic_synthesis:
+                insights.append(f"🎯 **{topic} Analysis**: {topic_synthesis}")
+        
+        return {
+            "insights": insights,
+            "synthesis_type": synthesis_type,
+            "agent_count": len(execution_results),
+            "confidence": self._calculate_synthesis_confidence(execution_results)
+        }
+
+    def _synthesize_topic_across_agents(self, topic: str, execution_results: Dict[str, Any]) -> Optional[str]:
+        """Which agents' findings mention the topic; None if none do"""
+        
+        needle = topic.lower()
+        agents = [
+            agent for agent, result in execution_results.items()
+            if needle in json.dumps(result, default=str).lower()
+        ]
+        if not agents:
+            return None
+        return f"covered by {len(agents)}/{len(execution_results)} agents ({', '.join(agents)})"
+
+    def _extract_strategic_insights(self, result: Optional[Dict[str, Any]]) -> List[str]:
+        """Executive summary and key themes of the strategic analysis"""
+        analysis = result.get("strategic_intelligence") if isinstance(result, dict) else None
+        brief = analysis.get("executive_brief") if isinstance(analysis, dict) else None
+        if not isinstance(brief, dict):
+            return []
+        summary = brief.get("executive_summary")
+        return ([str(summary)] if summary else []) + [str(theme) for theme in brief.get("key_strategic_themes", [])]
+
+    def _extract_competitive_insights(self, result: Optional[Dict[str, Any]]) -> List[str]:
+        return self._result_strings(result, "strategic_recommendations")
+
+    def _extract_risk_insights(self, result: Optional[Dict[str, Any]]) -> List[str]:
+        return self._result_strings(result, "strategic_recommendations")
+
+    def _extract_market_insights(self, result: Optional[Dict[str, Any]]) -> List[str]:
+        return self._result_strings(result, "strategic_recommendations")
+
+    def _extract_executive_insights(self, result: Optional[Dict[str, Any]]) -> List[str]:
+        return self._result_strings(result, "executive_recommendations")
+
+    @staticmethod
+    def _result_strings(result: Optional[Dict[str, Any]], field: str) -> List[str]:
+        values = result.get(field) if isinstance(result, dict) else None
+        return [str(value) for value in values] if isinstance(values, list) else []
+
     async def _generate_ultra_recommendations(
         self,
         synthesis_result: Dict[str, Any],
@@ -585,6 +1030,186 @@ class UltraThinkingOrchestrator:
         
         return steps
 
+    def _create_parallel_steps(
+        self, 
+        agent_sequence: List[AgentRole], 
+        content: Dict[str, Any], 
+        topics: List[str]
+    ) -> List[ReasoningStep]:
+        """Create parallel reasoning steps - analysts run side by side, the executive step waits for all of them"""
+        
+        analyst_ids = [
+            f"step_{i}" for i, agent_role in enumerate(agent_sequence)
+            if agent_role != AgentRole.EXECUTIVE_DECISION
+        ]
+        steps = []
+        
+        for i, agent_role in enumerate(agent_sequence):
+            dependencies = analyst_ids if agent_role == AgentRole.EXECUTIVE_DECISION else []
+            
+            step = ReasoningStep(
+                step_id=f"step_{i}",
+                agent_role=agent_role,
+                input_data={"content": content, "topics": topics},
+                output_data=None,
+                dependencies=list(dependencies),
+                reasoning_context=f"Parallel analysis step {i+1}/{len(agent_sequence)}",
+                confidence_score=0.0,
+                execution_time=0.0,
+                status="pending"
+            )
+            steps.append(step)
+        
+        return steps
+
+    def _create_hierarchical_steps(
+        self, 
+        agent_sequence: List[AgentRole], 
+        content: Dict[str, Any], 
+        topics: List[str]
+    ) -> List[ReasoningStep]:
+        """Create tiered steps - intelligence gathering, then risk/market outlook, then the executive decision"""
+        
+        tiers = {
+            AgentRole.STRATEGIC_INTELLIGENCE: 0,
+            AgentRole.COMPETITIVE_INTELLIGENCE: 0,
+            AgentRole.RISK_ASSESSMENT: 1,
+            AgentRole.MARKET_PREDICTION: 1,
+            AgentRole.EXECUTIVE_DECISION: 2
+        }
+        ordered = sorted(enumerate(agent_sequence), key=lambda item: (tiers.get(item[1], 0), item[0]))
+        steps = []
+        
+        for i, agent_role in ordered:
+            tier = tiers.get(agent_role, 0)
+            # Each tier builds on everything from the tiers above it
+            dependencies = [step.step_id for step in steps if tiers.get(step.agent_role, 0) < tier]
+            
+            step = ReasoningStep(
+                step_id=f"step_{i}",
+                agent_role=agent_role,
+                input_data={"content": content, "topics": topics},
+                output_data=None,
+                dependencies=dependencies,
+                reasoning_context=f"Hierarchical analysis tier {tier + 1}",
+                confidence_score=0.0,
+                execution_time=0.0,
+                status="pending"
+            )
+            steps.append(step)
+        
+        return steps
+
+    def _create_iterative_steps(
+        self, 
+        agent_sequence: List[AgentRole], 
+        content: Dict[str, Any], 
+        topics: List[str]
+    ) -> List[ReasoningStep]:
+        """Create the first iteration round; later rounds are added while the chain runs"""
+        
+        steps = self._create_sequential_steps(agent_sequence, content, topics)
+        for step in steps:
+            step.reasoning_context = f"Iterative refinement round 1: {step.reasoning_context}"
+        return steps
+
+    def _create_iteration_round(self, previous_round: List[ReasoningStep], round_number: int) -> List[ReasoningStep]:
+        """Next iteration round - each agent sees its own previous output and the step before it"""
+        
+        steps = []
+        
+        for i, previous in enumerate(previous_round):
+            dependencies = [previous.step_id] + ([steps[-1].step_id] if steps else [])
+            
+            step = ReasoningStep(
+                step_id=f"round{round_number}_step_{i}",
+                agent_role=previous.agent_role,
+                input_data=previous.input_data,
+                output_data=None,
+                dependencies=dependencies,
+                reasoning_context=f"Iterative refinement round {round_number}, step {i+1}/{len(previous_round)}",
+                confidence_score=0.0,
+                execution_time=0.0,
+                status="pending"
+            )
+            steps.append(step)
+        
+        return steps
+
+    def _create_debate_steps(
+        self, 
+        agent_sequence: List[AgentRole], 
+        content: Dict[str, Any], 
+        topics: List[str]
+    ) -> List[ReasoningStep]:
+        """Create opening positions for each debater, with the executive agent (if present) as judge"""
+        
+        steps = []
+        judge = None
+        
+        for i, agent_role in enumerate(agent_sequence):
+            step = ReasoningStep(
+                step_id=f"step_{i}",
+                agent_role=agent_role,
+                input_data={"content": content, "topics": topics},
+                output_data=None,
+                dependencies=[],
+                reasoning_context="Debate judgement" if agent_role == AgentRole.EXECUTIVE_DECISION else "Debate opening position",
+                confidence_score=0.0,
+                execution_time=0.0,
+                status="pending"
+            )
+            if agent_role == AgentRole.EXECUTIVE_DECISION:
+                judge = step
+            else:
+                steps.append(step)
+        
+        if judge:
+            judge.dependencies = [step.step_id for step in steps]
+            steps.append(judge)
+        
+        return steps
+
+    def _create_rebuttal_round(self, previous_round: List[ReasoningStep], round_number: int) -> List[ReasoningStep]:
+        """Next debate round - each debater responds to every other debater's latest position"""
+        
+        steps = []
+        
+        for i, previous in enumerate(previous_round):
+            step = ReasoningStep(
+                step_id=f"round{round_number}_step_{i}",
+                agent_role=previous.agent_role,
+                input_data=previous.input_data,
+                output_data=None,
+                dependencies=[other.step_id for other in previous_round],
+                reasoning_context=f"Debate rebuttal round {round_number}",
+                confidence_score=0.0,
+                execution_time=0.0,
+                status="pending"
+            )
+            steps.append(step)
+        
+        return steps
+
+    def _group_steps_by_dependencies(self, steps: List[ReasoningStep]) -> Dict[int, List[ReasoningStep]]:
+        """Group steps into levels - each level only depends on earlier levels"""
+        
+        step_levels = {}
+        levels: Dict[int, List[ReasoningStep]] = {}
+        
+        # Steps are created after their dependencies, so a single pass is enough
+        for step in steps:
+            level = 1 + max((step_levels[dep] for dep in step.dependencies if dep in step_levels), default=-1)
+            step_levels[step.step_id] = level
+            levels.setdefault(level, []).append(step)
+        
+        return dict(sorted(levels.items()))
+
+    def _calculate_chain_confidence(self, steps: List[ReasoningStep]) -> float:
+        """Average confidence of the steps that completed"""
+        completed = [step.confidence_score for step in steps if step.status == "completed"]
+        return sum(completed) / len(completed) if completed else 0.0
+
     def _extract_confidence_score(self, result: Dict[str, Any]) -> float:
         """Extract confidence score from agent result"""
         if isinstance(result, dict):
@@ -654,6 +1279,32 @@ class UltraThinkingOrchestrator:
         
         return enhanced_input
 
+    def _with_dependency_findings(self, enhanced_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Fold the dependency outputs into the content the agent analyses
+        
+        Agents only read content and topics, so this is how a refinement round
+        or a rebuttal sees earlier findings. They become part of the corpus and
+        of its digest, so a step is replayed from the memo only when what it
+        would read is unchanged - a round that reproduces the last one's findings.
+        """
+        findings = []
+        for output in enhanced_input.get("dependency_context", {}).values():
+            texts = (
+                self._extract_strategic_insights(output)
+                + self._result_strings(output, "strategic_recommendations")
+                + self._result_strings(output, "executive_recommendations")
+            )
+            if texts:
+                findings.append({"content": " ".join(texts)})
+        
+        if not findings:
+            return enhanced_input
+        
+        topics = enhanced_input.get("topics", [])
+        content = dict(enhanced_input.get("content", {}))
+        content["agent_findings"] = findings
+        return {**enhanced_input, "content": ContentCorpus(content, topics)}
+
     def export_ultra_thinking_result(self, result: UltraThinkingResult) -> Dict[str, Any]:
         """Export ultra-thinking result in structured format"""
         return {
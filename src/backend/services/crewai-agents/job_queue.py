@@ -0,0 +1,164 @@
+"""
+Background Job Queue
+Bounded worker pool for long-running crew executions: submissions return a
+job ID immediately, results are polled (or long-polled) by ID, and queue depth
+and concurrency limits give callers backpressure instead of stuck workers
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at max depth"""
+
+
+@dataclass
+class Job:
+    """A queued crew execution; status is queued, running, completed or failed"""
+    id: str
+    func: Callable[..., Any]
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    status: str = 'queued'
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        def iso(ts):
+            return datetime.fromtimestamp(ts).isoformat() if ts else None
+
+        data = {
+            'job_id': self.id,
+            'status': self.status,
+            'created_at': iso(self.created_at),
+            'started_at': iso(self.started_at),
+            'finished_at': iso(self.finished_at),
+            'error': self.error
+        }
+        if self.finished_at and self.started_at:
+            data['duration_seconds'] = round(self.finished_at - self.started_at, 2)
+        if include_result and self.status == 'completed':
+            data['result'] = self.result
+        return data
+
+
+class JobQueue:
+    """Fixed-size worker pool fed by a bounded FIFO queue
+
+    Workers are started lazily on first submit (and again after a fork, so each
+    gunicorn worker gets its own pool). Finished jobs are kept for
+    `result_ttl_seconds` so clients can collect results, then dropped.
+    """
+
+    def __init__(self, worker_count: int = 2, max_queue_depth: int = 10, result_ttl_seconds: float = 1800.0):
+        self.worker_count = max(1, worker_count)
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.result_ttl_seconds = result_ttl_seconds
+        self._jobs: Dict[str, Job] = {}
+        self._finished = deque()  # (finished_at, job_id) in completion order
+        self._queue: 'queue.Queue[Job]' = queue.Queue(maxsize=self.max_queue_depth)
+        self._lock = threading.Lock()
+        self._workers = []
+        self._pid = None
+        self._running = 0
+
+    def _ensure_workers(self) -> None:
+        if self._pid == os.getpid():
+            return
+        self._queue = queue.Queue(maxsize=self.max_queue_depth)
+        self._workers = []
+        self._running = 0
+        for i in range(self.worker_count):
+            worker = threading.Thread(target=self._work, name=f'job-worker-{i}', daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        self._pid = os.getpid()
+        logger.info(f"🧵 Job queue started: {self.worker_count} workers, max queue depth {self.max_queue_depth}")
+
+    def submit(self, func: Callable[..., Any], *args, job_id: Optional[str] = None, **kwargs) -> Job:
+        """Queue func(*args, **kwargs); raises QueueFullError when at max depth"""
+        job = Job(id=job_id or f"job_{uuid.uuid4().hex[:16]}", func=func, args=args, kwargs=kwargs)
+        with self._lock:
+            self._ensure_workers()
+            self._prune_finished()
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                raise QueueFullError(f"Job queue is full ({self.max_queue_depth} jobs waiting)")
+            self._jobs[job.id] = job
+        logger.info(f"📥 Queued job {job.id} ({self._queue.qsize()} waiting, {self._running} running)")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until the job finishes or the timeout passes; returns the job either way"""
+        job = self.get(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'workers': self.worker_count,
+                'running': self._running,
+                'queued': self._queue.qsize(),
+                'max_queue_depth': self.max_queue_depth,
+                'tracked_jobs': len(self._jobs)
+            }
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                self._running += 1
+            job.status = 'running'
+            job.started_at = time.time()
+            try:
+                job.result = job.func(*job.args, **job.kwargs)
+                job.status = 'completed'
+            except Exception as e:
+                logger.error(f"❌ Job {job.id} failed: {str(e)}")
+                job.error = str(e)
+                job.status = 'failed'
+            finally:
+                job.finished_at = time.time()
+                with self._lock:
+                    self._running -= 1
+                    self._finished.append((job.finished_at, job.id))
+                job.done.set()
+                self._queue.task_done()
+                logger.info(f"✅ Job {job.id} {job.status} in {job.finished_at - job.started_at:.1f}s")
+
+    def _prune_finished(self) -> None:
+        # Completion order == expiry order, so only expired entries are touched
+        cutoff = time.time() - self.result_ttl_seconds
+        while self._finished and self._finished[0][0] < cutoff:
+            _, job_id = self._finished.popleft()
+            self._jobs.pop(job_id, None)
+
+
+def create_job_queue_from_env() -> JobQueue:
+    return JobQueue(
+        worker_count=int(os.getenv('GATHER_NEWS_WORKERS', '2')),
+        max_queue_depth=int(os.getenv('GATHER_NEWS_MAX_QUEUE', '10')),
+        result_ttl_seconds=float(os.getenv('GATHER_NEWS_JOB_TTL_SECONDS', '1800'))
+    )
@@ -6,13 +6,11 @@ Synapse CrewAI Agent Service
 import os
 import json
 from typing import Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
 import logging
-import threading
-import time
 from crewai import Agent, Task, Crew, Process
 import yaml
 
@@ -26,41 +24,9 @@ app = Flask(__name__)
 CORS(app, origins=["http://localhost:3000", "https://synapse-frontend.onrender.com", "https://*.onrender.com"])
 
 # --- Progress Storage ---
-class ProgressStore:
-    def __init__(self, expiration_minutes=30):
-        self.store = {}
-        self.expiration = timedelta(minutes=expiration_minutes)
-        self.lock = threading.Lock()
-        self._start_cleanup_thread()
-
-    def set(self, key: str, data: Dict[str, Any]):
-        with self.lock:
-            self.store[key] = {'data': data, 'timestamp': datetime.now()}
-
-    def get(self, key: str) -> Dict[str, Any]:
-        with self.lock:
-            entry = self.store.get(key)
-            if entry and (datetime.now() - entry['timestamp']) < self.expiration:
-                return entry['data']
-            elif entry:
-                del self.store[key] # Expired
-        return {}
-
-    def _cleanup_expired(self):
-        while True:
-            time.sleep(60)
-            with self.lock:
-                expired_keys = [k for k, v in self.store.items() if (datetime.now() - v['timestamp']) > self.expiration]
-                for k in expired_keys:
-                    del self.store[k]
-                if expired_keys:
-                    logger.info(f"Cleaned up {len(expired_keys)} expired progress entries.")
-
-    def _start_cleanup_thread(self):
-        thread = threading.Thread(target=self._cleanup_expired, daemon=True)
-        thread.start()
-
-progress_store = ProgressStore()
+# In-memory by default; PROGRESS_BACKEND=redis shares sessions across gunicorn workers
+from progress_store import create_progress_store_from_env
+progress_store = create_progress_store_from_env()
 
 # --- Configuration & Tools ---
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
@@ -414,7 +380,7 @@ class SynapseNewsCrew:
 def run_crew(agent_id: str, topic: str, date_context: dict, custom_goal: str = None) -> Dict[str, Any]:
     """Runs the research and analysis crew with social media scraping."""
     session_id = f"{agent_id}-{int(datetime.now().timestamp())}"
-    progress_store.set(session_id, {'status': 'starting', 'message': 'Crew execution started.', 'progress': 0})
+    progress_store.set_progress(session_id, {'status': 'starting', 'message': 'Crew execution started.', 'progress': 0})
 
     try:
         # Parse topics (handle both single topic and comma-separated)
@@ -426,19 +392,19 @@ def run_crew(agent_id: str, topic: str, date_context: dict, custom_goal: str = N
         # Create clean topic string for display
         clean_topic_string = ', '.join(topics)
         
-        progress_store.set(session_id, {'status': 'running', 'message': 'Gathering social media content...', 'progress': 10})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': 'Gathering social media content...', 'progress': 10})
         
         # Gather social media content with detailed progress
         logger.info(f"🔄 Starting social media scraping for topics: {topics}")
-        progress_store.set(session_id, {'status': 'running', 'message': '📱 Scraping Reddit discussions...', 'progress': 12})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '📱 Scraping Reddit discussions...', 'progress': 12})
         reddit_posts = scrape_reddit_posts(topics, max_posts=5)
         logger.info(f"✅ Reddit: Found {len(reddit_posts)} posts")
         
-        progress_store.set(session_id, {'status': 'running', 'message': '💼 Gathering LinkedIn insights...', 'progress': 15})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '💼 Gathering LinkedIn insights...', 'progress': 15})
         linkedin_posts = scrape_linkedin_posts(topics, max_posts=3)
         logger.info(f"✅ LinkedIn: Found {len(linkedin_posts)} insights")
         
-        progress_store.set(session_id, {'status': 'running', 'message': '📢 Monitoring Telegram channels...', 'progress': 18})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '📢 Monitoring Telegram channels...', 'progress': 18})
         telegram_messages = scrape_telegram_messages(topics, max_messages=3)
         logger.info(f"✅ Telegram: Found {len(telegram_messages)} messages")
         
@@ -450,7 +416,7 @@ def run_crew(agent_id: str, topic: str, date_context: dict, custom_goal: str = N
         }
         logger.info(f"Social media content gathered: {social_content_summary}")
         
-        progress_store.set(session_id, {'status': 'running', 'message': 'Starting AI research crew...', 'progress': 25})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': 'Starting AI research crew...', 'progress': 25})
         
         # Create enhanced research task with social media context
         social_context = ""
@@ -476,26 +442,26 @@ def run_crew(agent_id: str, topic: str, date_context: dict, custom_goal: str = N
         synapse_crew = SynapseNewsCrew(topic, date_context, social_context, custom_goal)
         news_crew = synapse_crew.create_crew()
 
-        progress_store.set(session_id, {'status': 'running', 'message': 'Crew is researching and analyzing.', 'progress': 50})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': 'Crew is researching and analyzing.', 'progress': 50})
         
         # Add detailed agent progress logging
         logger.info("🤖 Agent 1: Expert Researcher is analyzing web sources...")
-        progress_store.set(session_id, {'status': 'running', 'message': '🔍 Agent 1: Expert Researcher is scanning multiple sources...', 'progress': 55})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '🔍 Agent 1: Expert Researcher is scanning multiple sources...', 'progress': 55})
         
         logger.info("🔍 Agent 1: Expert Researcher is validating content quality...")
-        progress_store.set(session_id, {'status': 'running', 'message': '🔍 Agent 1: Expert Researcher is validating content quality...', 'progress': 65})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '🔍 Agent 1: Expert Researcher is validating content quality...', 'progress': 65})
         
         logger.info("📈 Agent 2: Senior News Analyst is processing findings...")
-        progress_store.set(session_id, {'status': 'running', 'message': '📈 Agent 2: Senior News Analyst is processing findings...', 'progress': 75})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '📈 Agent 2: Senior News Analyst is processing findings...', 'progress': 75})
         
         logger.info("🧠 AI agents are processing content and matching topics...")
-        progress_store.set(session_id, {'status': 'running', 'message': '🧠 AI agents are processing content and matching topics...', 'progress': 80})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '🧠 AI agents are processing content and matching topics...', 'progress': 80})
         
         logger.info("⚡ Agents are now generating comprehensive analysis...")
-        progress_store.set(session_id, {'status': 'running', 'message': '⚡ Agents are now generating comprehensive analysis...', 'progress': 85})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': '⚡ Agents are now generating comprehensive analysis...', 'progress': 85})
         
         result = news_crew.kickoff()
-        progress_store.set(session_id, {'status': 'running', 'message': 'Finalizing report with social media insights.', 'progress': 90})
+        progress_store.set_progress(session_id, {'status': 'running', 'message': 'Finalizing report with social media insights.', 'progress': 90})
         
         # Process and format the crew result
         if result is not None:
@@ -537,7 +503,7 @@ def run_crew(agent_id: str, topic: str, date_context: dict, custom_goal: str = N
             
             final_report += social_section
         
-        progress_store.set(session_id, {'status': 'completed', 'message': 'Crew finished execution with social media insights.', 'progress': 100})
+        progress_store.set_progress(session_id, {'status': 'completed', 'message': 'Crew finished execution with social media insights.', 'progress': 100})
         
         return {
             "status": "success", 
@@ -565,7 +531,7 @@ def run_crew(agent_id: str, topic: str, date_context: dict, custom_goal: str = N
 
     except Exception as e:
         logger.error(f"Error in crew execution for session {session_id}: {e}", exc_info=True)
-        progress_store.set(session_id, {'status': 'error', 'message': f"An error occurred: {e}", 'progress': 100})
+        progress_store.set_progress(session_id, {'status': 'error', 'message': f"An error occurred: {e}", 'progress': 100})
         return {"status": "error", "sessionId": session_id, "error": str(e)}
 
 
@@ -655,7 +621,7 @@ def get_progress_endpoint():
     if not session_id:
         return jsonify({"status": "error", "error": "Missing 'session_id' parameter"}), 400
     
-    progress_data = progress_store.get(session_id)
+    progress_data = progress_store.get_progress(session_id)
     if not progress_data:
         # It's possible the progress key expired or is still being created.
         # Return a pending status instead of a hard 404.
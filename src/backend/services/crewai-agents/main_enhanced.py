@@ -8,14 +8,13 @@ import os
 import sys
 import json
 from typing import Dict, List, Any, Callable
-from datetime import datetime, timedelta
-from flask import Flask, request, jsonify
+from datetime import datetime
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 import logging
-import threading
 import time
-from collections import defaultdict
+import uuid
 
 # Add current directory to Python path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -46,65 +45,16 @@ CORS(app, origins=[
     "https://*.onrender.com"  # Any Render subdomain
 ])
 
-# Progress storage with expiration
-class ProgressStore:
-    def __init__(self, expiration_minutes=30):
-        self.store = defaultdict(dict)
-        self.expiration_minutes = expiration_minutes
-        self.lock = threading.Lock()
-        
-        # Start cleanup thread
-        self.cleanup_thread = threading.Thread(target=self._cleanup_expired, daemon=True)
-        self.cleanup_thread.start()
-    
-    def set_progress(self, key: str, progress_data: Dict[str, Any]):
-        """Store progress data with expiration timestamp"""
-        with self.lock:
-            self.store[key] = {
-                'data': progress_data,
-                'timestamp': datetime.now(),
-                'expires_at': datetime.now() + timedelta(minutes=self.expiration_minutes)
-            }
-    
-    def get_progress(self, key: str) -> Dict[str, Any]:
-        """Get progress data if not expired"""
-        with self.lock:
-            if key in self.store:
-                entry = self.store[key]
-                if datetime.now() < entry['expires_at']:
-                    return entry['data']
-                else:
-                    # Expired, remove it
-                    del self.store[key]
-            return {}
-    
-    def update_progress(self, key: str, updates: Dict[str, Any]):
-        """Update existing progress data"""
-        with self.lock:
-            if key in self.store:
-                entry = self.store[key]
-                entry['data'].update(updates)
-                entry['timestamp'] = datetime.now()
-                entry['expires_at'] = datetime.now() + timedelta(minutes=self.expiration_minutes)
-    
-    def _cleanup_expired(self):
-        """Background thread to clean up expired entries"""
-        while True:
-            time.sleep(60)  # Check every minute
-            with self.lock:
-                expired_keys = []
-                for key, entry in self.store.items():
-                    if datetime.now() >= entry['expires_at']:
-                        expired_keys.append(key)
-                
-                for key in expired_keys:
-                    del self.store[key]
-                
-                if expired_keys:
-                    logger.info(f"🧹 Cleaned up {len(expired_keys)} expired progress entries")
+# Progress snapshots and per-session event streams (/progress/stream/<session_id>);
+# in-memory by default, shared across workers with PROGRESS_BACKEND=redis
+from progress_store import create_progress_store_from_env
+from progress_stream import create_progress_stream_from_env
+progress_store = create_progress_store_from_env()
+progress_stream = create_progress_stream_from_env()
 
-# Initialize global progress store
-progress_store = ProgressStore(expiration_minutes=30)
+# Bounded worker pool for /gather-news - caps concurrent crews and queue depth
+from job_queue import QueueFullError, create_job_queue_from_env
+gather_jobs = create_job_queue_from_env()
 
 # Import the enhanced crew system
 try:
@@ -148,10 +98,6 @@ class EnhancedNewsGatherer:
         self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
         self.initialization_error = None
         
-        # Progress tracking
-        self.current_progress = {}
-        self.progress_lock = threading.Lock()
-        
         # Initialize attributes to None first
         self.enhanced_crew = None
         self.dynamic_crew = None
@@ -311,8 +257,8 @@ class EnhancedNewsGatherer:
                 "news_websites": True
             }
         
-        # Generate a unique session ID for progress tracking
-        session_id = f"news_{int(time.time() * 1000)}"
+        # Use the caller's session ID (the job ID for queued requests) or generate one for progress tracking
+        session_id = kwargs.get('session_id') or f"news_{int(time.time() * 1000)}"
         
         try:
             logger.info(f"Gathering news for topics: {topics} using {self.mode} mode")
@@ -336,40 +282,8 @@ class EnhancedNewsGatherer:
             # Try enhanced multi-agent system first
             if self.enhanced_crew and self.mode == "enhanced_multi_agent":
                 try:
-                    # Create progress callback that stores to global progress store
-                    def progress_callback(progress_data):
-                        with self.progress_lock:
-                            self.current_progress = progress_data
-                            logger.info(f"📊 Progress Update: [{progress_data.get('agent', 'Unknown')}] {progress_data.get('description', '')} - {progress_data.get('status', '').upper()}")
-                            
-                            # Format step data for dashboard
-                            step_info = {
-                                'agent': progress_data.get('agent', 'Unknown'),
-                                'step': progress_data.get('description', ''),
-                                'status': progress_data.get('status', 'pending'),
-                                'message': progress_data.get('message', ''),
-                                'timestamp': progress_data.get('timestamp', datetime.now().isoformat())
-                            }
-                            
-                            # Get existing steps or initialize
-                            existing_progress = progress_store.get_progress(session_id)
-                            existing_steps = existing_progress.get('steps', [])
-                            
-                            # Update or add step
-                            step_index = progress_data.get('step', len(existing_steps)) - 1
-                            if step_index < len(existing_steps):
-                                existing_steps[step_index] = step_info
-                            else:
-                                existing_steps.append(step_info)
-                            
-                            # Store in global progress store
-                            progress_store.set_progress(session_id, {
-                                'steps': existing_steps,
-                                'current_step': step_info,
-                                'session_id': session_id,
-                                'timestamp': datetime.now().isoformat(),
-                                'hasActiveProgress': True
-                            })
+                    # Record each step to this session's progress store entry and stream
+                    progress_callback = self._progress_callback(session_id, "Progress Update")
                     
                     logger.info(f"🔄 Starting enhanced crew research with social media for topics: {topics}")
                     # Pass agent context for personalized generation
@@ -407,7 +321,7 @@ class EnhancedNewsGatherer:
                 except Exception as e:
                     logger.error(f"Enhanced crew execution failed: {str(e)}")
                     # Fall back to simple test crew for dashboard testing
-                    return self._try_simple_test_crew(topics, sources)
+                    return self._try_simple_test_crew(topics, sources, session_id=session_id)
             
             # Try dynamic multi-agent system as fallback
             elif self.dynamic_crew and self.mode == "dynamic_multi_agent":
@@ -526,49 +440,17 @@ class EnhancedNewsGatherer:
         else:
             return self._fallback_to_simple_scraper(topics, sources)
     
-    def _try_simple_test_crew(self, topics: List[str], sources: Dict[str, Any]) -> Dict[str, Any]:
+    def _try_simple_test_crew(self, topics: List[str], sources: Dict[str, Any], session_id: str = None) -> Dict[str, Any]:
         """Try simple test crew for dashboard testing"""
         if self.simple_test_crew:
             try:
                 logger.info("🧪 Using simple test crew for dashboard testing")
                 
-                # Generate session ID for this test
-                session_id = f"test_{int(time.time() * 1000)}"
+                # Keep reporting to the caller's session, or generate one for this test
+                session_id = session_id or f"test_{int(time.time() * 1000)}"
                 
                 # Create progress callback
-                def progress_callback(progress_data):
-                    with self.progress_lock:
-                        self.current_progress = progress_data
-                        logger.info(f"📊 Test Progress: [{progress_data.get('agent', 'Unknown')}] {progress_data.get('description', '')} - {progress_data.get('status', '').upper()}")
-                        
-                        # Format step data for dashboard
-                        step_info = {
-                            'agent': progress_data.get('agent', 'Unknown'),
-                            'step': progress_data.get('description', ''),
-                            'status': progress_data.get('status', 'pending'),
-                            'message': progress_data.get('message', ''),
-                            'timestamp': progress_data.get('timestamp', datetime.now().isoformat())
-                        }
-                        
-                        # Get existing steps or initialize
-                        existing_progress = progress_store.get_progress(session_id)
-                        existing_steps = existing_progress.get('steps', [])
-                        
-                        # Update or add step
-                        step_index = progress_data.get('step', len(existing_steps)) - 1
-                        if step_index < len(existing_steps):
-                            existing_steps[step_index] = step_info
-                        else:
-                            existing_steps.append(step_info)
-                        
-                        # Store in global progress store
-                        progress_store.set_progress(session_id, {
-                            'steps': existing_steps,
-                            'current_step': step_info,
-                            'session_id': session_id,
-                            'timestamp': datetime.now().isoformat(),
-                            'hasActiveProgress': True
-                        })
+                progress_callback = self._progress_callback(session_id, "Test Progress")
                 
                 result = self.simple_test_crew.research_news_simple(topics, sources, progress_callback=progress_callback)
                 
@@ -594,13 +476,32 @@ class EnhancedNewsGatherer:
         else:
             return self._fallback_to_simple_scraper(topics, sources)
     
+    def _progress_callback(self, session_id: str, label: str) -> Callable[[Dict[str, Any]], None]:
+        """Build a crew progress callback for one session
+        
+        Each update is recorded in place in the session's step index and
+        appended to its event stream - no read-copy-write of the step list.
+        """
+        def progress_callback(progress_data):
+            logger.info(f"📊 {label}: [{progress_data.get('agent', 'Unknown')}] {progress_data.get('description', '')} - {progress_data.get('status', '').upper()}")
+            
+            # Format step data for dashboard
+            step_info = {
+                'agent': progress_data.get('agent', 'Unknown'),
+                'step': progress_data.get('description', ''),
+                'status': progress_data.get('status', 'pending'),
+                'message': progress_data.get('message', ''),
+                'timestamp': progress_data.get('timestamp') or datetime.now().isoformat()
+            }
+            
+            step_number = progress_store.record_step(session_id, progress_data.get('step'), step_info)
+            progress_stream.publish(session_id, 'step', {**step_info, 'step_number': step_number})
+        
+        return progress_callback
+    
     def _format_enhanced_result(self, result: Dict[str, Any], topics: List[str], sources: Dict[str, Any]) -> Dict[str, Any]:
         """Format the enhanced result from crew"""
         
-        # Clear progress when complete
-        with self.progress_lock:
-            self.current_progress = {}
-        
         data = result.get('result', {}) if 'result' in result else result.get('data', {})
         
         return {
@@ -663,15 +564,17 @@ class EnhancedNewsGatherer:
             if result.get('success'):
                 articles = result.get('articles', [])
                 
-                # Enhance articles with URL validation
+                # Enhance articles with URL validation (one concurrent batch, reused by the scorer)
+                content_validator = ContentValidator(URLValidator())
+                url_verdicts = content_validator.build_reachability_map(articles)
                 enhanced_articles = []
                 for article in articles:
                     if article.get('url'):
-                        article['url_validated'] = URLValidator.is_valid_url(article['url'])
+                        article['url_validated'] = url_verdicts.get(article['url'], False)
                         article['url_cleaned'] = URLValidator.clean_url(article['url'])
                     
-                    if ContentValidator.is_quality_content(article):
-                        article['quality_score'] = ContentValidator.calculate_quality_score(article)
+                    if content_validator.is_quality_content(article):
+                        article['quality_score'] = content_validator.calculate_quality_score(article, url_verdicts)
                         enhanced_articles.append(article)
                 
                 return {
@@ -758,9 +661,11 @@ def root():
             'timestamp': datetime.now().isoformat(),
             'endpoints': {
                 '/health': 'Detailed health check',
-                '/gather-news': 'POST - Gather news with topics',
+                '/gather-news': 'POST - Gather news with topics (add "async": true to get a job ID back immediately)',
+                '/jobs/<job_id>': 'GET - Status and result of a queued news gathering job',
                 '/system-info': 'System status and capabilities',
-                '/progress': 'Real-time progress tracking'
+                '/progress': 'Progress snapshot for a session',
+                '/progress/stream/<session_id>': 'GET - Server-Sent Events stream of a session\'s progress steps'
             }
         }), 200
     except Exception as e:
@@ -837,6 +742,22 @@ def health_check():
         "initialization_error": getattr(news_gatherer, 'initialization_error', None) if news_gatherer else "News gatherer not initialized"
     })
 
+def _run_gather_news_job(**kwargs) -> Dict[str, Any]:
+    """Run news gathering and close the session's progress stream with the outcome"""
+    session_id = kwargs['session_id']
+    try:
+        result = news_gatherer.gather_news(**kwargs)
+    except Exception as e:
+        progress_stream.finish(session_id, 'failed', {'error': str(e)})
+        raise
+    
+    progress_stream.finish(session_id, 'completed' if result.get('success') else 'failed', {
+        'mode': result.get('mode'),
+        'error': result.get('error'),
+        'result_url': f"/jobs/{session_id}"
+    })
+    return result
+
 @app.route('/gather-news', methods=['POST'])
 def gather_news():
     """Execute enhanced news gathering with dynamic task delegation"""
@@ -870,18 +791,55 @@ def gather_news():
         include_trends = data.get('include_trends', True)
         focus_areas = data.get('focus_areas', ['quality', 'relevance'])
         
-        # Execute enhanced news gathering with agent context
-        result = news_gatherer.gather_news(
-            topics=topics,
-            sources=sources,
-            agent_context=agent_context,
-            max_articles=max_articles,
-            quality_threshold=quality_threshold,
-            include_trends=include_trends,
-            focus_areas=focus_areas
-        )
+        # Run the crew on the bounded worker pool; the job ID doubles as the progress session ID
+        job_id = f"news_{uuid.uuid4().hex[:16]}"
+        progress_stream.open(job_id)
+        try:
+            job = gather_jobs.submit(
+                _run_gather_news_job,
+                job_id=job_id,
+                topics=topics,
+                sources=sources,
+                agent_context=agent_context,
+                max_articles=max_articles,
+                quality_threshold=quality_threshold,
+                include_trends=include_trends,
+                focus_areas=focus_areas,
+                session_id=job_id
+            )
+        except QueueFullError as e:
+            logger.warning(f"⚠️ Rejecting gather-news request: {str(e)}")
+            progress_stream.finish(job_id, 'failed', {'error': str(e)})
+            response = jsonify({
+                "success": False,
+                "error": str(e),
+                "queue": gather_jobs.stats()
+            })
+            response.headers['Retry-After'] = '30'
+            return response, 503
         
-        return jsonify(result)
+        # Job-submission mode: return immediately and let the client poll /jobs/<job_id>
+        if data.get('async') or request.args.get('mode') == 'async':
+            return jsonify({
+                "success": True,
+                "job_id": job.id,
+                "session_id": job.id,
+                "status": job.status,
+                "status_url": f"/jobs/{job.id}",
+                "progress_url": f"/progress?session_id={job.id}",
+                "stream_url": f"/progress/stream/{job.id}",
+                "timestamp": datetime.now().isoformat()
+            }), 202
+        
+        # Synchronous mode: wait for the queued job so concurrency stays bounded
+        job = gather_jobs.wait(job.id)
+        if job.status == 'failed':
+            return jsonify({
+                "success": False,
+                "error": job.error
+            }), 500
+        
+        return jsonify(job.result)
         
     except Exception as e:
         logger.error(f"Error in gather_news endpoint: {str(e)}")
@@ -890,6 +848,44 @@ def gather_news():
             "error": str(e)
         }), 500
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the status (and result, once completed) of a queued news gathering job
+    
+    Pass ?wait=N to long-poll for up to N seconds (max 30) until the job finishes.
+    """
+    try:
+        wait_seconds = min(float(request.args.get('wait', 0)), 30.0)
+        job = gather_jobs.wait(job_id, timeout=wait_seconds) if wait_seconds > 0 else gather_jobs.get(job_id)
+        
+        if not job:
+            return jsonify({
+                "success": False,
+                "error": f"Unknown or expired job: {job_id}"
+            }), 404
+        
+        return jsonify({
+            "success": job.status != 'failed',
+            **job.to_dict(),
+            "timestamp": datetime.now().isoformat()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting job {job_id}: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+@app.route('/jobs', methods=['GET'])
+def get_job_queue_stats():
+    """Get worker pool and queue depth statistics"""
+    return jsonify({
+        "success": True,
+        "queue": gather_jobs.stats(),
+        "timestamp": datetime.now().isoformat()
+    })
+
 @app.route('/validate-urls', methods=['POST'])
 def validate_urls():
     """Validate a list of URLs"""
@@ -904,12 +900,15 @@ def validate_urls():
                 "error": "No URLs provided"
             }), 400
         
+        # One concurrent, deduped pass - validate_and_clean_urls below reuses the cached verdicts
+        verdicts = URLValidator.validate_urls(urls)
+        
         validation_results = []
         for url in urls:
             result = {
                 "original_url": url,
                 "cleaned_url": URLValidator.clean_url(url),
-                "is_valid": URLValidator.is_valid_url(url),
+                "is_valid": verdicts.get(url, False),
                 "timestamp": datetime.now().isoformat()
             }
             validation_results.append(result)
@@ -1029,20 +1028,19 @@ def get_crew_progress():
         # Get session ID from query params or use latest
         session_id = request.args.get('session_id')
         
-        if session_id:
-            # Get specific session progress
-            progress_data = progress_store.get_progress(session_id)
-            has_active = bool(progress_data)
-        else:
-            # Get latest progress from in-memory store
-            with news_gatherer.progress_lock:
-                progress_data = news_gatherer.current_progress
-                has_active = bool(progress_data)
+        if not session_id:
+            # Legacy callers without a session: report the most recently active one
+            session_id = progress_stream.latest_session_id()
+        
+        progress_data = progress_store.get_progress(session_id) if session_id else {}
+        has_active = bool(progress_data)
         
         return jsonify({
             "success": True,
+            "session_id": session_id,
             "progress": progress_data,
             "has_active_progress": has_active,
+            "stream_url": f"/progress/stream/{session_id}" if session_id else None,
             "timestamp": datetime.now().isoformat()
         })
     except Exception as e:
@@ -1052,6 +1050,36 @@ def get_crew_progress():
             "error": str(e)
         }), 500
 
+@app.route('/progress/stream/<session_id>', methods=['GET'])
+def stream_crew_progress(session_id):
+    """Stream a session's progress steps as Server-Sent Events
+    
+    Buffered steps are replayed first, so subscribing after the crew started
+    (or reconnecting with Last-Event-ID) misses nothing. The stream ends after
+    the terminal 'completed' or 'failed' event, or once the session expires.
+    """
+    if not progress_stream.exists(session_id):
+        return jsonify({
+            "success": False,
+            "error": f"Unknown or expired progress session: {session_id}"
+        }), 404
+    
+    try:
+        last_event_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id', 0))
+    except ValueError:
+        last_event_id = 0
+    
+    def generate():
+        yield "retry: 3000\n\n"
+        for event in progress_stream.subscribe(session_id, last_event_id):
+            # None means no event within the heartbeat interval - keep the connection alive
+            yield ": keep-alive\n\n" if event is None else event.to_sse()
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/test-simple-crew', methods=['POST'])
 def test_simple_crew():
     """Test the simple crew for dashboard functionality"""
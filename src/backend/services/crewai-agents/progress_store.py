@@ -0,0 +1,285 @@
+"""
+Progress Store
+Session progress snapshots for /progress with TTL expiry. The in-memory store
+is the default; set PROGRESS_BACKEND=redis (and REDIS_URL) so every gunicorn
+worker and instance reads the same sessions from Redis hashes
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+def _step_index(steps: List[Dict[str, Any]]) -> Dict[int, int]:
+    """Map 1-based step numbers to list positions"""
+    return {position + 1: position for position in range(len(steps))}
+
+
+class ProgressStore:
+    """In-process progress snapshots with a sliding expiry per session
+
+    Every write pushes the session to the back of an OrderedDict with the same
+    TTL, so entries are always in expiry order and expired sessions are
+    dropped from the front on write - no background thread, no full scan.
+    Steps are recorded in place through a step-number index, and readers get
+    a shallow snapshot so they never see a half-applied update.
+    """
+
+    backend = 'memory'
+
+    def __init__(self, expiration_minutes: float = 30):
+        self.ttl_seconds = expiration_minutes * 60
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set_progress(self, key: str, progress_data: Dict[str, Any]) -> None:
+        """Replace the session's progress and restart its expiry"""
+        data = dict(progress_data)
+        if 'steps' in data:
+            data['steps'] = list(data['steps'])
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {
+                'data': data,
+                'step_index': _step_index(data.get('steps', [])),
+                'expires_at': time.monotonic() + self.ttl_seconds
+            }
+            self._prune()
+
+    def get_progress(self, key: str) -> Dict[str, Any]:
+        """Snapshot of the session's progress if not expired ({} otherwise)"""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                return {}
+            snapshot = dict(entry['data'])
+            if 'steps' in snapshot:
+                snapshot['steps'] = list(snapshot['steps'])
+            return snapshot
+
+    def update_progress(self, key: str, updates: Dict[str, Any]) -> None:
+        """Merge updates into an existing, unexpired session"""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                return
+            entry['data'].update(updates)
+            if 'steps' in updates:
+                entry['data']['steps'] = list(updates['steps'])
+                entry['step_index'] = _step_index(entry['data']['steps'])
+            self._touch(key, entry)
+
+    def record_step(self, key: str, step_number: Optional[int], step_info: Dict[str, Any]) -> int:
+        """Insert or replace one step in place and make it the current step
+
+        Creates the session on its first step. A step without a number is
+        appended. Returns the step number used.
+        """
+        timestamp = datetime.now().isoformat()
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                entry = {
+                    'data': {'steps': [], 'session_id': key, 'hasActiveProgress': True},
+                    'step_index': {}
+                }
+                self._entries[key] = entry
+            data, index = entry['data'], entry['step_index']
+            steps = data.setdefault('steps', [])
+            if step_number is None:
+                step_number = len(steps) + 1
+            position = index.get(step_number)
+            if position is None:
+                index[step_number] = len(steps)
+                steps.append(step_info)
+            else:
+                steps[position] = step_info
+            data['current_step'] = step_info
+            data['timestamp'] = timestamp
+            self._touch(key, entry)
+        return step_number
+
+    def _live_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        # Caller holds self._lock
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() >= entry['expires_at']:
+            del self._entries[key]
+            return None
+        return entry
+
+    def _touch(self, key: str, entry: Dict[str, Any]) -> None:
+        # Caller holds self._lock
+        entry['expires_at'] = time.monotonic() + self.ttl_seconds
+        self._entries.move_to_end(key)
+        self._prune()
+
+    def _prune(self) -> None:
+        # Caller holds self._lock
+        now = time.monotonic()
+        removed = 0
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry['expires_at'] > now:
+                break
+            del self._entries[key]
+            removed += 1
+        if removed:
+            logger.info(f"🧹 Cleaned up {removed} expired progress entries")
+
+
+class RedisProgressStore:
+    """Progress snapshots shared by all workers through Redis
+
+    Each session is a hash under `progress:<session_id>` with one JSON-encoded
+    field per top-level key, so updates rewrite only the fields they touch and
+    Redis expires the whole session natively. Steps live in a second hash,
+    `progress:<session_id>:steps`, keyed by step number, so recording a step
+    is a single HSET instead of rewriting the whole list.
+    """
+
+    backend = 'redis'
+
+    def __init__(self, client, expiration_minutes: float = 30, key_prefix: str = 'progress:'):
+        self.redis = client
+        self.ttl_seconds = int(expiration_minutes * 60)
+        self.key_prefix = key_prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    def set_progress(self, key: str, progress_data: Dict[str, Any]) -> None:
+        fields = dict(progress_data)
+        steps = fields.pop('steps', [])
+        try:
+            pipe = self.redis.pipeline()
+            pipe.delete(self._key(key), f"{self._key(key)}:steps")
+            if fields:
+                pipe.hset(self._key(key), mapping=self._encode(fields))
+            self._write_steps(pipe, key, steps)
+            self._expire(pipe, key)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to store progress for {key} in Redis: {str(e)}")
+
+    def get_progress(self, key: str) -> Dict[str, Any]:
+        try:
+            pipe = self.redis.pipeline()
+            pipe.hgetall(self._key(key))
+            pipe.hgetall(f"{self._key(key)}:steps")
+            fields, steps = pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read progress for {key} from Redis: {str(e)}")
+            return {}
+        if not fields and not steps:
+            return {}
+        data = {self._text(name): json.loads(value) for name, value in fields.items()}
+        if steps:
+            data['steps'] = [json.loads(steps[number]) for number in sorted(steps, key=int)]
+        return data
+
+    def update_progress(self, key: str, updates: Dict[str, Any]) -> None:
+        if not updates:
+            return
+        fields = dict(updates)
+        steps = fields.pop('steps', None)
+
+        def write(pipe):
+            # WATCH makes EXEC fail if the session expires between the check and the write
+            if not pipe.exists(self._key(key)):
+                return
+            pipe.multi()
+            if fields:
+                pipe.hset(self._key(key), mapping=self._encode(fields))
+            if steps is not None:
+                pipe.delete(f"{self._key(key)}:steps")
+                self._write_steps(pipe, key, steps)
+            self._expire(pipe, key)
+
+        try:
+            self.redis.transaction(write, self._key(key))
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to update progress for {key} in Redis: {str(e)}")
+
+    def record_step(self, key: str, step_number: Optional[int], step_info: Dict[str, Any]) -> int:
+        steps_key = f"{self._key(key)}:steps"
+
+        def write(pipe):
+            # Unnumbered steps are appended; WATCH on the steps hash retries if
+            # another worker appends first, so no two steps share a number
+            number = step_number if step_number is not None else pipe.hlen(steps_key) + 1
+            pipe.multi()
+            pipe.hset(steps_key, str(number), json.dumps(step_info, default=str))
+            pipe.hset(self._key(key), mapping=self._encode({
+                'current_step': step_info,
+                'session_id': key,
+                'timestamp': datetime.now().isoformat(),
+                'hasActiveProgress': True
+            }))
+            self._expire(pipe, key)
+            return number
+
+        try:
+            return self.redis.transaction(write, steps_key, value_from_callable=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to record progress step for {key} in Redis: {str(e)}")
+        return step_number
+
+    def _write_steps(self, pipe, key: str, steps: List[Dict[str, Any]]) -> None:
+        if steps:
+            pipe.hset(f"{self._key(key)}:steps", mapping={
+                str(position + 1): json.dumps(step, default=str) for position, step in enumerate(steps)
+            })
+
+    def _expire(self, pipe, key: str) -> None:
+        pipe.expire(self._key(key), self.ttl_seconds)
+        pipe.expire(f"{self._key(key)}:steps", self.ttl_seconds)
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> Dict[str, str]:
+        return {name: json.dumps(value, default=str) for name, value in data.items()}
+
+    @staticmethod
+    def _text(value) -> str:
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def redis_client_from_env():
+    """Redis client for REDIS_URL (or REDIS_HOST/REDIS_PORT/REDIS_DB)"""
+    if not REDIS_AVAILABLE:
+        raise RuntimeError("PROGRESS_BACKEND=redis requires the redis package")
+    url = os.getenv('REDIS_URL')
+    if url:
+        return redis.Redis.from_url(url)
+    return redis.Redis(
+        host=os.getenv('REDIS_HOST', 'localhost'),
+        port=int(os.getenv('REDIS_PORT', 6379)),
+        db=int(os.getenv('REDIS_DB', 0))
+    )
+
+
+def use_redis_backend() -> bool:
+    return os.getenv('PROGRESS_BACKEND', 'memory').lower() == 'redis'
+
+
+def create_progress_store_from_env(expiration_minutes: Optional[float] = None):
+    """In-memory store by default; RedisProgressStore when PROGRESS_BACKEND=redis"""
+    if expiration_minutes is None:
+        expiration_minutes = float(os.getenv('PROGRESS_TTL_MINUTES', '30'))
+    if use_redis_backend():
+        logger.info("🗄️ Progress store backend: Redis")
+        return RedisProgressStore(redis_client_from_env(), expiration_minutes=expiration_minutes)
+    return ProgressStore(expiration_minutes=expiration_minutes)
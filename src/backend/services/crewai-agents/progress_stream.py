@@ -0,0 +1,288 @@
+"""
+Progress Event Stream
+Per-session publish/subscribe for crew progress: every step update is pushed to
+subscribers as it happens (served as Server-Sent Events), and a bounded replay
+buffer lets late or reconnecting subscribers catch up from their last event ID.
+With PROGRESS_BACKEND=redis the buffer lives in Redis and events fan out over
+pub/sub, so a subscriber can be served by any worker
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+from progress_store import redis_client_from_env, use_redis_backend
+
+logger = logging.getLogger(__name__)
+
+# Terminal event types - a session is closed once one of these is published
+TERMINAL_EVENTS = ('completed', 'failed')
+
+
+@dataclass
+class ProgressEvent:
+    """One progress update; IDs increase monotonically within a session"""
+    id: int
+    event: str
+    data: Dict[str, Any]
+    timestamp: float = field(default_factory=time.time)
+
+    def to_sse(self) -> str:
+        return f"id: {self.id}\nevent: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), default=str)
+
+    @classmethod
+    def from_json(cls, raw) -> 'ProgressEvent':
+        return cls(**json.loads(raw))
+
+
+class _Session:
+    def __init__(self, lock: threading.Lock, buffer_size: int):
+        self.events = deque(maxlen=buffer_size)
+        self.next_id = 1
+        self.closed = False
+        self.updated = threading.Condition(lock)
+        self.last_activity = time.monotonic()
+
+
+class ProgressStream:
+    """Isolated event streams keyed by session ID
+
+    Sessions are created by `open` or the first publish - never by a
+    subscriber - kept in last-activity order and dropped once idle for
+    `session_ttl_seconds` (or when more than `max_sessions` exist), so pruning
+    only ever touches expired entries.
+    """
+
+    def __init__(self, buffer_size: int = 200, session_ttl_seconds: float = 1800.0, max_sessions: int = 1000):
+        self.buffer_size = buffer_size
+        self.session_ttl_seconds = session_ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions: 'OrderedDict[str, _Session]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._latest_session_id: Optional[str] = None
+
+    def open(self, session_id: str) -> None:
+        """Create the session ahead of its first event so it can be subscribed to right away"""
+        with self._lock:
+            self._session(session_id)
+
+    def exists(self, session_id: str) -> bool:
+        """Whether the session is open or still within its TTL"""
+        with self._lock:
+            self._prune()
+            return session_id in self._sessions
+
+    def publish(self, session_id: str, event: str, data: Dict[str, Any]) -> int:
+        """Append an event to the session's buffer and wake its subscribers; returns the event ID"""
+        with self._lock:
+            session = self._session(session_id)
+            item = ProgressEvent(id=session.next_id, event=event, data=data)
+            session.next_id += 1
+            session.events.append(item)
+            if event in TERMINAL_EVENTS:
+                session.closed = True
+            session.updated.notify_all()
+            self._latest_session_id = session_id
+            return item.id
+
+    def finish(self, session_id: str, status: str = 'completed', data: Optional[Dict[str, Any]] = None) -> int:
+        """Publish the terminal event; subscribers receive it and then their stream ends"""
+        if status not in TERMINAL_EVENTS:
+            raise ValueError(f"Terminal status must be one of {TERMINAL_EVENTS}, got {status!r}")
+        return self.publish(session_id, status, {'session_id': session_id, 'status': status, **(data or {})})
+
+    def subscribe(self, session_id: str, last_event_id: int = 0,
+                  heartbeat_seconds: float = 15.0) -> Iterator[Optional[ProgressEvent]]:
+        """Yield buffered events after `last_event_id`, then live ones until the session closes
+
+        Yields None whenever `heartbeat_seconds` pass without an event so the
+        caller can write a keep-alive and notice disconnected clients. Ends
+        immediately for an unknown session, and as soon as the session is
+        pruned; subscribing never creates or keeps alive a session.
+        """
+        cursor = last_event_id
+        with self._lock:
+            self._prune()
+            session = self._sessions.get(session_id)
+        if session is None:
+            return
+
+        while True:
+            with self._lock:
+                pending = [item for item in session.events if item.id > cursor]
+                if not pending and not session.closed:
+                    session.updated.wait(heartbeat_seconds)
+                    pending = [item for item in session.events if item.id > cursor]
+                closed = session.closed
+                self._prune()
+                # A pruned (or replaced) session is over for this subscriber
+                closed = closed or self._sessions.get(session_id) is not session
+
+            if not pending:
+                if closed:
+                    return
+                yield None
+                continue
+
+            for item in pending:
+                cursor = item.id
+                yield item
+
+    def latest_session_id(self) -> Optional[str]:
+        """Session that most recently published an event"""
+        with self._lock:
+            return self._latest_session_id
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'open_sessions': sum(1 for session in self._sessions.values() if not session.closed),
+                'buffer_size': self.buffer_size
+            }
+
+    def _session(self, session_id: str) -> _Session:
+        # Caller holds self._lock
+        self._prune()
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = _Session(self._lock, self.buffer_size)
+            self._sessions[session_id] = session
+        else:
+            session.last_activity = time.monotonic()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _prune(self) -> None:
+        # Sessions are ordered by last activity, so stop at the first live one
+        cutoff = time.monotonic() - self.session_ttl_seconds
+        removed = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_activity >= cutoff and len(self._sessions) <= self.max_sessions:
+                break
+            del self._sessions[session_id]
+            session.updated.notify_all()
+            removed += 1
+        if removed:
+            logger.info(f"🧹 Dropped {removed} idle progress streams")
+
+
+class RedisProgressStream:
+    """ProgressStream shared by all workers through Redis
+
+    Per session, `<prefix><id>:seq` hands out event IDs, `<prefix><id>:log` is
+    the capped replay buffer and `<prefix><id>` is the pub/sub channel. All
+    keys expire with the session, like the progress hashes.
+    """
+
+    def __init__(self, client, buffer_size: int = 200, session_ttl_seconds: float = 1800.0,
+                 key_prefix: str = 'progress:events:'):
+        self.redis = client
+        self.buffer_size = buffer_size
+        self.session_ttl_seconds = int(session_ttl_seconds)
+        self.key_prefix = key_prefix
+
+    def open(self, session_id: str) -> None:
+        # The sequence key marks the session as existing; INCR continues from 0
+        try:
+            self.redis.set(f"{self.key_prefix}{session_id}:seq", 0, ex=self.session_ttl_seconds, nx=True)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to open progress stream for {session_id}: {str(e)}")
+
+    def exists(self, session_id: str) -> bool:
+        try:
+            return bool(self.redis.exists(f"{self.key_prefix}{session_id}:seq"))
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to check progress stream for {session_id}: {str(e)}")
+            return False
+
+    def publish(self, session_id: str, event: str, data: Dict[str, Any]) -> int:
+        channel = f"{self.key_prefix}{session_id}"
+        try:
+            item = ProgressEvent(id=self.redis.incr(f"{channel}:seq"), event=event, data=data)
+            payload = item.to_json()
+            pipe = self.redis.pipeline()
+            pipe.rpush(f"{channel}:log", payload)
+            pipe.ltrim(f"{channel}:log", -self.buffer_size, -1)
+            pipe.expire(f"{channel}:seq", self.session_ttl_seconds)
+            pipe.expire(f"{channel}:log", self.session_ttl_seconds)
+            pipe.set(f"{self.key_prefix}latest", session_id, ex=self.session_ttl_seconds)
+            pipe.publish(channel, payload)
+            pipe.execute()
+            return item.id
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to publish progress event for {session_id}: {str(e)}")
+            return 0
+
+    def finish(self, session_id: str, status: str = 'completed', data: Optional[Dict[str, Any]] = None) -> int:
+        if status not in TERMINAL_EVENTS:
+            raise ValueError(f"Terminal status must be one of {TERMINAL_EVENTS}, got {status!r}")
+        return self.publish(session_id, status, {'session_id': session_id, 'status': status, **(data or {})})
+
+    def subscribe(self, session_id: str, last_event_id: int = 0,
+                  heartbeat_seconds: float = 15.0) -> Iterator[Optional[ProgressEvent]]:
+        """Same contract as ProgressStream.subscribe"""
+        channel = f"{self.key_prefix}{session_id}"
+        if not self.exists(session_id):
+            return
+        pubsub = self.redis.pubsub()
+        # Subscribe before reading the replay buffer so nothing published in between is lost
+        pubsub.subscribe(channel)
+        cursor = last_event_id
+        try:
+            for raw in self.redis.lrange(f"{channel}:log", 0, -1):
+                item = ProgressEvent.from_json(raw)
+                if item.id > cursor:
+                    cursor = item.id
+                    yield item
+                # A client reconnecting at or past the terminal event gets an ended stream too
+                if item.event in TERMINAL_EVENTS:
+                    return
+
+            while True:
+                message = pubsub.get_message(ignore_subscribe_messages=True, timeout=heartbeat_seconds)
+                if message is None:
+                    # The session's keys expired - nothing more will be published
+                    if not self.exists(session_id):
+                        return
+                    yield None
+                    continue
+                item = ProgressEvent.from_json(message['data'])
+                if item.id <= cursor:
+                    continue
+                cursor = item.id
+                yield item
+                if item.event in TERMINAL_EVENTS:
+                    return
+        finally:
+            pubsub.close()
+
+    def latest_session_id(self) -> Optional[str]:
+        try:
+            value = self.redis.get(f"{self.key_prefix}latest")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to read latest progress session: {str(e)}")
+            return None
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def stats(self) -> Dict[str, Any]:
+        return {'backend': 'redis', 'buffer_size': self.buffer_size}
+
+
+def create_progress_stream_from_env():
+    """In-memory stream by default; RedisProgressStream when PROGRESS_BACKEND=redis"""
+    buffer_size = int(os.getenv('PROGRESS_REPLAY_BUFFER', '200'))
+    session_ttl_seconds = float(os.getenv('PROGRESS_TTL_MINUTES', '30')) * 60
+    if use_redis_backend():
+        return RedisProgressStream(redis_client_from_env(), buffer_size=buffer_size,
+                                   session_ttl_seconds=session_ttl_seconds)
+    return ProgressStream(buffer_size=buffer_size, session_ttl_seconds=session_ttl_seconds)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test the shared content corpus passed between the ultra-thinking agents
+"""
+
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from content_corpus import ContentCorpus
+from pattern_matcher import PatternMatcher
+
+CONTENT = {
+    'summary': 'Robotics funding is up',
+    'reddit_posts': [
+        {'title': 'Thread', 'content': 'A liquidity crunch hits Robotics startups'},
+        {'title': 'No body'},
+        'AI chips in short supply'
+    ],
+    'source_count': 3
+}
+
+
+def test_text_and_boundaries_match_the_old_extraction():
+    corpus = ContentCorpus(CONTENT, ['robotics', 'AI'])
+
+    assert corpus.text == 'Robotics funding is up A liquidity crunch hits Robotics startups AI chips in short supply'
+    assert corpus.lower_text == corpus.text.lower()
+    assert dict(corpus.items()) == CONTENT, "A corpus must still behave like the content mapping"
+    assert [(item.source, item.index) for item in corpus.entries] == [
+        ('summary', -1), ('reddit_posts', 0), ('reddit_posts', 2)
+    ]
+    for item in corpus.entries:
+        assert corpus.item_at(item.start) == item
+    assert [corpus.text[start:end] for start, end in corpus.tokens_in(0, 17)] == ['Robotics', 'funding']
+    print(f"✅ {len(corpus.entries)} items, {len(corpus.tokens)} tokens, text unchanged")
+
+
+def test_topic_spans_and_context_windows_are_slices():
+    corpus = ContentCorpus(CONTENT, ['robotics'])
+
+    spans = corpus.topic_spans('robotics')
+    assert [corpus.text[start:end] for start, end in spans] == ['Robotics', 'Robotics']
+    assert [item.source for item in corpus.topic_items('robotics')] == ['summary', 'reddit_posts']
+
+    hit = PatternMatcher(['liquidity crunch']).find_all(corpus.text)[0]
+    assert corpus.window(hit.start, hit.end, radius=2) == 'A liquidity crunch h'
+    assert 'liquidity crunch' in corpus.topic_context('robotics', radius=30)
+    print("✅ Topic spans precomputed, context windows sliced by offset")
+
+
+def test_corpus_is_shared_immutable_and_picklable():
+    corpus = ContentCorpus.of(CONTENT, ['robotics'])
+
+    assert ContentCorpus.of(corpus) is corpus, "An existing corpus must be reused"
+    assert dict(corpus) == CONTENT and corpus['source_count'] == 3
+    try:
+        corpus.text = 'changed'
+        assert False, "Corpus should be immutable"
+    except AttributeError:
+        pass
+
+    restored = pickle.loads(pickle.dumps(corpus))
+    assert restored.digest == corpus.digest and restored.text == corpus.text
+    print("✅ Corpus reused, read-only and picklable for process workers")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing shared content corpus...")
+    print("=" * 60)
+    test_text_and_boundaries_match_the_old_extraction()
+    test_topic_spans_and_context_windows_are_slices()
+    test_corpus_is_shared_immutable_and_picklable()
+    print("=" * 60)
+    print("🎉 All content corpus tests passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the conditional-GET RSS feed cache without network access
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from feed_cache import FeedCache
+
+FEED_XML = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test Feed</title>
+<item><title>First story</title><link>https://example.com/1</link><pubDate>Mon, 05 Oct 2026 10:00:00 GMT</pubDate></item>
+<item><title>Second story</title><link>https://example.com/2</link><pubDate>Tue, 06 Oct 2026 10:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class FakeHttp:
+    """Serves FEED_XML with an ETag and honours If-None-Match"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        if (headers or {}).get('If-None-Match') == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, FEED_XML, {'ETag': '"v1"', 'Last-Modified': 'Tue, 06 Oct 2026 10:00:00 GMT'})
+
+
+def test_fresh_feed_served_without_request():
+    http = FakeHttp()
+    cache = FeedCache(http=http, freshness_seconds=60)
+
+    first = cache.fetch('https://example.com/feed')
+    second = cache.fetch('https://example.com/feed')
+
+    assert first.cache_status == 'fetched' and len(first.entries) == 2
+    assert second.cache_status == 'fresh' and second.entries is first.entries
+    assert len(http.requests) == 1
+    print("✅ Fresh feed served from cache")
+
+
+def test_stale_feed_revalidated_with_etag():
+    http = FakeHttp()
+    cache = FeedCache(http=http, freshness_seconds=0)
+
+    first = cache.fetch('https://example.com/feed')
+    second = cache.fetch('https://example.com/feed')
+
+    assert http.requests[1]['If-None-Match'] == '"v1"'
+    assert http.requests[1]['If-Modified-Since'] == 'Tue, 06 Oct 2026 10:00:00 GMT'
+    assert second.cache_status == 'revalidated' and second.http_status == 304
+    assert second.entries is first.entries, "304 must reuse the parsed entries"
+    print("✅ 304 reused parsed entries")
+
+
+def test_disk_cache_survives_restart():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        FeedCache(http=FakeHttp(), freshness_seconds=0, cache_dir=cache_dir).fetch('https://example.com/feed')
+
+        http = FakeHttp()
+        restarted = FeedCache(http=http, freshness_seconds=0, cache_dir=cache_dir)
+        result = restarted.fetch('https://example.com/feed')
+
+        assert result.cache_status == 'revalidated'
+        assert [e.title for e in result.entries] == ['First story', 'Second story']
+        assert result.entries[1].published_parsed > result.entries[0].published_parsed
+        print("✅ Disk cache restored entries and validators")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing RSS feed cache...")
+    print("=" * 60)
+    test_fresh_feed_served_without_request()
+    test_stale_feed_revalidated_with_etag()
+    test_disk_cache_survives_restart()
+    print("=" * 60)
+    print("🎉 All feed cache tests passed")
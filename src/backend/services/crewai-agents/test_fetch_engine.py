@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test the concurrent fan-out fetch engine without any network access
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from fetch_engine import FanOutFetchEngine, FetchJob
+
+
+def _sleeper(seconds, value):
+    def run():
+        time.sleep(seconds)
+        return value
+    return run
+
+
+def test_latency_tracks_slowest_source():
+    """Five 0.3s sources should finish in ~0.3s, not 1.5s"""
+    engine = FanOutFetchEngine(max_workers=8, per_host_limit=2, deadline_seconds=5)
+    jobs = [FetchJob(f"source_{i}", f"https://host{i}.example.com/feed", _sleeper(0.3, i)) for i in range(5)]
+
+    report = engine.run(jobs)
+
+    assert [o.result for o in report.outcomes] == [0, 1, 2, 3, 4]
+    assert report.elapsed < 1.0, f"Fan-out took {report.elapsed:.2f}s"
+    print(f"✅ 5 sources fetched concurrently in {report.elapsed:.2f}s")
+
+
+def test_deadline_returns_partial_results():
+    """A source slower than the deadline is reported as a timeout"""
+    engine = FanOutFetchEngine(deadline_seconds=0.5)
+    jobs = [
+        FetchJob("fast", "https://fast.example.com/", _sleeper(0.05, 'fast')),
+        FetchJob("slow", "https://slow.example.com/", _sleeper(2, 'slow')),
+    ]
+
+    report = engine.run(jobs)
+
+    assert [o.status for o in report.outcomes] == ['ok', 'timeout']
+    assert report.elapsed < 1.0
+    print(f"✅ Deadline honoured: {report.timed_out} skipped after {report.elapsed:.2f}s")
+
+
+def test_per_host_limit():
+    """Jobs on one host never exceed the per-host cap"""
+    engine = FanOutFetchEngine(max_workers=8, per_host_limit=1, deadline_seconds=5)
+    jobs = [FetchJob(f"job_{i}", "https://same.example.com/", _sleeper(0.1, i)) for i in range(3)]
+
+    report = engine.run(jobs)
+
+    assert len(report.completed) == 3
+    assert report.elapsed >= 0.3, "Jobs on the same host ran in parallel"
+    print(f"✅ Per-host cap serialised same-host jobs ({report.elapsed:.2f}s)")
+
+
+def test_errors_are_isolated():
+    """A failing source does not affect the others"""
+    def boom():
+        raise RuntimeError("feed unavailable")
+
+    engine = FanOutFetchEngine(deadline_seconds=5)
+    report = engine.run([
+        FetchJob("broken", "https://broken.example.com/", boom),
+        FetchJob("ok", "https://ok.example.com/", _sleeper(0, ['article'])),
+    ])
+
+    assert report.outcomes[0].status == 'error'
+    assert report.outcomes[1].result == ['article']
+    print("✅ Failing source isolated")
+
+
+def test_per_job_deadline_and_live_outcomes():
+    """A job past its own deadline is dropped while the others run to completion"""
+    engine = FanOutFetchEngine(deadline_seconds=5)
+    seen = []
+    report = engine.run([
+        FetchJob("reddit", "", _sleeper(2, 'reddit'), deadline_seconds=0.2),
+        FetchJob("telegram", "", _sleeper(0.4, 'telegram'), deadline_seconds=1),
+        FetchJob("linkedin", "", _sleeper(0.05, 'linkedin')),
+    ], on_outcome=lambda outcome: seen.append((outcome.name, outcome.status)))
+
+    assert seen == [('linkedin', 'ok'), ('reddit', 'timeout'), ('telegram', 'ok')]
+    assert [o.status for o in report.outcomes] == ['timeout', 'ok', 'ok']
+    assert report.elapsed < 1.0, f"Stages took {report.elapsed:.2f}s"
+    print(f"✅ Slow stage dropped at its own deadline, outcomes reported live ({report.elapsed:.2f}s)")
+
+
+def test_jobs_sharing_a_name_keep_their_own_outcomes():
+    engine = FanOutFetchEngine(deadline_seconds=5)
+    jobs = [
+        FetchJob("feed", "https://a.example.com/", _sleeper(0.05, 'a')),
+        FetchJob("feed", "https://b.example.com/", _sleeper(0.01, 'b')),
+    ]
+
+    report = engine.run(jobs)
+
+    assert [o.result for o in report.outcomes] == ['a', 'b']
+    print("✅ Duplicate job names reported separately, in submission order")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing fan-out fetch engine...")
+    print("=" * 60)
+    test_latency_tracks_slowest_source()
+    test_deadline_returns_partial_results()
+    test_per_host_limit()
+    test_errors_are_isolated()
+    test_per_job_deadline_and_live_outcomes()
+    test_jobs_sharing_a_name_keep_their_own_outcomes()
+    print("=" * 60)
+    print("🎉 All fetch engine tests passed")
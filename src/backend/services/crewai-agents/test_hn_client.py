@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the shared Hacker News client's concurrent hydration and item cache without network access
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from hn_client import HackerNewsClient, HN_TOP_STORIES_URL, HN_ITEM_URL
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"{self.status_code} error")
+
+    def json(self):
+        return self.payload
+
+
+class FakeHttp:
+    """Records every request made through the shared HTTP client API"""
+
+    def __init__(self, story_ids):
+        self.story_ids = story_ids
+        self.gets = []
+        self.batches = []
+
+    def get(self, url, **kwargs):
+        self.gets.append(url)
+        assert url == HN_TOP_STORIES_URL
+        return FakeResponse(self.story_ids)
+
+    def get_many(self, urls, **kwargs):
+        self.batches.append(urls)
+        responses = []
+        for url in urls:
+            item_id = int(url.rsplit('/', 1)[1].split('.')[0])
+            if item_id == 13:
+                responses.append(ConnectionError("reset"))
+            else:
+                responses.append(FakeResponse({'id': item_id, 'type': 'story', 'title': f'Story {item_id}'}))
+        return responses
+
+
+def test_items_hydrated_in_one_batch():
+    """20 stories cost one list request and one concurrent item batch"""
+    http = FakeHttp(list(range(1, 51)))
+    client = HackerNewsClient(http=http)
+
+    stories = client.top_stories(20)
+
+    assert len(http.gets) == 1
+    assert len(http.batches) == 1 and len(http.batches[0]) == 20
+    assert [s['id'] for s in stories] == [i for i in range(1, 21) if i != 13]
+    print(f"✅ {len(stories)} stories hydrated in a single batch (failed item skipped)")
+
+
+def test_item_cache_shared_across_calls():
+    """A second caller only fetches items it has not seen yet"""
+    http = FakeHttp(list(range(1, 51)))
+    client = HackerNewsClient(http=http)
+
+    client.get_items(client.top_story_ids(10))
+    client.get_items(client.top_story_ids(15))
+
+    assert len(http.gets) == 1, "Top story list should be cached"
+    assert [HN_ITEM_URL.format(i) for i in range(11, 16)] == http.batches[1]
+    assert client.stats['item_hits'] == 10
+    print(f"✅ Item cache reused: {client.stats}")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Hacker News client...")
+    print("=" * 60)
+    test_items_hydrated_in_one_batch()
+    test_item_cache_shared_across_calls()
+    print("=" * 60)
+    print("🎉 All Hacker News client tests passed")
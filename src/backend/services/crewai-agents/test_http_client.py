@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test the shared HTTP client against a local HTTP server (no internet access needed)
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+import http_client
+from http_client import HttpClient, HttpConnectionError, HttpStatusError, HttpTimeoutError
+
+
+class Handler(BaseHTTPRequestHandler):
+    """/slow sleeps 0.5s, /busy sleeps 0.2s while counting concurrent requests, /status/<code> answers with code"""
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def do_GET(self):
+        if self.path == '/slow':
+            time.sleep(0.5)
+        elif self.path.startswith('/busy'):
+            with Handler.lock:
+                Handler.running += 1
+                Handler.max_running = max(Handler.max_running, Handler.running)
+            time.sleep(0.2)
+            with Handler.lock:
+                Handler.running -= 1
+        status = int(self.path.rsplit('/', 1)[1]) if self.path.startswith('/status/') else 200
+        body = b'{"ok": true}'
+        try:
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up (timeout test)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def _closed_port_url():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def _check_error_mapping(http, base):
+    response = http.get(f"{base}/status/200")
+    assert response.ok and response.json() == {'ok': True}
+
+    for code in (404, 503):
+        response = http.get(f"{base}/status/{code}")
+        assert not response.ok
+        try:
+            response.raise_for_status()
+            assert False, f"{code} should raise"
+        except HttpStatusError as e:
+            assert e.response.status_code == code
+
+    try:
+        http.get(f"{base}/slow", timeout=0.1)
+        assert False, "Slow response should time out"
+    except HttpTimeoutError:
+        pass
+
+    try:
+        http.get(_closed_port_url(), timeout=2)
+        assert False, "Closed port should fail to connect"
+    except HttpConnectionError:
+        pass
+
+
+def test_errors_are_mapped_with_httpx():
+    assert http_client.HTTPX_AVAILABLE, "httpx is a declared dependency"
+    server, base = _start_server()
+    http = HttpClient()
+    try:
+        _check_error_mapping(http, base)
+        print("✅ httpx: 4xx/5xx, timeouts and refused connections mapped to HttpClientError subclasses")
+    finally:
+        http.close()
+        server.shutdown()
+
+
+def test_requests_fallback_without_httpx():
+    server, base = _start_server()
+    available = http_client.HTTPX_AVAILABLE
+    http_client.HTTPX_AVAILABLE = False
+    http = HttpClient()
+    try:
+        _check_error_mapping(http, base)
+        assert http.async_client._client is None, "httpx must not be used"
+        assert http.async_client._session is not None, "requests session should have served the calls"
+        print("✅ requests fallback: same responses and error mapping without httpx")
+    finally:
+        http.close()
+        http_client.HTTPX_AVAILABLE = available
+        server.shutdown()
+
+
+def test_per_host_limit_caps_concurrency():
+    server, base = _start_server()
+    http = HttpClient(per_host_limit=2)
+    Handler.running = Handler.max_running = 0
+    try:
+        responses = http.get_many([f"{base}/busy/{i}" for i in range(6)])
+        assert all(response.ok for response in responses)
+        assert Handler.max_running == 2, f"{Handler.max_running} requests ran at once against one host"
+        print("✅ Per-host semaphore held concurrency at 2")
+    finally:
+        http.close()
+        server.shutdown()
+
+
+def test_loop_restarts_after_close_and_fork():
+    server, base = _start_server()
+    http = HttpClient()
+    try:
+        assert http.get(f"{base}/status/200").ok
+        first_thread = http._thread
+        http.close()
+        assert http.get(f"{base}/status/200").ok, "Client should restart after close()"
+        assert http._thread is not first_thread and http._thread.is_alive()
+
+        if hasattr(os, 'fork'):
+            pid = os.fork()
+            if pid == 0:
+                # The parent's loop thread does not exist in the child
+                ok = False
+                try:
+                    ok = http.get(f"{base}/status/200", timeout=5).ok
+                finally:
+                    os._exit(0 if ok else 1)
+            _, status = os.waitpid(pid, 0)
+            assert os.waitstatus_to_exitcode(status) == 0, "Forked child could not use the client"
+            assert http.get(f"{base}/status/200").ok, "Parent client must keep working after a fork"
+        print("✅ Loop thread restarted after close() and in a forked child")
+    finally:
+        http.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    print("🧪 Testing shared HTTP client...")
+    print("=" * 60)
+    test_errors_are_mapped_with_httpx()
+    test_requests_fallback_without_httpx()
+    test_per_host_limit_caps_concurrency()
+    test_loop_restarts_after_close_and_fork()
+    print("=" * 60)
+    print("🎉 All HTTP client tests passed")
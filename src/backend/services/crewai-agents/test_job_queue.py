@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the bounded background job queue used by /gather-news
+"""
+
+import threading
+import time
+
+from job_queue import JobQueue, QueueFullError
+
+
+def test_submit_returns_immediately_and_result_is_pollable():
+    jobs = JobQueue(worker_count=1, max_queue_depth=5)
+
+    started = time.monotonic()
+    job = jobs.submit(lambda topics: {'success': True, 'topics': topics}, topics=['AI'])
+    assert time.monotonic() - started < 0.1
+
+    finished = jobs.wait(job.id, timeout=2)
+    assert finished.status == 'completed'
+    assert finished.to_dict()['result'] == {'success': True, 'topics': ['AI']}
+    print(f"✅ Job {job.id} completed and result collected")
+
+
+def test_concurrency_and_queue_depth_are_bounded():
+    jobs = JobQueue(worker_count=2, max_queue_depth=2)
+    release = threading.Event()
+    running = []
+
+    def crew():
+        running.append(1)
+        release.wait(2)
+        return 'done'
+
+    submitted = [jobs.submit(crew), jobs.submit(crew)]
+    time.sleep(0.1)  # let both workers pick their job up
+    submitted += [jobs.submit(crew), jobs.submit(crew)]  # these two wait in the queue
+    assert len(running) == 2, "Only worker_count crews may run at once"
+
+    try:
+        jobs.submit(crew)
+        assert False, "Queue should have rejected the fifth job"
+    except QueueFullError:
+        pass
+
+    release.set()
+    assert all(jobs.wait(job.id, timeout=2).status == 'completed' for job in submitted)
+    print("✅ 2 concurrent crews, queue depth 2, overflow rejected")
+
+
+def test_failures_are_reported_and_finished_jobs_expire():
+    jobs = JobQueue(worker_count=1, max_queue_depth=5, result_ttl_seconds=0)
+
+    def broken():
+        raise RuntimeError("crew crashed")
+
+    job = jobs.wait(jobs.submit(broken).id, timeout=2)
+    assert job.status == 'failed' and job.error == 'crew crashed'
+
+    time.sleep(0.01)
+    jobs.submit(lambda: None)  # submissions prune expired results
+    assert jobs.get(job.id) is None
+    print("✅ Failed job reported, expired result pruned")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing gather-news job queue...")
+    print("=" * 60)
+    test_submit_returns_immediately_and_result_is_pollable()
+    test_concurrency_and_queue_depth_are_bounded()
+    test_failures_are_reported_and_finished_jobs_expire()
+    print("=" * 60)
+    print("🎉 All job queue tests passed")
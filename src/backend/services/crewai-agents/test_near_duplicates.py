@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test MinHash LSH near-duplicate clustering across content sources
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from near_duplicates import NearDuplicateDetector
+
+STORY = ("OpenAI releases a new reasoning model that beats earlier systems on math, "
+         "coding and science benchmarks, the company said on Tuesday")
+
+
+def test_syndicated_copies_cluster_and_distinct_stories_do_not():
+    detector = NearDuplicateDetector()
+    texts = [
+        STORY,
+        "Weather: heavy rain expected across Paris for the rest of the week",
+        STORY + " (Reuters)",
+        '',
+        STORY.replace('Tuesday', 'Monday'),
+        ''
+    ]
+
+    assert detector.clusters(texts) == [[0, 2, 4], [1], [3], [5]]
+    print("✅ Syndicated copies clustered, distinct and empty texts kept apart")
+
+
+def test_best_copy_is_kept_across_platforms():
+    detector = NearDuplicateDetector()
+    groups = {
+        'news_articles': [
+            {'title': 'OpenAI ships reasoning model', 'content': STORY, 'url': 'https://wire.example/a'},
+            {'title': 'Chip exports', 'content': 'New rules limit chip exports to several countries', 'url': 'https://wire.example/b'}
+        ],
+        'telegram_messages': [
+            {'title': 'OpenAI ships reasoning model', 'text': STORY + ' More details in the thread below', 'url': 'https://t.me/c/1'}
+        ],
+        'reddit_posts': [
+            {'title': 'OpenAI ships reasoning model', 'content': STORY, 'simulated': True}
+        ]
+    }
+
+    collapsed, removed = detector.collapse_groups(groups)
+
+    assert removed == 2
+    assert collapsed['news_articles'] == [groups['news_articles'][1]]
+    assert collapsed['reddit_posts'] == []
+    kept = collapsed['telegram_messages'][0]
+    assert kept['duplicate_count'] == 2 and kept['duplicate_urls'] == ['https://wire.example/a']
+    assert 'duplicate_count' not in groups['telegram_messages'][0], "Inputs must not be modified"
+    assert detector.stats['duplicates_removed'] == 2
+    print(f"✅ {removed} copies collapsed into the longest real, linked item")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing near-duplicate detection...")
+    print("=" * 60)
+    test_syndicated_copies_cluster_and_distinct_stories_do_not()
+    test_best_copy_is_kept_across_platforms()
+    print("=" * 60)
+    print("🎉 All near-duplicate tests passed")
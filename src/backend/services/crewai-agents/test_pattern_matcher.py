@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass multi-pattern matcher used by the ultra-thinking agents
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from pattern_matcher import PatternMatcher
+
+RISK_PATTERNS = {
+    "financial_stress_signals": ["liquidity crunch", "funding gap", "cash flow negative"],
+    "market_volatility_indicators": ["price volatility", "customer churn", "pricing pressure"],
+    "operational_failure_patterns": ["system outage", "supply chain disruption"]
+}
+
+
+def test_hits_carry_labels_and_offsets():
+    matcher = PatternMatcher(RISK_PATTERNS)
+    text = "A Liquidity Crunch and rising customer churn after the system outage."
+
+    hits = matcher.find_all(text)
+
+    assert [(hit.pattern, hit.label) for hit in hits] == [
+        ("liquidity crunch", "financial_stress_signals"),
+        ("customer churn", "market_volatility_indicators"),
+        ("system outage", "operational_failure_patterns")
+    ]
+    for hit in hits:
+        assert text[hit.start:hit.end].lower() == hit.pattern
+    print(f"✅ {len(hits)} hits found with labels and offsets")
+
+
+def test_same_semantics_as_substring_checks():
+    patterns = ["AI", "ai chips", "chips", "rain", "growth", "i c"]
+    matcher = PatternMatcher(patterns)
+    text = "Analysts said AI Chips drove growth; margins remain under strain."
+
+    expected = {pattern for pattern in patterns if pattern.lower() in text.lower()}
+    assert matcher.matched(text) == expected, "Nested and overlapping phrases must all be found"
+
+    first = matcher.first_hits(text)
+    assert all(hit.start == text.lower().find(pattern.lower()) for pattern, hit in first.items())
+    print(f"✅ Matched {sorted(expected)} like `in`, first offsets agree with find()")
+
+
+def test_phrases_shared_between_labels():
+    matcher = PatternMatcher({
+        "positive": ["growth", "innovation"],
+        "topic": ["Growth", "Robotics"]
+    })
+
+    found = matcher.matches_by_label("Robotics growth and more growth")
+
+    assert found == {"positive": ["growth"], "topic": ["Robotics", "Growth"]}
+    assert PatternMatcher([]).find_all("anything") == []
+    print("✅ One phrase reported under every label, in first-occurrence order")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing multi-pattern matcher...")
+    print("=" * 60)
+    test_hits_carry_labels_and_offsets()
+    test_same_semantics_as_substring_checks()
+    test_phrases_shared_between_labels()
+    print("=" * 60)
+    print("🎉 All pattern matcher tests passed")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test the in-memory progress store (the default PROGRESS_BACKEND)
+"""
+
+import time
+
+from progress_store import ProgressStore, create_progress_store_from_env
+
+
+def test_set_update_and_get():
+    store = ProgressStore(expiration_minutes=1)
+    store.set_progress('news_a', {'steps': [], 'hasActiveProgress': True})
+    store.update_progress('news_a', {'status': 'completed'})
+    store.update_progress('news_missing', {'status': 'completed'})
+
+    assert store.get_progress('news_a') == {'steps': [], 'hasActiveProgress': True, 'status': 'completed'}
+    assert store.get_progress('news_missing') == {}
+    print("✅ Progress stored, merged and read back")
+
+
+def test_expired_sessions_are_dropped_without_a_scan_thread():
+    store = ProgressStore(expiration_minutes=0.001)  # 60ms
+    store.set_progress('news_old', {'status': 'running'})
+    time.sleep(0.1)
+    store.set_progress('news_new', {'status': 'running'})
+
+    assert list(store._entries) == ['news_new'], "Writes should prune expired sessions from the front"
+    assert store.get_progress('news_old') == {}
+    store.update_progress('news_old', {'status': 'completed'})
+    assert store.get_progress('news_old') == {}, "Expired sessions must not be revived by updates"
+    print("✅ Expired session pruned on write")
+
+
+def test_record_step_updates_in_place():
+    store = ProgressStore(expiration_minutes=1)
+    for number in range(1, 301):
+        store.record_step('news_a', number, {'step': f'Sub-step {number}', 'status': 'in_progress'})
+    store.record_step('news_a', 2, {'step': 'Sub-step 2', 'status': 'completed'})
+    appended = store.record_step('news_a', None, {'step': 'Report', 'status': 'completed'})
+
+    snapshot = store.get_progress('news_a')
+    assert appended == 301 and len(snapshot['steps']) == 301
+    assert snapshot['steps'][1]['status'] == 'completed', "Step 2 should be replaced, not appended"
+    assert snapshot['current_step']['step'] == 'Report'
+    assert snapshot['session_id'] == 'news_a' and snapshot['hasActiveProgress']
+
+    store.record_step('news_a', 302, {'step': 'Late step'})
+    assert len(snapshot['steps']) == 301, "Snapshots must not change under the reader"
+    print("✅ 302 step updates recorded in place, snapshot isolated")
+
+
+def test_memory_backend_is_default():
+    store = create_progress_store_from_env()
+    assert store.backend == 'memory'
+    print("✅ In-memory backend used by default")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing progress store...")
+    print("=" * 60)
+    test_set_update_and_get()
+    test_expired_sessions_are_dropped_without_a_scan_thread()
+    test_record_step_updates_in_place()
+    test_memory_backend_is_default()
+    print("=" * 60)
+    print("🎉 All progress store tests passed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test the per-session progress event stream behind /progress/stream/<session_id>
+"""
+
+import threading
+import time
+
+from progress_stream import ProgressStream
+
+
+def test_late_subscriber_gets_replay_then_live_events():
+    stream = ProgressStream()
+    stream.publish('news_a', 'step', {'step': 'Scraping Reddit'})
+    stream.publish('news_a', 'step', {'step': 'Scraping Telegram'})
+
+    received = []
+    subscriber = threading.Thread(
+        target=lambda: received.extend(stream.subscribe('news_a', heartbeat_seconds=1))
+    )
+    subscriber.start()
+    time.sleep(0.1)
+    stream.publish('news_a', 'step', {'step': 'Validating URLs'})
+    stream.finish('news_a', 'completed')
+    subscriber.join(timeout=2)
+
+    assert not subscriber.is_alive(), "Stream should end after the terminal event"
+    assert [event.id for event in received] == [1, 2, 3, 4]
+    assert received[-1].event == 'completed'
+    assert received[-1].to_sse().startswith('id: 4\nevent: completed\ndata: {')
+    print(f"✅ Late subscriber received {len(received)} events (2 replayed)")
+
+
+def test_sessions_are_isolated_and_resume_from_last_event_id():
+    stream = ProgressStream()
+    for i in range(3):
+        stream.publish('news_a', 'step', {'n': i})
+    stream.publish('news_b', 'step', {'n': 'other'})
+    stream.finish('news_a', 'failed', {'error': 'crew crashed'})
+
+    resumed = list(stream.subscribe('news_a', last_event_id=2))
+
+    assert [event.id for event in resumed] == [3, 4]
+    assert all(event.data.get('n') != 'other' for event in resumed)
+    assert resumed[-1].data['error'] == 'crew crashed'
+    assert stream.latest_session_id() == 'news_a'
+    print("✅ Reconnect resumed after event 2, other session untouched")
+
+
+def test_heartbeat_and_idle_sessions_expire():
+    stream = ProgressStream(session_ttl_seconds=0.2)
+    stream.open('news_new')
+
+    events = stream.subscribe('news_new', heartbeat_seconds=0.05)
+    assert next(events) is None, "Idle stream should yield a heartbeat"
+    time.sleep(0.25)
+    assert list(events) == [], "Stream should end once its session is pruned"
+    assert stream.stats()['sessions'] == 0, "Expired session should have been dropped"
+    print("✅ Heartbeat yielded, idle session pruned and its stream ended")
+
+
+def test_unknown_session_ends_without_being_created():
+    stream = ProgressStream(max_sessions=1)
+    stream.publish('news_real', 'step', {})
+
+    assert list(stream.subscribe('news_junk', heartbeat_seconds=0.05)) == []
+    assert not stream.exists('news_junk')
+    assert stream.exists('news_real'), "Junk subscriptions must not evict real sessions"
+    print("✅ Unknown session ended immediately and was not created")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing progress event stream...")
+    print("=" * 60)
+    test_late_subscriber_gets_replay_then_live_events()
+    test_sessions_are_isolated_and_resume_from_last_event_id()
+    test_heartbeat_and_idle_sessions_expire()
+    test_unknown_session_ends_without_being_created()
+    print("=" * 60)
+    print("🎉 All progress stream tests passed")
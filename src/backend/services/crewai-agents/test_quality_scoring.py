@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test that ContentValidator quality scoring is pure CPU given a reachability map
+"""
+
+import os
+import socket
+import sys
+from contextlib import contextmanager
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(current_dir, 'agents'))
+sys.path.insert(0, os.path.join(current_dir, 'tools'))
+
+import dynamic_news_research_crew as dynamic_crew
+import enhanced_news_research_crew as enhanced_crew
+from url_validation import URLCheck, get_url_validator
+
+ARTICLE = {
+    'title': 'Chip startups raise record funding in the first quarter',
+    'content': 'AI chip startups raised more money this quarter than in all of last year. ' * 4,
+    'author': 'Jane Reporter',
+    'url': 'https://news.example.com/chips'
+}
+# 0.5 base + 0.1 title > 20 + 0.1 title > 50 + 0.1 text > 200 + 0.1 author
+SCORE_WITHOUT_URL = 0.9
+SCORE_WITH_URL = 1.0
+
+
+def close(score, expected):
+    return abs(score - expected) < 1e-9
+
+
+@contextmanager
+def no_network():
+    """Fail the test on any outgoing connection"""
+    connect = socket.socket.connect
+
+    def refuse(self, address):
+        raise AssertionError(f"Quality scoring opened a connection to {address}")
+
+    socket.socket.connect = refuse
+    try:
+        yield
+    finally:
+        socket.socket.connect = connect
+
+
+class OfflineURLValidator(enhanced_crew.URLValidator):
+    """Cached verdicts from a dict; any live check fails the test"""
+
+    def __init__(self, cached):
+        self.cached = cached
+
+    def known_reachable(self, url):
+        return self.cached.get(url) is True
+
+    def is_valid_url(self, url):
+        raise AssertionError(f"Quality scoring validated {url} over the network")
+
+    validate_urls = is_valid_url
+
+
+def test_enhanced_scoring_uses_the_map_without_network():
+    validator = enhanced_crew.ContentValidator(OfflineURLValidator({}))
+
+    with no_network():
+        reachable = validator.extract_key_information(ARTICLE, {ARTICLE['url']: True})
+        unreachable = validator.calculate_quality_score(ARTICLE, {ARTICLE['url']: False})
+
+    assert close(reachable['quality_score'], SCORE_WITH_URL)
+    assert reachable['title'] == ARTICLE['title'] and reachable['url'] == ARTICLE['url']
+    assert reachable['summary'].endswith('...')
+    assert close(unreachable, SCORE_WITHOUT_URL)
+    print("✅ Enhanced crew scored from the reachability map with no network access")
+
+
+def test_enhanced_scoring_falls_back_to_cached_verdicts():
+    validator = enhanced_crew.ContentValidator(OfflineURLValidator({ARTICLE['url']: True}))
+
+    with no_network():
+        missing_from_map = validator.calculate_quality_score(ARTICLE, {'https://other.example.com/': True})
+        without_map = validator.calculate_quality_score(ARTICLE)
+        never_checked = validator.calculate_quality_score({**ARTICLE, 'url': 'https://unseen.example.com/'}, {})
+
+    assert close(missing_from_map, SCORE_WITH_URL) and close(without_map, SCORE_WITH_URL)
+    assert close(never_checked, SCORE_WITHOUT_URL)
+    print("✅ URLs missing from the map scored from the cached verdict")
+
+
+def test_dynamic_scoring_is_pure_cpu():
+    url = 'https://cached.example.com/story'
+    get_url_validator().verdicts.set(url, URLCheck(url=url, is_valid=True, status_code=200))
+    validator = dynamic_crew.ContentValidator
+
+    with no_network():
+        from_map = validator.extract_key_information(ARTICLE, {ARTICLE['url']: True})
+        from_cache = validator.calculate_quality_score({**ARTICLE, 'url': url}, {ARTICLE['url']: False})
+        never_checked = validator.calculate_quality_score({**ARTICLE, 'url': 'https://unseen.example.com/'})
+
+    assert close(from_map['quality_score'], SCORE_WITH_URL)
+    assert close(from_cache, SCORE_WITH_URL), "A URL missing from the map should use the shared verdict cache"
+    assert close(never_checked, SCORE_WITHOUT_URL)
+    print("✅ Dynamic crew scored from the map and the shared verdict cache with no network access")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing quality scoring...")
+    print("=" * 60)
+    test_enhanced_scoring_uses_the_map_without_network()
+    test_enhanced_scoring_falls_back_to_cached_verdicts()
+    test_dynamic_scoring_is_pure_cpu()
+    print("=" * 60)
+    print("🎉 All quality scoring tests passed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test the adaptive per-host rate limiter without network access
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from rate_limiter import AdaptiveRateLimiter, TokenBucket
+
+URL = 'https://www.reddit.com/r/technology/hot.json'
+
+
+def test_burst_does_not_sleep():
+    """Requests within the burst budget go out immediately"""
+    limiter = AdaptiveRateLimiter(rate=1.0, burst=5)
+
+    started = time.monotonic()
+    waits = [limiter.acquire(URL) for _ in range(5)]
+
+    assert waits == [0.0] * 5
+    assert time.monotonic() - started < 0.1
+    print("✅ Burst of 5 requests sent without sleeping")
+
+
+def test_exhausted_budget_waits():
+    """Once the bucket is empty callers are spaced at the refill rate"""
+    limiter = AdaptiveRateLimiter(rate=20.0, burst=1, max_rate=20.0)
+
+    limiter.acquire(URL)
+    waited = limiter.acquire(URL)
+
+    assert 0.03 < waited <= 0.06
+    print(f"✅ Second request waited {waited:.3f}s for a token")
+
+
+def test_ratelimit_headers_adapt_rate():
+    """X-Ratelimit-Remaining/Reset spread the remaining budget over the window"""
+    limiter = AdaptiveRateLimiter(rate=1.0, burst=5, max_rate=10.0)
+
+    limiter.observe(URL, 200, {'X-Ratelimit-Remaining': '30', 'X-Ratelimit-Reset': '60'})
+    assert limiter.bucket(URL).rate == 0.5
+
+    limiter.observe(URL, 200, {'X-Ratelimit-Remaining': '0', 'X-Ratelimit-Reset': '2'})
+    assert limiter.bucket(URL).reserve() > 1.5
+    print("✅ Rate follows X-Ratelimit headers and blocks until reset when exhausted")
+
+
+def test_exhausted_budget_pause_is_clamped():
+    """A far-off reset is capped at max_backoff, and the reported pause matches"""
+    limiter = AdaptiveRateLimiter(rate=1.0, burst=5, max_backoff=5.0)
+
+    delay = limiter.observe(URL, 200, {'X-Ratelimit-Remaining': '0', 'X-Ratelimit-Reset': '600'})
+
+    assert delay == 5.0
+    assert 4.5 < limiter.bucket(URL).blocked_until - time.monotonic() <= 5.0
+    print("✅ Exhausted budget paused for max_backoff, not the full reset window")
+
+
+def test_callers_queued_during_a_block_are_spaced_after_it():
+    """Reservations made while blocked leave one refill interval apart once the block lifts"""
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    assert bucket.reserve() == 0.0
+
+    bucket.block_for(3)
+    waits = [bucket.reserve() for _ in range(4)]
+
+    gaps = [later - earlier for earlier, later in zip(waits, waits[1:])]
+    assert all(wait >= 3.0 for wait in waits)
+    assert all(abs(gap - 1.0) < 0.01 for gap in gaps), f"Callers fire together after the block: {waits}"
+    print(f"✅ Callers queued behind a 3s block spaced 1s apart ({', '.join(f'{w:.1f}' for w in waits)})")
+
+
+def test_429_backs_off_and_halves_rate():
+    limiter = AdaptiveRateLimiter(rate=2.0, burst=5)
+
+    delay = limiter.observe(URL, 429, {'Retry-After': '3'})
+
+    assert delay == 3.0
+    assert limiter.bucket(URL).rate == 1.0
+    assert limiter.bucket(URL).reserve() > 2.5
+    assert limiter.bucket('https://other.example.com/').reserve() == 0.0, "Other hosts are unaffected"
+    print("✅ 429 honoured Retry-After and halved the rate for that host only")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing adaptive rate limiter...")
+    print("=" * 60)
+    test_burst_does_not_sleep()
+    test_exhausted_budget_waits()
+    test_ratelimit_headers_adapt_rate()
+    test_exhausted_budget_pause_is_clamped()
+    test_callers_queued_during_a_block_are_spaced_after_it()
+    test_429_backs_off_and_halves_rate()
+    print("=" * 60)
+    print("🎉 All rate limiter tests passed")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test the Redis progress backend (PROGRESS_BACKEND=redis) against fakeredis
+
+Needs the dev requirements: pip install -r requirements-dev.txt
+"""
+
+import threading
+import time
+from itertools import islice
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from progress_store import RedisProgressStore
+from progress_stream import RedisProgressStream
+
+
+def test_set_update_and_get():
+    store = RedisProgressStore(fakeredis.FakeRedis())
+    store.set_progress('news_a', {'steps': [{'step': 'Start'}], 'hasActiveProgress': True})
+    store.update_progress('news_a', {'status': 'completed'})
+    store.update_progress('news_missing', {'status': 'completed'})
+
+    assert store.get_progress('news_a') == {
+        'steps': [{'step': 'Start'}], 'hasActiveProgress': True, 'status': 'completed'
+    }
+    assert store.get_progress('news_missing') == {}, "Updates must not create sessions"
+    assert store.redis.ttl('progress:news_a') > 0
+    print("✅ Progress stored, merged and read back from Redis")
+
+
+def test_expired_session_is_not_revived_by_updates():
+    store = RedisProgressStore(fakeredis.FakeRedis())
+    store.set_progress('news_old', {'status': 'running'})
+    store.redis.delete('progress:news_old', 'progress:news_old:steps')
+
+    store.update_progress('news_old', {'status': 'completed'})
+
+    assert store.get_progress('news_old') == {}
+    print("✅ Expired Redis session stayed expired")
+
+
+def test_concurrent_appends_get_distinct_step_numbers():
+    server = fakeredis.FakeServer()
+    numbers = []
+
+    def worker(name):
+        # One client per thread, like separate gunicorn workers
+        store = RedisProgressStore(fakeredis.FakeRedis(server=server))
+        for i in range(20):
+            numbers.append(store.record_step('news_a', None, {'step': f'{name} {i}'}))
+
+    threads = [threading.Thread(target=worker, args=(f'worker {n}',)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = RedisProgressStore(fakeredis.FakeRedis(server=server)).get_progress('news_a')
+    assert sorted(numbers) == list(range(1, 81)), "Every appended step must get its own number"
+    assert len(snapshot['steps']) == 80
+    assert snapshot['session_id'] == 'news_a' and snapshot['hasActiveProgress']
+    print("✅ 80 concurrent appends numbered 1..80 without collisions")
+
+
+def test_record_step_replaces_numbered_step():
+    store = RedisProgressStore(fakeredis.FakeRedis())
+    store.record_step('news_a', 1, {'step': 'Reddit', 'status': 'in_progress'})
+    store.record_step('news_a', 1, {'step': 'Reddit', 'status': 'completed'})
+
+    snapshot = store.get_progress('news_a')
+    assert snapshot['steps'] == [{'step': 'Reddit', 'status': 'completed'}]
+    assert snapshot['current_step']['status'] == 'completed'
+    print("✅ Numbered step replaced in place")
+
+
+def test_stream_replays_then_delivers_live_events_over_pubsub():
+    server = fakeredis.FakeServer()
+    publisher = RedisProgressStream(fakeredis.FakeRedis(server=server))
+    subscriber = RedisProgressStream(fakeredis.FakeRedis(server=server))
+    publisher.open('news_a')
+    publisher.publish('news_a', 'step', {'step': 'Scraping Reddit'})
+
+    received = []
+    thread = threading.Thread(
+        target=lambda: received.extend(subscriber.subscribe('news_a', heartbeat_seconds=0.1))
+    )
+    thread.start()
+    time.sleep(0.2)
+    publisher.publish('news_a', 'step', {'step': 'Validating URLs'})
+    publisher.finish('news_a', 'completed')
+    thread.join(timeout=2)
+
+    events = [event for event in received if event is not None]
+    assert not thread.is_alive(), "Stream should end after the terminal event"
+    assert [event.id for event in events] == [1, 2, 3]
+    assert events[-1].event == 'completed'
+    assert subscriber.latest_session_id() == 'news_a'
+    print("✅ Subscriber on another client got 1 replayed and 2 live events")
+
+
+def test_stream_reconnect_after_terminal_event_ends():
+    stream = RedisProgressStream(fakeredis.FakeRedis())
+    for i in range(3):
+        stream.publish('news_a', 'step', {'n': i})
+    stream.finish('news_a', 'completed')
+
+    assert [event.id for event in stream.subscribe('news_a', last_event_id=2)] == [3, 4]
+    for last_event_id in (4, 5):
+        # islice keeps a regression from heartbeating until the session expires
+        events = list(islice(stream.subscribe('news_a', last_event_id=last_event_id, heartbeat_seconds=0.05), 3))
+        assert events == [], f"Reconnect at event {last_event_id} should end, got {events}"
+    print("✅ Reconnect at or past the terminal event ended without heartbeats")
+
+
+def test_stream_unknown_session_ends_immediately():
+    stream = RedisProgressStream(fakeredis.FakeRedis())
+
+    assert list(stream.subscribe('news_junk', heartbeat_seconds=0.05)) == []
+    assert not stream.exists('news_junk')
+    print("✅ Unknown Redis session ended immediately")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing Redis progress backend...")
+    print("=" * 60)
+    test_set_update_and_get()
+    test_expired_session_is_not_revived_by_updates()
+    test_concurrent_appends_get_distinct_step_numbers()
+    test_record_step_replaces_numbered_step()
+    test_stream_replays_then_delivers_live_events_over_pubsub()
+    test_stream_reconnect_after_terminal_event_ends()
+    test_stream_unknown_session_ends_immediately()
+    print("=" * 60)
+    print("🎉 All Redis progress tests passed")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test the persistent subreddit existence cache
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from subreddit_cache import SubredditCache
+
+
+def test_rank_skips_dead_and_prefers_known_good():
+    cache = SubredditCache()
+    cache.mark('teslanews', False)
+    cache.mark('teslamotors', True)
+
+    ranked = cache.rank(['tesla', 'teslanews', 'TeslaMotors', 'tesla', 'news'])
+
+    assert ranked == ['TeslaMotors', 'tesla', 'news']
+    print(f"✅ Ranked subreddits: {ranked}")
+
+
+def test_entries_expire():
+    cache = SubredditCache(negative_ttl=0)
+    cache.mark('thetesla', False)
+
+    assert cache.status('thetesla') is None
+    assert cache.rank(['thetesla']) == ['thetesla']
+    print("✅ Expired negative entry is retried")
+
+
+def test_cache_persists_between_runs():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'subreddits.json')
+        cache = SubredditCache(path=path)
+        cache.mark('teslahub', False)
+        cache.mark('teslamotors', True)
+        cache.save()
+
+        reloaded = SubredditCache(path=path)
+        assert reloaded.status('teslahub') is False
+        assert reloaded.status('teslamotors') is True
+        print("✅ Cache reloaded from disk")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing subreddit existence cache...")
+    print("=" * 60)
+    test_rank_skips_dead_and_prefers_known_good()
+    test_entries_expire()
+    test_cache_persists_between_runs()
+    print("=" * 60)
+    print("🎉 All subreddit cache tests passed")
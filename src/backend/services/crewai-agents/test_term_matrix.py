@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test the sparse term matrix behind NewsAnalysisTool's batch analysis
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from term_matrix import TermMatrix
+
+ARTICLES = [
+    {'title': 'AI growth', 'content': 'Market growth beats the window of growth'},
+    {'title': 'Crisis talk', 'content': 'Failed launch, market loss_rate up; x1y data'},
+    {'title': '', 'content': ''}
+]
+
+
+def test_counts_follow_the_old_regex_tokens():
+    matrix = TermMatrix.from_articles(ARTICLES)
+
+    words, unique_words = matrix.top_terms(matrix.term_mask(4, {'talk'}), 5)
+
+    # Ties keep first-occurrence order; x1y and loss_rate are not \b[a-zA-Z]{4,}\b words
+    assert words == [('growth', 3), ('market', 2), ('beats', 1), ('window', 1), ('crisis', 1)]
+    assert unique_words == 8
+    assert matrix.document_count == 3
+    print(f"✅ {len(matrix.terms)} terms, {len(matrix.counts)} non-zero cells")
+
+
+def test_lexicon_hits_match_substring_checks():
+    matrix = TermMatrix.from_articles(ARTICLES)
+    lexicon = ['win', 'growth', 'fail', 'loss', 'missing']
+
+    hits = matrix.lexicon_hits(lexicon)
+
+    texts = [f"{article['title']} {article['content']}".lower() for article in ARTICLES]
+    assert hits.tolist() == [sum(1 for word in lexicon if word in text) for text in texts]
+    assert TermMatrix([]).lexicon_hits(lexicon).tolist() == []
+    print(f"✅ Lexicon hits per article {hits.tolist()} agree with `word in text`")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing term matrix...")
+    print("=" * 60)
+    test_counts_follow_the_old_regex_tokens()
+    test_lexicon_hits_match_substring_checks()
+    print("=" * 60)
+    print("🎉 All term matrix tests passed")
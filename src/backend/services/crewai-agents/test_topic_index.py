@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test the inverted topic index behind cross-platform trend counting
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from topic_index import TopicIndex
+
+
+def build_index():
+    index = TopicIndex()
+    index.add(('reddit', 0), 'AI startups raise funding', 'Machine learning is hot')
+    index.add(('reddit', 1), 'She said the weather was fine')
+    index.add(('telegram', 0), 'Robotics startup news: machine learning for robots')
+    index.add(('news', 0), 'Learning machines', 'Machine learning, machine learning everywhere')
+    return index
+
+
+def test_topics_match_whole_tokens_and_prefix_extensions():
+    index = build_index()
+
+    assert index.keys_for('AI') == {('reddit', 0)}, "'AI' must not match inside 'said'"
+    assert index.keys_for('startup') == {('reddit', 0), ('telegram', 0)}
+    assert index.keys_for('robot') == {('telegram', 0)}
+    assert index.keys_for('') == set()
+    print(f"✅ {len(index)} items indexed, whole-token and prefix matches correct")
+
+
+def test_phrases_need_adjacent_terms_within_one_text():
+    index = build_index()
+
+    assert index.postings('machine learning') == {('reddit', 0): 1, ('telegram', 0): 1, ('news', 0): 2}
+    assert index.count('weather', ('reddit', 1)) == 1
+    # 'funding' ends the title and 'Machine' starts the body - no phrase across them
+    assert index.keys_for('funding machine') == set()
+    print("✅ Phrase counts use positions and never span title and body")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing topic index...")
+    print("=" * 60)
+    test_topics_match_whole_tokens_and_prefix_extensions()
+    test_phrases_need_adjacent_terms_within_one_text()
+    print("=" * 60)
+    print("🎉 All topic index tests passed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test batch URL validation against a local HTTP server (no internet access needed)
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tools'))
+
+from http_client import HttpClient
+from url_validation import BatchURLValidator
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Every request takes 0.3s; /missing returns 404, /nohead rejects HEAD"""
+    hits = []
+
+    def _respond(self, method):
+        SlowHandler.hits.append((method, self.path))
+        time.sleep(0.3)
+        if self.path == '/missing':
+            status = 404
+        elif self.path == '/nohead' and method == 'HEAD':
+            status = 405
+        else:
+            status = 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._respond('HEAD')
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_batch_is_concurrent_deduped_and_cached():
+    server, base = _start_server()
+    http = HttpClient(per_host_limit=10)
+    validator = BatchURLValidator(http=http)
+    try:
+        # Pay the one-time loop thread / client setup outside the timed batch
+        http.head(f"{base}/warmup")
+        SlowHandler.hits = []
+        urls = [f"{base}/article/{i}" for i in range(8)] + [f"{base}/article/0", f"{base}/missing", "not a url"]
+
+        started = time.monotonic()
+        verdicts = validator.validate_many(urls)
+        elapsed = time.monotonic() - started
+
+        sequential = 9 * 0.3
+        assert elapsed < sequential / 2, f"Batch took {elapsed:.2f}s - checks were not concurrent"
+        assert len(SlowHandler.hits) == 9, "Duplicate and malformed URLs must not be requested"
+        assert verdicts[f"{base}/article/3"] is True
+        assert verdicts[f"{base}/missing"] is False
+        assert verdicts["not a url"] is False
+
+        validator.validate_many(urls)
+        assert len(SlowHandler.hits) == 9, "Second pass should be served from the verdict cache"
+        assert validator.cached_verdict(f"{base}/missing") is False
+        print(f"✅ 9 unique URLs validated in {elapsed:.2f}s, second pass fully cached")
+    finally:
+        http.close()
+        server.shutdown()
+
+
+def test_head_rejected_falls_back_to_get():
+    server, base = _start_server()
+    http = HttpClient()
+    try:
+        check = BatchURLValidator(http=http).check_many([f"{base}/nohead"])[f"{base}/nohead"]
+        assert check.is_valid and check.status_code == 200
+        print("✅ 405 on HEAD retried with GET")
+    finally:
+        http.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    print("🧪 Testing batch URL validation...")
+    print("=" * 60)
+    test_batch_is_concurrent_deduped_and_cached()
+    test_head_rejected_falls_back_to_get()
+    print("=" * 60)
+    print("🎉 All URL validation tests passed")
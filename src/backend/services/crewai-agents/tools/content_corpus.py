@@ -0,0 +1,161 @@
+"""
+Content Corpus
+Immutable, pre-normalized view of one batch of collected content, built once
+per ultra-thinking run and shared by every agent: the joined analysis text,
+its lowercased form, token offsets, per-item boundaries and per-topic spans.
+Agents slice context windows out of it instead of re-joining and re-searching
+the content in every phase
+"""
+
+import bisect
+import hashlib
+import json
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pattern_matcher import PatternMatcher
+
+_TOKEN = re.compile(r"\w+")
+
+Span = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class CorpusItem:
+    """Where one content item sits in the corpus text"""
+    source: str   # top-level content key
+    index: int    # position in that key's list, -1 for a plain string value
+    start: int
+    end: int
+
+
+def _lowercase(text: str) -> str:
+    # Keep offsets valid for characters whose lowercase form is longer (e.g. 'İ')
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+class ContentCorpus(Mapping):
+    """Read-only mapping over the original content plus its normalized text
+
+    `text` is exactly what the agents' old text extraction produced: every
+    string value, and every list entry that is a string or a dict with a
+    'content' field, joined with single spaces. All offsets (entries, tokens,
+    topic spans, pattern hits) index both `text` and `lower_text`.
+    """
+
+    def __init__(self, content: Optional[Mapping] = None, topics: Iterable[str] = ()):
+        content = dict(content) if isinstance(content, Mapping) else {}
+        parts: List[str] = []
+        items: List[CorpusItem] = []
+        offset = 0
+        for key, value in content.items():
+            if isinstance(value, str):
+                entries = [(-1, value)]
+            elif isinstance(value, list):
+                entries = [
+                    (index, item if isinstance(item, str) else str(item['content']))
+                    for index, item in enumerate(value)
+                    if isinstance(item, str) or (isinstance(item, dict) and 'content' in item)
+                ]
+            else:
+                continue
+            for index, part in entries:
+                start = offset + 1 if parts else 0
+                items.append(CorpusItem(key, index, start, start + len(part)))
+                parts.append(part)
+                offset = start + len(part)
+
+        text = " ".join(parts)
+        lower_text = _lowercase(text)
+        topics = tuple(dict.fromkeys(topic for topic in topics if topic))
+        topic_spans: Dict[str, List[Span]] = {topic: [] for topic in topics}
+        for hit in PatternMatcher(topics).find_all(text):
+            topic_spans[hit.pattern].append((hit.start, hit.end))
+
+        object.__setattr__(self, '_content', content)
+        object.__setattr__(self, 'text', text)
+        object.__setattr__(self, 'lower_text', lower_text)
+        object.__setattr__(self, 'entries', tuple(items))
+        object.__setattr__(self, 'tokens', tuple(match.span() for match in _TOKEN.finditer(lower_text)))
+        object.__setattr__(self, 'topics', topics)
+        object.__setattr__(self, '_topic_spans', {topic: tuple(spans) for topic, spans in topic_spans.items()})
+        object.__setattr__(self, '_item_starts', [item.start for item in items])
+        object.__setattr__(self, '_token_starts', [start for start, _ in self.tokens])
+        object.__setattr__(self, 'digest', hashlib.sha1(
+            json.dumps(content, sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest())
+
+    @classmethod
+    def of(cls, content: Any, topics: Iterable[str] = ()) -> 'ContentCorpus':
+        """The corpus itself if one was passed in, otherwise a new one over `content`"""
+        if isinstance(content, cls):
+            return content
+        return cls(content, topics)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ContentCorpus is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ContentCorpus is immutable")
+
+    # Mapping over the original content, so a corpus can be passed wherever content is
+    def __getitem__(self, key: str) -> Any:
+        return self._content[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._content)
+
+    def __len__(self) -> int:
+        return len(self._content)
+
+    def __repr__(self) -> str:
+        return f"ContentCorpus(entries={len(self.entries)}, chars={len(self.text)}, topics={list(self.topics)})"
+
+    def window(self, start: int, end: int, radius: int = 100) -> str:
+        """Text around [start, end) - the context window for a pattern hit"""
+        return self.text[max(0, start - radius):min(len(self.text), end + radius)]
+
+    def find(self, phrase: str) -> int:
+        """Offset of the first case-insensitive occurrence of a phrase, -1 if absent"""
+        return self.lower_text.find(_lowercase(phrase))
+
+    def item_at(self, offset: int) -> Optional[CorpusItem]:
+        """Content item whose text contains the offset"""
+        position = bisect.bisect_right(self._item_starts, offset) - 1
+        if position >= 0 and offset < self.entries[position].end:
+            return self.entries[position]
+        return None
+
+    def tokens_in(self, start: int, end: int) -> Tuple[Span, ...]:
+        """Token offsets that start inside [start, end)"""
+        low = bisect.bisect_left(self._token_starts, start)
+        high = bisect.bisect_left(self._token_starts, end)
+        return self.tokens[low:high]
+
+    def topic_spans(self, topic: str) -> Tuple[Span, ...]:
+        """Offsets of every mention of a topic; precomputed for the corpus topics"""
+        spans = self._topic_spans.get(topic)
+        if spans is None:
+            spans = tuple((hit.start, hit.end) for hit in PatternMatcher([topic]).find_all(self.text))
+        return spans
+
+    def topic_items(self, topic: str) -> List[CorpusItem]:
+        """Content items that mention a topic, in corpus order"""
+        found = {self.item_at(start) for start, _ in self.topic_spans(topic)}
+        return [item for item in self.entries if item in found]
+
+    def topic_context(self, topic: str, radius: int = 100) -> str:
+        """Context windows around every mention of a topic, overlapping windows merged"""
+        merged: List[List[int]] = []
+        for start, end in self.topic_spans(topic):
+            start, end = max(0, start - radius), min(len(self.text), end + radius)
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return " ".join(self.text[start:end] for start, end in merged)
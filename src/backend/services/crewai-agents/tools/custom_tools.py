@@ -4,9 +4,10 @@ Implements search, scraping, and analysis tools without external dependencies
 """
 
 import os
-import requests
+import sys
 import json
 import re
+import numpy as np
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from datetime import datetime
 from urllib.parse import urlparse, urljoin
@@ -37,6 +38,16 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client lives next to this module
+tools_dir = os.path.dirname(os.path.abspath(__file__))
+if tools_dir not in sys.path:
+    sys.path.insert(0, tools_dir)
+
+from http_client import get_http_client, HttpClientError
+from hn_client import get_hn_client
+from url_validation import get_url_validator
+from term_matrix import TermMatrix
+
 from crewai.tools import BaseTool as CrewAIBaseTool
 from pydantic import BaseModel, Field
 from typing import Type
@@ -73,8 +84,7 @@ class WebSearchTool(BaseTool):
     def __init__(self):
         super().__init__()
         # Initialize session after super().__init__()
-        session = requests.Session()
-        session.headers.update({
+        session = get_http_client().session(headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         object.__setattr__(self, 'session', session)
@@ -126,16 +136,12 @@ class WebSearchTool(BaseTool):
         """Search Hacker News"""
         results = []
         try:
-            # Get top stories
-            response = self.session.get('https://hacker-news.firebaseio.com/v0/topstories.json', timeout=10)
-            story_ids = response.json()[:50]
-            
-            for story_id in story_ids[:max_results]:
+            # Top stories, hydrated concurrently through the shared item cache
+            hn = get_hn_client()
+            for item in hn.get_items(hn.top_story_ids(max_results)):
+                story_id = item.get('id')
                 try:
-                    item_response = self.session.get(f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json', timeout=5)
-                    item = item_response.json()
-                    
-                    if item and item.get('title') and query.lower() in item.get('title', '').lower():
+                    if item.get('title') and query.lower() in item.get('title', '').lower():
                         results.append({
                             'title': item.get('title', ''),
                             'url': item.get('url', f'https://news.ycombinator.com/item?id={story_id}'),
@@ -249,8 +255,7 @@ class WebScrapeTool(BaseTool):
     def __init__(self):
         super().__init__()
         # Initialize session after super().__init__()
-        session = requests.Session()
-        session.headers.update({
+        session = get_http_client().session(headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         object.__setattr__(self, 'session', session)
@@ -302,7 +307,7 @@ class WebScrapeTool(BaseTool):
                 "content_length": len(str(content))
             }
             
-        except requests.RequestException as e:
+        except HttpClientError as e:
             return {
                 "success": False,
                 "error": f"Request failed: {str(e)}",
@@ -544,8 +549,7 @@ class FirecrawlScrapeTool(BaseTool):
     def _fallback_scrape(self, url: str) -> Dict[str, Any]:
         """Fallback to basic scraping when Firecrawl is unavailable"""
         try:
-            session = requests.Session()
-            session.headers.update({
+            session = get_http_client().session(headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             })
             
@@ -594,6 +598,21 @@ class FirecrawlScrapeTool(BaseTool):
                 "url": url
             }
 
+# Lexicons and stopwords for NewsAnalysisTool
+TREND_STOPWORDS = frozenset([
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out',
+    'day', 'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy',
+    'did', 'man', 'way'
+])
+KEYWORD_STOPWORDS = frozenset([
+    'this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'said', 'each', 'which', 'their', 'time',
+    'would', 'there', 'could', 'other'
+])
+TECH_KEYWORDS = ['ai', 'artificial', 'intelligence', 'machine', 'learning', 'technology', 'software', 'data', 'algorithm']
+BUSINESS_KEYWORDS = ['business', 'company', 'market', 'startup', 'investment', 'funding', 'revenue', 'growth']
+POSITIVE_WORDS = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'positive', 'success', 'win', 'growth', 'innovation', 'breakthrough']
+NEGATIVE_WORDS = ['bad', 'terrible', 'awful', 'horrible', 'negative', 'fail', 'failure', 'problem', 'issue', 'crisis', 'decline', 'loss']
+
 class NewsAnalysisToolInput(BaseModel):
     articles: List[Dict[str, Any]] = Field(..., description="List of articles to analyze")
     analysis_type: str = Field(default="trends", description="Type of analysis: 'trends', 'sentiment', 'keywords', or 'comprehensive'")
@@ -632,43 +651,27 @@ class NewsAnalysisTool(BaseTool):
                 "analysis_type": analysis_type
             }
     
-    def _analyze_trends(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_trends(self, articles: List[Dict[str, Any]], matrix: Optional[TermMatrix] = None) -> Dict[str, Any]:
         """Analyze trending topics"""
-        word_freq = {}
+        matrix = matrix or TermMatrix.from_articles(articles)
         topics = []
         
-        for article in articles:
-            title = article.get('title', '').lower()
-            content = article.get('content', '').lower()
-            text = f"{title} {content}"
-            
-            # Extract meaningful words (simple approach)
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text)
-            for word in words:
-                if word not in ['the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy', 'did', 'man', 'way']:
-                    word_freq[word] = word_freq.get(word, 0) + 1
+        # Meaningful words: 3+ letters, no stopwords
+        mask = matrix.term_mask(3, TREND_STOPWORDS)
+        totals = np.where(mask, matrix.term_totals(), 0)
         
         # Get top trending words
-        trending_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:20]
+        trending_words, _ = matrix.top_terms(mask, 20)
         
         # Identify topics based on word clusters
-        tech_keywords = ['ai', 'artificial', 'intelligence', 'machine', 'learning', 'technology', 'software', 'data', 'algorithm']
-        business_keywords = ['business', 'company', 'market', 'startup', 'investment', 'funding', 'revenue', 'growth']
-        
-        tech_score = sum(word_freq.get(word, 0) for word in tech_keywords)
-        business_score = sum(word_freq.get(word, 0) for word in business_keywords)
-        
-        topics.append({
-            'topic': 'Technology',
-            'score': tech_score,
-            'keywords': [word for word in tech_keywords if word in word_freq]
-        })
-        
-        topics.append({
-            'topic': 'Business',
-            'score': business_score,
-            'keywords': [word for word in business_keywords if word in word_freq]
-        })
+        for topic, keywords in [('Technology', TECH_KEYWORDS), ('Business', BUSINESS_KEYWORDS)]:
+            term_ids = [matrix.vocabulary[word] for word in keywords if word in matrix.vocabulary]
+            found = [term for term in term_ids if totals[term]]
+            topics.append({
+                'topic': topic,
+                'score': int(totals[found].sum()),
+                'keywords': [matrix.terms[term] for term in found]
+            })
         
         return {
             "success": True,
@@ -679,36 +682,26 @@ class NewsAnalysisTool(BaseTool):
             "timestamp": datetime.now().isoformat()
         }
     
-    def _analyze_sentiment(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_sentiment(self, articles: List[Dict[str, Any]], matrix: Optional[TermMatrix] = None) -> Dict[str, Any]:
         """Simple sentiment analysis"""
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic', 'positive', 'success', 'win', 'growth', 'innovation', 'breakthrough']
-        negative_words = ['bad', 'terrible', 'awful', 'horrible', 'negative', 'fail', 'failure', 'problem', 'issue', 'crisis', 'decline', 'loss']
+        matrix = matrix or TermMatrix.from_articles(articles)
         
-        sentiments = []
+        # Lexicon words present per article, for every article at once
+        positive = matrix.lexicon_hits(POSITIVE_WORDS)
+        negative = matrix.lexicon_hits(NEGATIVE_WORDS)
+        scores = np.where(positive == negative, 0.5, np.maximum(positive, negative) / (positive + negative + 1))
+        labels = np.where(positive > negative, 'positive', np.where(negative > positive, 'negative', 'neutral'))
         
-        for article in articles:
-            text = f"{article.get('title', '')} {article.get('content', '')}".lower()
-            
-            positive_count = sum(1 for word in positive_words if word in text)
-            negative_count = sum(1 for word in negative_words if word in text)
-            
-            if positive_count > negative_count:
-                sentiment = 'positive'
-                score = positive_count / (positive_count + negative_count + 1)
-            elif negative_count > positive_count:
-                sentiment = 'negative'
-                score = negative_count / (positive_count + negative_count + 1)
-            else:
-                sentiment = 'neutral'
-                score = 0.5
-            
-            sentiments.append({
+        sentiments = [
+            {
                 'title': article.get('title', ''),
-                'sentiment': sentiment,
-                'score': score,
-                'positive_signals': positive_count,
-                'negative_signals': negative_count
-            })
+                'sentiment': str(labels[index]),
+                'score': float(scores[index]),
+                'positive_signals': int(positive[index]),
+                'negative_signals': int(negative[index])
+            }
+            for index, article in enumerate(articles)
+        ]
         
         # Overall sentiment
         avg_score = sum(s['score'] for s in sentiments) / len(sentiments) if sentiments else 0.5
@@ -723,35 +716,28 @@ class NewsAnalysisTool(BaseTool):
             "timestamp": datetime.now().isoformat()
         }
     
-    def _extract_keywords(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _extract_keywords(self, articles: List[Dict[str, Any]], matrix: Optional[TermMatrix] = None) -> Dict[str, Any]:
         """Extract key terms and phrases"""
-        all_text = ""
-        for article in articles:
-            all_text += f" {article.get('title', '')} {article.get('content', '')}"
+        matrix = matrix or TermMatrix.from_articles(articles)
         
-        # Simple keyword extraction
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', all_text.lower())
-        word_freq = {}
-        
-        for word in words:
-            if word not in ['this', 'that', 'with', 'have', 'will', 'from', 'they', 'been', 'said', 'each', 'which', 'their', 'time', 'would', 'there', 'could', 'other']:
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:30]
+        # Simple keyword extraction: 4+ letters, no stopwords
+        keywords, unique_words = matrix.top_terms(matrix.term_mask(4, KEYWORD_STOPWORDS), 30)
         
         return {
             "success": True,
             "analysis_type": "keywords",
             "keywords": keywords,
-            "total_unique_words": len(word_freq),
+            "total_unique_words": unique_words,
             "timestamp": datetime.now().isoformat()
         }
     
     def _comprehensive_analysis(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Comprehensive analysis combining all methods"""
-        trends = self._analyze_trends(articles)
-        sentiment = self._analyze_sentiment(articles)
-        keywords = self._extract_keywords(articles)
+        # Tokenize once; every analysis reads the same term matrix
+        matrix = TermMatrix.from_articles(articles)
+        trends = self._analyze_trends(articles, matrix)
+        sentiment = self._analyze_sentiment(articles, matrix)
+        keywords = self._extract_keywords(articles, matrix)
         
         return {
             "success": True,
@@ -781,12 +767,8 @@ class URLValidatorTool(BaseTool):
     
     def __init__(self):
         super().__init__()
-        # Initialize session after super().__init__()
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        object.__setattr__(self, 'session', session)
+        # Accessibility checks go through the shared batch validator and its verdict cache
+        object.__setattr__(self, 'validator', get_url_validator())
     
     def _run(self, urls: List[str], check_accessibility: bool = True) -> str:
         """Execute URL validation - returns JSON string for CrewAI compatibility"""
@@ -808,19 +790,21 @@ class URLValidatorTool(BaseTool):
                     'redirect_url': None,
                     'error': None
                 }
-                
-                if check_accessibility and result['is_valid_format']:
-                    try:
-                        response = self.session.head(result['cleaned_url'], timeout=10, allow_redirects=True)
-                        result['is_accessible'] = response.status_code < 400
-                        result['status_code'] = response.status_code
-                        if response.url != result['cleaned_url']:
-                            result['redirect_url'] = response.url
-                    except Exception as e:
-                        result['error'] = str(e)
-                
                 results.append(result)
             
+            if check_accessibility:
+                # All accessibility checks run concurrently in one deduped batch
+                checks = self.validator.check_many([r['cleaned_url'] for r in results if r['is_valid_format']])
+                for result in results:
+                    check = checks.get(result['cleaned_url']) if result['is_valid_format'] else None
+                    if check is None:
+                        continue
+                    result['is_accessible'] = check.is_valid
+                    result['status_code'] = check.status_code
+                    result['error'] = check.error
+                    if check.final_url and check.final_url != result['cleaned_url']:
+                        result['redirect_url'] = check.final_url
+            
             valid_urls = [r['cleaned_url'] for r in results if r['is_valid_format'] and (not check_accessibility or r['is_accessible'])]
             
             return {
@@ -0,0 +1,231 @@
+"""
+RSS Feed Cache
+Conditional-GET cache for RSS/Atom feeds: stores ETag/Last-Modified per feed
+URL, revalidates with If-None-Match/If-Modified-Since and reuses the already
+parsed entries on a 304. Works in memory or persisted to disk.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+try:
+    import feedparser
+    FEEDPARSER_AVAILABLE = True
+except ImportError:
+    FEEDPARSER_AVAILABLE = False
+    feedparser = None
+
+from http_client import get_http_client, HttpClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedFeed:
+    """Parsed entries plus the validators needed to revalidate them"""
+    url: str
+    entries: List[Any] = field(default_factory=list)
+    feed: Dict[str, Any] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+@dataclass
+class FeedResult:
+    """Result of FeedCache.fetch - shaped like a feedparser result (entries, feed)
+
+    cache_status is 'fresh' (served without a request), 'revalidated' (304),
+    'fetched' (downloaded and parsed), 'stale' (request failed, old copy served)
+    or 'error'. Entries are shared between callers and must not be mutated.
+    """
+    url: str
+    entries: List[Any] = field(default_factory=list)
+    feed: Dict[str, Any] = field(default_factory=dict)
+    cache_status: str = 'error'
+    http_status: Optional[int] = None
+    error: Optional[str] = None
+
+
+class FeedCache:
+    """Per-URL feed cache with a freshness window and conditional revalidation
+
+    Within `freshness_seconds` a feed is served straight from the cache. After
+    that it is revalidated with a conditional GET; a 304 keeps the parsed entries
+    and only a 200 is re-parsed. With `cache_dir` set, entries and validators are
+    also written to disk so they survive restarts and are shared by workers.
+    """
+
+    def __init__(self, http: Optional[HttpClient] = None, freshness_seconds: float = 300.0,
+                 cache_dir: Optional[str] = None, max_feeds: int = 256):
+        self.http = http or get_http_client()
+        self.freshness_seconds = freshness_seconds
+        self.cache_dir = cache_dir
+        self.max_feeds = max_feeds
+        self._feeds: Dict[str, CachedFeed] = {}
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self.stats = {'fresh': 0, 'revalidated': 0, 'fetched': 0, 'stale': 0, 'error': 0}
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 15) -> FeedResult:
+        """Return the parsed feed, hitting the network only when the cached copy is stale"""
+        if not FEEDPARSER_AVAILABLE:
+            return self._result(url, None, 'error', error='feedparser not available')
+
+        # One request per URL at a time - concurrent callers wait and reuse it
+        with self._url_lock(url):
+            cached = self._get(url)
+            if cached and time.time() - cached.fetched_at < self.freshness_seconds:
+                return self._result(url, cached, 'fresh')
+
+            request_headers = dict(headers or {})
+            if cached and cached.etag:
+                request_headers['If-None-Match'] = cached.etag
+            if cached and cached.last_modified:
+                request_headers['If-Modified-Since'] = cached.last_modified
+
+            try:
+                response = self.http.get(url, headers=request_headers, timeout=timeout)
+            except Exception as e:
+                if cached:
+                    logger.warning(f"⚠️ Feed {url} unreachable, serving cached copy: {str(e)}")
+                    return self._result(url, cached, 'stale', error=str(e))
+                return self._result(url, None, 'error', error=str(e))
+
+            if response.status_code == 304 and cached:
+                cached.fetched_at = time.time()
+                self._put(cached)
+                return self._result(url, cached, 'revalidated', http_status=304)
+
+            if response.status_code != 200:
+                error = f"HTTP {response.status_code}"
+                if cached:
+                    return self._result(url, cached, 'stale', http_status=response.status_code, error=error)
+                return self._result(url, None, 'error', http_status=response.status_code, error=error)
+
+            parsed = feedparser.parse(response.content)
+            entry = CachedFeed(
+                url=url,
+                entries=list(parsed.entries),
+                feed={key: parsed.feed.get(key) for key in ('title', 'description', 'link') if parsed.feed.get(key)},
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                fetched_at=time.time()
+            )
+            self._put(entry)
+            return self._result(url, entry, 'fetched', http_status=200)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """Drop one feed (or every feed) from memory and disk"""
+        with self._lock:
+            urls = [url] if url else list(self._feeds)
+            for key in urls:
+                self._feeds.pop(key, None)
+                if self.cache_dir:
+                    try:
+                        os.remove(self._path(key))
+                    except OSError:
+                        pass
+
+    def _result(self, url: str, cached: Optional[CachedFeed], status: str,
+                http_status: Optional[int] = None, error: Optional[str] = None) -> FeedResult:
+        self.stats[status] += 1
+        if cached is None:
+            return FeedResult(url=url, cache_status=status, http_status=http_status, error=error)
+        return FeedResult(url=url, entries=cached.entries, feed=cached.feed, cache_status=status,
+                          http_status=http_status, error=error)
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            if url not in self._url_locks:
+                self._url_locks[url] = threading.Lock()
+            return self._url_locks[url]
+
+    def _get(self, url: str) -> Optional[CachedFeed]:
+        with self._lock:
+            cached = self._feeds.get(url)
+        if cached is None and self.cache_dir:
+            cached = self._load(url)
+            if cached:
+                with self._lock:
+                    self._feeds[url] = cached
+        return cached
+
+    def _put(self, cached: CachedFeed) -> None:
+        with self._lock:
+            self._feeds[cached.url] = cached
+            if len(self._feeds) > self.max_feeds:
+                oldest = min(self._feeds.values(), key=lambda f: f.fetched_at)
+                del self._feeds[oldest.url]
+        if self.cache_dir:
+            self._save(cached)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _save(self, cached: CachedFeed) -> None:
+        path = self._path(cached.url)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': cached.url,
+                    'entries': cached.entries,
+                    'feed': cached.feed,
+                    'etag': cached.etag,
+                    'last_modified': cached.last_modified,
+                    'fetched_at': cached.fetched_at
+                }, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Could not persist feed cache for {cached.url}: {str(e)}")
+
+    def _load(self, url: str) -> Optional[CachedFeed]:
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('url') != url:
+            return None
+        return CachedFeed(
+            url=url,
+            entries=[self._restore_entry(entry) for entry in data.get('entries', [])],
+            feed=data.get('feed', {}),
+            etag=data.get('etag'),
+            last_modified=data.get('last_modified'),
+            fetched_at=data.get('fetched_at', 0.0)
+        )
+
+    @staticmethod
+    def _restore_entry(entry: Dict[str, Any]) -> Any:
+        # JSON turns struct_time into lists; restore them so date sorting/filtering still works
+        for key, value in entry.items():
+            if key.endswith('_parsed') and isinstance(value, list) and len(value) == 9:
+                entry[key] = time.struct_time(value)
+        return feedparser.FeedParserDict(entry)
+
+
+_shared_feed_cache: Optional[FeedCache] = None
+_shared_feed_cache_lock = threading.Lock()
+
+
+def get_feed_cache() -> FeedCache:
+    """Get the process-wide feed cache (on disk when FEED_CACHE_DIR is set)"""
+    global _shared_feed_cache
+    with _shared_feed_cache_lock:
+        if _shared_feed_cache is None:
+            _shared_feed_cache = FeedCache(
+                freshness_seconds=float(os.getenv('FEED_CACHE_FRESHNESS_SECONDS', '300')),
+                cache_dir=os.getenv('FEED_CACHE_DIR') or None
+            )
+        return _shared_feed_cache
@@ -0,0 +1,159 @@
+"""
+Concurrent Fan-out Fetch Engine
+Runs independent source fetches in parallel with a bounded worker pool,
+a per-host concurrency cap, a global deadline and optional per-job deadlines
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchJob:
+    """A single unit of work - usually one API source or one RSS feed
+
+    `deadline_seconds` caps this job on its own (counted from when it starts);
+    the run-wide deadline still applies on top of it.
+    """
+    name: str
+    url: str
+    func: Callable[[], Any]
+    deadline_seconds: Optional[float] = None
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc.lower() or self.name
+
+
+@dataclass
+class FetchOutcome:
+    """Result of a fetch job: status is 'ok', 'error' or 'timeout'"""
+    name: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+@dataclass
+class FetchReport:
+    """All outcomes of one fan-out run, in job submission order"""
+    outcomes: List[FetchOutcome] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def completed(self) -> List[FetchOutcome]:
+        return [o for o in self.outcomes if o.status == 'ok']
+
+    @property
+    def timed_out(self) -> List[str]:
+        return [o.name for o in self.outcomes if o.status == 'timeout']
+
+
+class FanOutFetchEngine:
+    """Fan out fetch jobs across a thread pool and return whatever finished in time
+
+    Jobs are only handed to the pool when their host has a free slot, so a
+    single slow host can never occupy every worker. Once the deadline passes
+    the engine stops waiting; jobs still running are reported as timeouts and
+    left to finish on their own request timeouts in the background.
+    """
+
+    def __init__(self, max_workers: int = 8, per_host_limit: int = 2, deadline_seconds: float = 45.0):
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.deadline_seconds = deadline_seconds
+
+    def run(self, jobs: List[FetchJob], deadline_seconds: Optional[float] = None,
+            on_outcome: Optional[Callable[[FetchOutcome], None]] = None) -> FetchReport:
+        """Run all jobs concurrently and return a report once done or out of time
+
+        `on_outcome` is called from the calling thread as soon as each job
+        finishes, fails or misses its own deadline.
+        """
+        budget = self.deadline_seconds if deadline_seconds is None else deadline_seconds
+        started = time.monotonic()
+        deadline = started + budget
+
+        # Keyed by submission position, so jobs sharing a name keep their own outcomes
+        outcomes: Dict[int, FetchOutcome] = {}
+        pending = list(enumerate(jobs))
+        host_in_flight: Dict[str, int] = {}
+        in_flight = {}  # future -> (position, job, submitted_at)
+
+        def finish(position: int, outcome: FetchOutcome) -> None:
+            outcomes[position] = outcome
+            if on_outcome:
+                try:
+                    on_outcome(outcome)
+                except Exception as e:
+                    logger.error(f"❌ Outcome callback failed for {outcome.name}: {str(e)}")
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fetch')
+        try:
+            while pending or in_flight:
+                # Hand runnable jobs to the pool without exceeding per-host caps
+                for entry in list(pending):
+                    if len(in_flight) >= self.max_workers:
+                        break
+                    position, job = entry
+                    host = job.host
+                    if host_in_flight.get(host, 0) >= self.per_host_limit:
+                        continue
+                    pending.remove(entry)
+                    host_in_flight[host] = host_in_flight.get(host, 0) + 1
+                    in_flight[executor.submit(job.func)] = (position, job, time.monotonic())
+
+                now = time.monotonic()
+                if deadline - now <= 0 or not in_flight:
+                    break
+                # Wake up for the earliest of the run deadline and any in-flight job's own deadline
+                wake_at = min([deadline] + [submitted_at + job.deadline_seconds
+                                            for _, job, submitted_at in in_flight.values()
+                                            if job.deadline_seconds is not None])
+
+                done, _ = wait(list(in_flight), timeout=max(0.0, wake_at - now), return_when=FIRST_COMPLETED)
+                for future in done:
+                    position, job, submitted_at = in_flight.pop(future)
+                    host_in_flight[job.host] -= 1
+                    elapsed = time.monotonic() - submitted_at
+                    try:
+                        finish(position, FetchOutcome(job.name, 'ok', result=future.result(), elapsed=elapsed))
+                    except Exception as e:
+                        logger.error(f"❌ Fetch job {job.name} failed: {str(e)}")
+                        finish(position, FetchOutcome(job.name, 'error', error=str(e), elapsed=elapsed))
+
+                # Abandon jobs past their own deadline; the rest keep running
+                now = time.monotonic()
+                for future, (position, job, submitted_at) in list(in_flight.items()):
+                    if job.deadline_seconds is not None and now - submitted_at >= job.deadline_seconds:
+                        del in_flight[future]
+                        host_in_flight[job.host] -= 1
+                        future.cancel()
+                        logger.warning(f"⏱️ {job.name} exceeded its {job.deadline_seconds:g}s deadline")
+                        finish(position, FetchOutcome(job.name, 'timeout', error=f'exceeded {job.deadline_seconds:g}s deadline',
+                                                      elapsed=now - submitted_at))
+        finally:
+            # Never block on stragglers - they are abandoned, not awaited
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for position, job, submitted_at in in_flight.values():
+            finish(position, FetchOutcome(job.name, 'timeout', error='deadline exceeded',
+                                          elapsed=time.monotonic() - submitted_at))
+        for position, job in pending:
+            finish(position, FetchOutcome(job.name, 'timeout', error='not started before deadline'))
+
+        report = FetchReport(
+            outcomes=[outcomes[position] for position in range(len(jobs))],
+            elapsed=time.monotonic() - started
+        )
+        if report.timed_out:
+            logger.warning(f"⏱️ Fetch deadline of {budget:g}s hit - skipped: {', '.join(report.timed_out)}")
+        logger.info(f"📊 Fan-out fetch: {len(report.completed)}/{len(jobs)} jobs completed in {report.elapsed:.1f}s")
+        return report
@@ -0,0 +1,103 @@
+"""
+Hacker News Client
+Shared client for the Hacker News Firebase API: the top story list and item
+JSON are cached with a TTL and missing items are hydrated concurrently
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from http_client import get_http_client, HttpClient
+from ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+HN_API_BASE = 'https://hacker-news.firebaseio.com/v0'
+HN_TOP_STORIES_URL = f'{HN_API_BASE}/topstories.json'
+HN_ITEM_URL = HN_API_BASE + '/item/{}.json'
+
+
+class HackerNewsClient:
+    """Hacker News API client shared by every agent and tool that reads HN
+
+    A call such as top_stories(20) costs at most one list request plus one
+    concurrent batch of item requests; anything fetched within the TTL is
+    served from memory, so repeated gathers only fetch new stories.
+    """
+
+    def __init__(self, http: Optional[HttpClient] = None, item_ttl: float = 600.0,
+                 list_ttl: float = 120.0, max_items: int = 2000):
+        self.http = http or get_http_client()
+        self.items = TTLCache(item_ttl, max_items)
+        self.lists = TTLCache(list_ttl, 16)
+        self.stats = {'item_hits': 0, 'item_fetches': 0, 'list_fetches': 0}
+
+    def top_story_ids(self, limit: int = 50, timeout: float = 10) -> List[int]:
+        """IDs of the current top stories (cached for list_ttl seconds)"""
+        story_ids = self.lists.get('topstories')
+        if story_ids is None:
+            response = self.http.get(HN_TOP_STORIES_URL, timeout=timeout)
+            response.raise_for_status()
+            story_ids = response.json() or []
+            self.lists.set('topstories', story_ids)
+            self.stats['list_fetches'] += 1
+        return story_ids[:limit]
+
+    def get_items(self, item_ids: Iterable[int], timeout: float = 5) -> List[Dict[str, Any]]:
+        """Hydrate items in input order; cache misses are fetched in one concurrent batch
+
+        Items that fail to load or no longer exist are left out of the result.
+        """
+        item_ids = list(item_ids)
+        found: Dict[int, Dict[str, Any]] = {}
+        missing = []
+        for item_id in item_ids:
+            item = self.items.get(item_id)
+            if item is not None:
+                found[item_id] = item
+            elif item_id not in missing:
+                missing.append(item_id)
+        self.stats['item_hits'] += len(found)
+
+        if missing:
+            responses = self.http.get_many([HN_ITEM_URL.format(item_id) for item_id in missing], timeout=timeout)
+            self.stats['item_fetches'] += len(missing)
+            for item_id, response in zip(missing, responses):
+                if isinstance(response, Exception):
+                    logger.warning(f"Failed to fetch HN item {item_id}: {str(response)}")
+                    continue
+                try:
+                    response.raise_for_status()
+                    item = response.json()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch HN item {item_id}: {str(e)}")
+                    continue
+                if item:
+                    self.items.set(item_id, item)
+                    found[item_id] = item
+            logger.info(f"📰 HN items: {len(item_ids) - len(missing)} cached, {len(missing)} fetched concurrently")
+
+        return [found[item_id] for item_id in item_ids if item_id in found]
+
+    def top_stories(self, limit: int = 20, timeout: float = 5) -> List[Dict[str, Any]]:
+        """Hydrated top stories, skipping deleted items and non-story types"""
+        items = self.get_items(self.top_story_ids(limit), timeout=timeout)
+        return [item for item in items if item.get('type') == 'story' and not item.get('deleted')]
+
+
+_shared_hn_client: Optional[HackerNewsClient] = None
+_shared_hn_client_lock = threading.Lock()
+
+
+def get_hn_client() -> HackerNewsClient:
+    """Get the process-wide Hacker News client and its item cache"""
+    global _shared_hn_client
+    with _shared_hn_client_lock:
+        if _shared_hn_client is None:
+            _shared_hn_client = HackerNewsClient(
+                item_ttl=float(os.getenv('HN_ITEM_CACHE_TTL', '600')),
+                list_ttl=float(os.getenv('HN_TOP_STORIES_TTL', '120'))
+            )
+        return _shared_hn_client
@@ -0,0 +1,316 @@
+"""
+Shared HTTP Client
+Asyncio-based HTTP layer used by every scraper: keep-alive connection pools per
+host, HTTP/2 where the server supports it, and a sync facade for CrewAI _run methods
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlparse
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    HTTP2_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+# Connection management is owned by the client - callers must not override these
+_MANAGED_HEADERS = {'connection', 'keep-alive', 'accept-encoding', 'upgrade'}
+
+
+class HttpClientError(Exception):
+    """Base error for all failures raised by the shared HTTP client"""
+
+
+class HttpTimeoutError(HttpClientError):
+    """The request did not complete within its timeout"""
+
+
+class HttpConnectionError(HttpClientError):
+    """The connection could not be established or was dropped"""
+
+
+class HttpStatusError(HttpClientError):
+    """Raised by HttpResponse.raise_for_status() for 4xx/5xx responses"""
+
+    def __init__(self, message: str, response: 'HttpResponse'):
+        super().__init__(message)
+        self.response = response
+
+
+class HttpResponse:
+    """Transport-independent response with the subset of the requests API scrapers use"""
+
+    def __init__(self, status_code: int, headers: Any, content: bytes, url: str,
+                 http_version: str = 'HTTP/1.1', encoding: Optional[str] = None):
+        self.status_code = status_code
+        self.headers = headers  # case-insensitive mapping from the transport
+        self.content = content
+        self.url = url
+        self.http_version = http_version
+        self.encoding = encoding
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HttpStatusError(f"{self.status_code} error for url: {self.url}", response=self)
+
+
+def _clean_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    merged = dict(DEFAULT_HEADERS)
+    for key, value in (headers or {}).items():
+        if key.lower() not in _MANAGED_HEADERS:
+            merged[key] = value
+    return merged
+
+
+class AsyncHttpClient:
+    """Async HTTP client with pooled keep-alive connections and per-host concurrency caps
+
+    Uses httpx (with HTTP/2 when the h2 package is installed). Without httpx it
+    falls back to a pooled requests.Session driven from the loop's executor, so
+    the async API is identical either way.
+    """
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 40,
+                 per_host_limit: int = 6, timeout: float = 15.0, http2: bool = True):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._client = None
+        self._session = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=30.0
+                ),
+                timeout=self.timeout
+            )
+        return self._client
+
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.max_connections, pool_maxsize=self.per_host_limit)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_slots[host]
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                      params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None,
+                      allow_redirects: bool = True) -> HttpResponse:
+        """Send one request; raises HttpClientError subclasses on transport failures"""
+        timeout = timeout or self.timeout
+        request_headers = _clean_headers(headers)
+
+        async with self._host_slot(url):
+            if HTTPX_AVAILABLE:
+                try:
+                    response = await self._get_client().request(
+                        method, url, headers=request_headers, params=params,
+                        timeout=timeout, follow_redirects=allow_redirects
+                    )
+                except httpx.TimeoutException as e:
+                    raise HttpTimeoutError(f"Timeout fetching {url}: {e}") from e
+                except httpx.TransportError as e:
+                    raise HttpConnectionError(f"Connection error fetching {url}: {e}") from e
+                except httpx.HTTPError as e:
+                    raise HttpClientError(f"Request to {url} failed: {e}") from e
+
+                return HttpResponse(response.status_code, response.headers, response.content,
+                                    str(response.url), response.http_version, response.encoding)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(
+                self._blocking_request, method, url, request_headers, params, timeout, allow_redirects))
+
+    def _blocking_request(self, method, url, headers, params, timeout, allow_redirects) -> HttpResponse:
+        try:
+            response = self._get_session().request(method, url, headers=headers, params=params,
+                                                   timeout=timeout, allow_redirects=allow_redirects)
+        except requests.exceptions.Timeout as e:
+            raise HttpTimeoutError(f"Timeout fetching {url}: {e}") from e
+        except requests.exceptions.ConnectionError as e:
+            raise HttpConnectionError(f"Connection error fetching {url}: {e}") from e
+        except requests.RequestException as e:
+            raise HttpClientError(f"Request to {url} failed: {e}") from e
+
+        return HttpResponse(response.status_code, response.headers, response.content,
+                            response.url, 'HTTP/1.1', response.encoding)
+
+    async def get(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request('GET', url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> HttpResponse:
+        return await self.request('HEAD', url, **kwargs)
+
+    async def get_many(self, urls: List[str], **kwargs) -> List[Union[HttpResponse, Exception]]:
+        """GET many URLs concurrently; failures are returned in place, not raised"""
+        return await asyncio.gather(*(self.get(url, **kwargs) for url in urls), return_exceptions=True)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class HttpSession:
+    """Lightweight view over the shared client with its own default headers
+
+    Drop-in for the `requests.Session()` + `headers.update()` pattern: every
+    session shares the same connection pools.
+    """
+
+    def __init__(self, client: 'HttpClient', headers: Optional[Dict[str, str]] = None):
+        self.client = client
+        self.headers = dict(headers or {})
+
+    def _merge(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        return {**self.headers, **(headers or {})}
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> HttpResponse:
+        return self.client.get(url, headers=self._merge(headers), **kwargs)
+
+    def head(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> HttpResponse:
+        return self.client.head(url, headers=self._merge(headers), **kwargs)
+
+    def get_many(self, urls: List[str], headers: Optional[Dict[str, str]] = None, **kwargs) -> List[Union[HttpResponse, Exception]]:
+        return self.client.get_many(urls, headers=self._merge(headers), **kwargs)
+
+
+class HttpClient:
+    """Sync facade over AsyncHttpClient for blocking callers (CrewAI tools, Flask handlers)
+
+    The async client lives on a private event loop thread that is started on
+    first use (and restarted after a fork), so connection pools are shared by
+    every thread in the process.
+    """
+
+    def __init__(self, **client_kwargs):
+        self._client_kwargs = client_kwargs
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._async_client = None
+        self._pid = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._async_client = AsyncHttpClient(**self._client_kwargs)
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='http-client-loop', daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+                logger.info(f"🌐 Shared HTTP client started (httpx={HTTPX_AVAILABLE}, http2={self._async_client.http2})")
+            return self._loop
+
+    @property
+    def async_client(self) -> AsyncHttpClient:
+        self._ensure_loop()
+        return self._async_client
+
+    def run(self, coro):
+        """Run a coroutine on the client loop and block until it finishes"""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("HttpClient.run() called from the client loop - await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def run_async(self, coro):
+        """Await a coroutine on the client loop from another event loop"""
+        loop = self._ensure_loop()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    def request(self, method: str, url: str, **kwargs) -> HttpResponse:
+        return self.run(self.async_client.request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs) -> HttpResponse:
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> HttpResponse:
+        return self.request('HEAD', url, **kwargs)
+
+    def get_many(self, urls: List[str], **kwargs) -> List[Union[HttpResponse, Exception]]:
+        return self.run(self.async_client.get_many(urls, **kwargs))
+
+    def session(self, headers: Optional[Dict[str, str]] = None) -> HttpSession:
+        return HttpSession(self, headers)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._loop is None:
+                return
+            if self._pid == os.getpid():
+                asyncio.run_coroutine_threadsafe(self._async_client.aclose(), self._loop).result()
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=5)
+            self._loop = None
+            self._async_client = None
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the process-wide shared HTTP client"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient(
+                max_connections=int(os.getenv('HTTP_MAX_CONNECTIONS', '100')),
+                per_host_limit=int(os.getenv('HTTP_PER_HOST_LIMIT', '6')),
+                timeout=float(os.getenv('HTTP_DEFAULT_TIMEOUT', '15'))
+            )
+        return _shared_client
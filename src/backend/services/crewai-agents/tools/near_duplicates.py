@@ -0,0 +1,195 @@
+"""
+Near-Duplicate Detection
+MinHash signatures over word shingles of each item's title and body, bucketed
+with LSH banding so syndicated copies of one story (the same wire piece on
+several feeds, an HN link re-posted to Reddit and a Telegram channel) are
+clustered in roughly linear time and collapsed to their best copy before the
+analysis and LLM stages run
+"""
+
+import logging
+import os
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+
+# Body field per item shape: articles and posts carry 'content', Telegram messages 'text'
+_BODY_FIELDS = ('content', 'text', 'summary', 'description')
+
+
+def item_text(item: Mapping[str, Any]) -> str:
+    """Title plus body of a collected item"""
+    body = next((item[field] for field in _BODY_FIELDS if isinstance(item.get(field), str)), '')
+    return f"{item.get('title') or ''} {body}"
+
+
+def item_quality(item: Mapping[str, Any]) -> Tuple:
+    """Sort key for picking a cluster's representative: real over simulated,
+    linked over unlinked, the most complete body, then the most engagement"""
+    engagement = item.get('score') or item.get('views') or 0
+    return (
+        not item.get('simulated', False),
+        bool(item.get('url')),
+        len(item_text(item)),
+        engagement if isinstance(engagement, (int, float)) else 0
+    )
+
+
+class NearDuplicateDetector:
+    """MinHash LSH over word shingles
+
+    Each text becomes a set of `shingle_size`-word shingles, and its signature
+    is the minimum of `num_perm` multiply-shift hashes over that set. Items
+    that agree on every row of at least one of `bands` signature bands become
+    candidate pairs; candidates whose exact shingle Jaccard similarity
+    reaches `threshold` are joined into one cluster (transitively).
+    """
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = 128, bands: int = 32,
+                 shingle_size: int = 3, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # h(x) = (a * x + b) mod 2^64 >> 32 with odd a: 32-bit hashes of 32-bit shingle ids
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+        self.stats = {'items_seen': 0, 'clusters_found': 0, 'duplicates_removed': 0}
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Sorted unique 32-bit ids of the text's word shingles"""
+        tokens = _TOKEN.findall(text.lower()) if text else []
+        if not tokens:
+            return np.empty(0, dtype=np.uint64)
+        size = min(self.shingle_size, len(tokens))
+        ids = {
+            zlib.crc32(" ".join(tokens[start:start + size]).encode('utf-8'))
+            for start in range(len(tokens) - size + 1)
+        }
+        return np.array(sorted(ids), dtype=np.uint64)
+
+    def signature(self, shingles: np.ndarray) -> np.ndarray:
+        """MinHash signature of one shingle set"""
+        if not len(shingles):
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        hashes = (self._a[:, None] * shingles[None, :] + self._b[:, None]) >> np.uint64(32)
+        return hashes.min(axis=1).astype(np.uint32)
+
+    def clusters(self, texts: Sequence[str]) -> List[List[int]]:
+        """Indices of the texts grouped into near-duplicate clusters
+
+        Every index appears in exactly one cluster; clusters are ordered by
+        their first member and list members in input order. Texts without
+        any words are never clustered.
+        """
+        shingle_sets = [self.shingles(text) for text in texts]
+        parent = list(range(len(texts)))
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        candidates = set()
+        buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(self.bands)]
+        for index, shingles in enumerate(shingle_sets):
+            if not len(shingles):
+                continue
+            signature = self.signature(shingles)
+            for band, bucket in enumerate(buckets):
+                members = bucket[signature[band * self.rows:(band + 1) * self.rows].tobytes()]
+                candidates.update((other, index) for other in members)
+                members.append(index)
+
+        for first, second in sorted(candidates):
+            if find(first) == find(second):
+                continue
+            if self._jaccard(shingle_sets[first], shingle_sets[second]) >= self.threshold:
+                parent[find(second)] = find(first)
+
+        grouped: Dict[int, List[int]] = {}
+        for index in range(len(texts)):
+            grouped.setdefault(find(index), []).append(index)
+        return list(grouped.values())
+
+    def collapse(self, items: List[Dict[str, Any]],
+                 rank: Callable[[Mapping[str, Any]], Any] = item_quality) -> List[Dict[str, Any]]:
+        """Keep the best-ranked item of every cluster, in input order"""
+        collapsed, _ = self.collapse_groups({'items': items}, rank)
+        return collapsed['items']
+
+    def collapse_groups(self, groups: Mapping[str, List[Dict[str, Any]]],
+                        rank: Callable[[Mapping[str, Any]], Any] = item_quality
+                        ) -> Tuple[Dict[str, List[Dict[str, Any]]], int]:
+        """Collapse near-duplicates across several item lists (e.g. one per platform)
+
+        The representative stays in its own list at its own position, as a
+        copy annotated with `duplicate_count` and the `duplicate_urls` of the
+        copies it replaced. Returns the new lists and how many items were removed.
+        """
+        located = [(key, position) for key, items in groups.items() for position in range(len(items))]
+        texts = [item_text(groups[key][position]) for key, position in located]
+        kept: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        found = 0
+        for cluster in self.clusters(texts):
+            members = [located[index] for index in cluster]
+            best = max(members, key=lambda member: rank(groups[member[0]][member[1]]))
+            representative = groups[best[0]][best[1]]
+            if len(members) > 1:
+                found += 1
+                duplicates = [groups[key][position] for key, position in members if (key, position) != best]
+                urls = [item.get('url') for item in duplicates if item.get('url')]
+                representative = dict(
+                    representative,
+                    duplicate_count=representative.get('duplicate_count', 0) + len(duplicates),
+                    duplicate_urls=list(dict.fromkeys(representative.get('duplicate_urls', []) + urls))
+                )
+            kept[best] = representative
+
+        collapsed = {
+            key: [kept[(key, position)] for position in range(len(items)) if (key, position) in kept]
+            for key, items in groups.items()
+        }
+        removed = len(located) - len(kept)
+        self.stats['items_seen'] += len(located)
+        self.stats['clusters_found'] += found
+        self.stats['duplicates_removed'] += removed
+        if removed:
+            logger.info(f"🧬 Collapsed {removed} near-duplicate items into {found} clusters")
+        return collapsed, removed
+
+    @staticmethod
+    def _jaccard(first: np.ndarray, second: np.ndarray) -> float:
+        shared = len(np.intersect1d(first, second, assume_unique=True))
+        return shared / (len(first) + len(second) - shared)
+
+
+_shared_detector: Optional[NearDuplicateDetector] = None
+_shared_detector_lock = threading.Lock()
+
+
+def get_near_duplicate_detector() -> NearDuplicateDetector:
+    """Get the process-wide near-duplicate detector"""
+    global _shared_detector
+    with _shared_detector_lock:
+        if _shared_detector is None:
+            _shared_detector = NearDuplicateDetector(
+                threshold=float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.6')),
+                shingle_size=int(os.getenv('NEAR_DUPLICATE_SHINGLE_SIZE', '3'))
+            )
+        return _shared_detector
@@ -0,0 +1,110 @@
+"""
+Multi-Pattern Matcher
+Finds every occurrence of a fixed phrase list in one scan of the text. The
+phrases are compiled once into a single trie-shaped regex, so matching cost
+grows with the text, not with text length x number of phrases
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Set, Tuple, Union
+
+# Marks a trie node where a phrase ends
+_END = ''
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """One occurrence of a phrase; start/end index the original text"""
+    pattern: str
+    label: str
+    start: int
+    end: int
+
+
+def _trie_regex(node: Dict[str, dict]) -> str:
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items()) if char != _END]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if _END in node:
+        # Greedy optional group: the longest phrase at a position wins, shorter
+        # ones are recovered from the prefix table
+        return f"(?:{body})?" if len(branches) == 1 else f"{body}?"
+    return body
+
+
+class PatternMatcher:
+    """Case-insensitive substring matcher for a fixed set of phrases
+
+    Phrases are given as a list or as a {label: [phrases]} mapping; a phrase
+    may appear under several labels. Matching has the same semantics as
+    `phrase.lower() in text.lower()` for every phrase, including overlapping
+    and nested phrases, but scans the text once: a zero-width lookahead finds
+    the longest phrase starting at each position and every shorter phrase
+    that is a prefix of it is reported alongside.
+    """
+
+    def __init__(self, patterns: Union[Mapping[str, Iterable[str]], Iterable[str]]):
+        if isinstance(patterns, Mapping):
+            labelled = [(pattern, label) for label, phrases in patterns.items() for pattern in phrases]
+        else:
+            labelled = [(pattern, '') for pattern in patterns]
+
+        # Normalized phrase -> every (original phrase, label) it stands for
+        self._targets: Dict[str, List[Tuple[str, str]]] = {}
+        for pattern, label in labelled:
+            if pattern:
+                targets = self._targets.setdefault(pattern.lower(), [])
+                if (pattern, label) not in targets:
+                    targets.append((pattern, label))
+
+        trie: Dict[str, dict] = {}
+        for phrase in self._targets:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+
+        # Normalized phrase -> the phrases (itself included) that are its prefixes
+        self._prefixes: Dict[str, List[str]] = {
+            phrase: [phrase[:size] for size in range(1, len(phrase) + 1) if phrase[:size] in self._targets]
+            for phrase in self._targets
+        }
+        self._regex = re.compile(f"(?=({_trie_regex(trie)}))", re.IGNORECASE) if trie else None
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def find_all(self, text: str) -> List[PatternHit]:
+        """Every occurrence of every phrase, ordered by start offset"""
+        hits = []
+        if not text or self._regex is None:
+            return hits
+        for match in self._regex.finditer(text):
+            start = match.start()
+            for phrase in self._prefixes.get(match.group(1).lower(), ()):
+                end = start + len(phrase)
+                for pattern, label in self._targets[phrase]:
+                    hits.append(PatternHit(pattern, label, start, end))
+        return hits
+
+    def first_hits(self, text: str) -> Dict[str, PatternHit]:
+        """First occurrence of each phrase found, keyed by the phrase as given"""
+        first: Dict[str, PatternHit] = {}
+        for hit in self.find_all(text):
+            first.setdefault(hit.pattern, hit)
+        return first
+
+    def matched(self, text: str) -> Set[str]:
+        """Phrases (as given) that occur in the text"""
+        return {hit.pattern for hit in self.find_all(text)}
+
+    def matches_by_label(self, text: str) -> Dict[str, List[str]]:
+        """Distinct phrases found per label, in order of first occurrence"""
+        found: Dict[str, List[str]] = {}
+        for hit in self.find_all(text):
+            phrases = found.setdefault(hit.label, [])
+            if hit.pattern not in phrases:
+                phrases.append(hit.pattern)
+        return found
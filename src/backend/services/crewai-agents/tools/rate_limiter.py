@@ -0,0 +1,183 @@
+"""
+Adaptive Rate Limiter
+Per-host token buckets that requests draw from before hitting the network.
+Rates adapt to what the server reports: X-Ratelimit-* headers set the budget,
+429s trigger backoff (honouring Retry-After) and successes slowly raise the
+rate again. Callers only sleep when the budget is actually exhausted.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def _header_float(headers: Any, name: str) -> Optional[float]:
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket with reservation semantics and a hard 'blocked until' time
+
+    reserve() always takes a token immediately and returns how long the caller
+    must wait before using it, so concurrent callers are spaced out correctly
+    without holding the lock while sleeping.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.blocked_until = 0.0
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def reserve(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            # The token debt only starts paying off once the block lifts
+            return max(0.0, self.blocked_until - now) + wait
+
+    def block_for(self, seconds: float) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + seconds)
+            # Tokens earned while blocked would cause a burst the moment the block lifts
+            self.tokens = min(self.tokens, 0.0)
+            self.updated_at = max(now, self.blocked_until)
+
+
+class AdaptiveRateLimiter:
+    """Per-host token-bucket scheduler with AIMD-style adaptation
+
+    - acquire(url) before each request; it returns immediately while the host
+      still has budget.
+    - observe(url, status_code, headers) after each response; X-Ratelimit-Remaining
+      and X-Ratelimit-Reset spread the remaining budget over the reset window,
+      a 429 halves the rate and blocks the host (Retry-After or exponential backoff),
+      and each success nudges the rate back up towards max_rate.
+    - record_failure(url) after transport errors for a short exponential pause.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: float = 5.0, max_rate: float = 5.0,
+                 min_rate: float = 0.05, max_backoff: float = 60.0):
+        self.default_rate = rate
+        self.burst = burst
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.max_backoff = max_backoff
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'waits': 0, 'waited_seconds': 0.0, 'throttled': 0}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower() or url
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = self._host(url)
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.default_rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to this host is allowed; returns seconds waited"""
+        wait = self.bucket(url).reserve()
+        self.stats['requests'] += 1
+        if wait > 0:
+            self.stats['waits'] += 1
+            self.stats['waited_seconds'] += wait
+            logger.debug(f"⏱️ Rate limit budget for {self._host(url)} used up - waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    def observe(self, url: str, status_code: int, headers: Any = None) -> float:
+        """Adapt the host's rate to a response; returns the backoff imposed (0 if none)"""
+        host = self._host(url)
+        bucket = self.bucket(url)
+
+        if status_code == 429:
+            self.stats['throttled'] += 1
+            with self._lock:
+                failures = self._failures.get(host, 0) + 1
+                self._failures[host] = failures
+            retry_after = _header_float(headers, 'Retry-After')
+            reset = _header_float(headers, 'X-Ratelimit-Reset')
+            delay = retry_after or reset or min(self.max_backoff, 2 ** failures)
+            delay = min(delay, self.max_backoff)
+            with bucket.lock:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+            bucket.block_for(delay)
+            logger.warning(f"⚠️ {host} throttled us (429) - backing off {delay:.1f}s, rate now {bucket.rate:.2f}/s")
+            return delay
+
+        with self._lock:
+            self._failures.pop(host, None)
+
+        remaining = _header_float(headers, 'X-Ratelimit-Remaining')
+        reset = _header_float(headers, 'X-Ratelimit-Reset')
+        if remaining is not None and reset is not None:
+            if remaining < 1:
+                delay = min(reset, self.max_backoff)
+                bucket.block_for(delay)
+                logger.info(f"⏱️ {host} rate limit budget exhausted - pausing {delay:.0f}s until reset")
+                return delay
+            # Spend what is left evenly over the rest of the window
+            with bucket.lock:
+                bucket.rate = min(self.max_rate, max(self.min_rate, remaining / max(reset, 1.0)))
+                bucket.tokens = min(bucket.tokens, remaining)
+        elif status_code < 400:
+            # Additive increase while the host keeps answering
+            with bucket.lock:
+                bucket.rate = min(self.max_rate, bucket.rate + 0.1 * self.default_rate)
+        return 0.0
+
+    def record_failure(self, url: str) -> float:
+        """Short exponential pause after timeouts/connection errors; returns the pause"""
+        host = self._host(url)
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+        delay = min(self.max_backoff, 0.5 * 2 ** (failures - 1))
+        self.bucket(url).block_for(delay)
+        return delay
+
+
+_shared_limiter: Optional[AdaptiveRateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """Get the process-wide rate limiter shared by all scrapers"""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveRateLimiter(
+                rate=float(os.getenv('RATE_LIMIT_DEFAULT_RPS', '1.0')),
+                burst=float(os.getenv('RATE_LIMIT_BURST', '5')),
+                max_rate=float(os.getenv('RATE_LIMIT_MAX_RPS', '5.0'))
+            )
+        return _shared_limiter
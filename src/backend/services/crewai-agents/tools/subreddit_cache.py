@@ -0,0 +1,116 @@
+"""
+Subreddit Existence Cache
+Remembers which generated subreddit names exist (positive) and which do not
+(negative: a 404 or a redirect to search), with separate TTLs, persisted to a JSON file between runs so dead
+variants are skipped and known-good subreddits are tried first.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SubredditCache:
+    """Persistent positive/negative cache of subreddit existence keyed by name"""
+
+    def __init__(self, path: Optional[str] = None, positive_ttl: float = 7 * 86400,
+                 negative_ttl: float = 86400):
+        self.path = path
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+            logger.info(f"📂 Loaded {len(self._entries)} cached subreddit lookups from {self.path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Could not read subreddit cache {self.path}: {str(e)}")
+            self._entries = {}
+
+    def status(self, name: str) -> Optional[bool]:
+        """True if known to exist, False if known dead, None if unknown or expired"""
+        key = name.lower()
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            ttl = self.positive_ttl if entry['exists'] else self.negative_ttl
+            if time.time() - entry['checked_at'] > ttl:
+                del self._entries[key]
+                self._dirty = True
+                return None
+            return bool(entry['exists'])
+
+    def mark(self, name: str, exists: bool) -> None:
+        with self._lock:
+            self._load()
+            self._entries[name.lower()] = {'exists': bool(exists), 'checked_at': time.time()}
+            self._dirty = True
+
+    def rank(self, names: Iterable[str]) -> List[str]:
+        """Dedupe names, drop known-dead ones and put known-good ones first"""
+        known_good, unknown, seen = [], [], set()
+        for name in names:
+            key = name.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            status = self.status(key)
+            if status is True:
+                known_good.append(name)
+            elif status is None:
+                unknown.append(name)
+        return known_good + unknown
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed"""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._entries)
+            self._dirty = False
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not persist subreddit cache {self.path}: {str(e)}")
+
+
+_shared_subreddit_cache: Optional[SubredditCache] = None
+_shared_subreddit_cache_lock = threading.Lock()
+
+
+def get_subreddit_cache() -> SubredditCache:
+    """Get the process-wide subreddit cache (file location from SUBREDDIT_CACHE_PATH)"""
+    global _shared_subreddit_cache
+    with _shared_subreddit_cache_lock:
+        if _shared_subreddit_cache is None:
+            _shared_subreddit_cache = SubredditCache(
+                path=os.getenv('SUBREDDIT_CACHE_PATH',
+                               os.path.join(tempfile.gettempdir(), 'synapse_subreddit_cache.json')),
+                positive_ttl=float(os.getenv('SUBREDDIT_CACHE_POSITIVE_TTL', str(7 * 86400))),
+                negative_ttl=float(os.getenv('SUBREDDIT_CACHE_NEGATIVE_TTL', '86400'))
+            )
+        return _shared_subreddit_cache
@@ -0,0 +1,95 @@
+"""
+Term Matrix
+Tokenizes a batch of articles once into a sparse document-term matrix (COO
+arrays of row, column and count) so NewsAnalysisTool's trend counts, lexicon
+sentiment and keyword rankings are vectorized NumPy reductions instead of
+per-article Python loops
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# Maximal word-character runs; the old \b[a-zA-Z]{n,}\b matches are exactly
+# the runs that are all ASCII letters
+_TOKEN = re.compile(r"\w+")
+
+
+class TermMatrix:
+    """Document-term counts for one batch of texts
+
+    Term IDs follow first occurrence, so stable sorts by count break ties the
+    same way the previous insertion-ordered dict counts did.
+    """
+
+    def __init__(self, texts: Iterable[str]):
+        tokens: List[str] = []
+        lengths: List[int] = []
+        for text in texts:
+            document = _TOKEN.findall(text.lower())
+            tokens.extend(document)
+            lengths.append(len(document))
+
+        # dict keeps first-occurrence order; the id lookups run in C via map()
+        self.terms: List[str] = list(dict.fromkeys(tokens))
+        self.vocabulary: Dict[str, int] = {term: term_id for term_id, term in enumerate(self.terms)}
+        term_ids = np.fromiter(map(self.vocabulary.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        self.document_count = len(lengths)
+
+        size = max(len(self.terms), 1)
+        rows = np.repeat(np.arange(self.document_count, dtype=np.int64), lengths)
+        keys, counts = np.unique(rows * size + term_ids, return_counts=True)
+        self.rows = keys // size
+        self.cols = keys % size
+        self.counts = counts
+
+        self.term_lengths = np.fromiter((len(term) for term in self.terms), dtype=np.int64, count=len(self.terms))
+        self.alphabetic = np.fromiter(
+            (term.isascii() and term.isalpha() for term in self.terms), dtype=bool, count=len(self.terms)
+        )
+        # Vocabulary as one newline-separated string, for substring lookups in C
+        self._joined_terms = "\n".join(self.terms)
+        self._term_starts = np.concatenate(([0], np.cumsum(self.term_lengths + 1)[:-1])).astype(np.int64)
+
+    @classmethod
+    def from_articles(cls, articles: List[Dict[str, Any]]) -> 'TermMatrix':
+        """One document per article: its title and content"""
+        return cls(f"{article.get('title', '')} {article.get('content', '')}" for article in articles)
+
+    def term_mask(self, min_length: int, stopwords: Iterable[str] = ()) -> np.ndarray:
+        """Alphabetic terms of at least `min_length` letters, minus stopwords"""
+        mask = self.alphabetic & (self.term_lengths >= min_length)
+        stop_ids = [self.vocabulary[word] for word in stopwords if word in self.vocabulary]
+        mask[stop_ids] = False
+        return mask
+
+    def term_totals(self) -> np.ndarray:
+        """Occurrences of every term across all documents"""
+        return np.bincount(self.cols, weights=self.counts, minlength=len(self.terms)).astype(np.int64)
+
+    def top_terms(self, mask: np.ndarray, limit: int) -> Tuple[List[Tuple[str, int]], int]:
+        """Most frequent terms under the mask (ties by first occurrence) and how many terms it keeps"""
+        totals = np.where(mask, self.term_totals(), 0)
+        kept = np.flatnonzero(totals)
+        ranked = kept[np.argsort(-totals[kept], kind='stable')][:limit]
+        return [(self.terms[term], int(totals[term])) for term in ranked], len(kept)
+
+    def lexicon_hits(self, words: List[str]) -> np.ndarray:
+        """Per document, how many lexicon words occur anywhere in its text
+
+        Same as `word in text` for alphabetic words: an occurrence always lies
+        inside one word-character run, so the terms containing the word are
+        found with one search over the joined vocabulary and then summed per
+        document.
+        """
+        hits = np.zeros(self.document_count, dtype=np.int64)
+        if not self.terms:
+            return hits
+        for word in words:
+            offsets = [match.start() for match in re.finditer(re.escape(word.lower()), self._joined_terms)]
+            containing = np.zeros(len(self.terms), dtype=bool)
+            containing[np.searchsorted(self._term_starts, offsets, side='right') - 1] = True
+            present = np.bincount(self.rows[containing[self.cols]], minlength=self.document_count)
+            hits += present > 0
+        return hits
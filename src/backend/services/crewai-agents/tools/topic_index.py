@@ -0,0 +1,97 @@
+"""
+Topic Index
+Positional inverted index from term to the items that contain it. Items are
+tokenized once; topic mention counts, per-platform distribution and topic
+assignment are then posting-list lookups instead of one rescan of every item
+per topic
+"""
+
+import bisect
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Set
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+class TopicIndex:
+    """Term -> {item key: token positions} over any number of items
+
+    Topics match on whole tokens, and multi-word topics only where their
+    terms are adjacent. The last term of a topic also matches longer tokens
+    it is a prefix of (startup -> startups, robot -> robotics) once it has
+    `min_prefix_length` characters, so short topics such as "AI" no longer
+    match inside unrelated words.
+    """
+
+    def __init__(self, min_prefix_length: int = 4):
+        self.min_prefix_length = min_prefix_length
+        self._postings: Dict[str, Dict[Hashable, List[int]]] = defaultdict(dict)
+        self._keys: Set[Hashable] = set()
+        self._vocabulary: Optional[List[str]] = None
+
+    def add(self, key: Hashable, *texts: Optional[str]) -> None:
+        """Index an item's texts (e.g. title and body); phrases never span two texts"""
+        position = 0
+        for text in texts:
+            if not isinstance(text, str):
+                continue
+            for term in tokenize(text):
+                self._postings[term].setdefault(key, []).append(position)
+                position += 1
+            position += 1  # gap between texts
+        self._keys.add(key)
+        self._vocabulary = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def postings(self, topic: str) -> Dict[Hashable, int]:
+        """Number of times the topic occurs in each item that mentions it"""
+        terms = tokenize(topic)
+        if not terms:
+            return {}
+        positions = [self._positions(term, last=index == len(terms) - 1) for index, term in enumerate(terms)]
+        keys = set(positions[0])
+        for term_positions in positions[1:]:
+            keys &= term_positions.keys()
+
+        counts = {}
+        for key in keys:
+            following = [term_positions[key] for term_positions in positions[1:]]
+            count = sum(
+                1 for start in positions[0][key]
+                if all(start + offset in term_positions for offset, term_positions in enumerate(following, 1))
+            )
+            if count:
+                counts[key] = count
+        return counts
+
+    def keys_for(self, topic: str) -> Set[Hashable]:
+        """Items that mention the topic"""
+        return set(self.postings(topic))
+
+    def count(self, topic: str, key: Hashable) -> int:
+        """Occurrences of the topic in one item"""
+        return self.postings(topic).get(key, 0)
+
+    def _positions(self, term: str, last: bool) -> Dict[Hashable, Set[int]]:
+        matched = [term]
+        if last and len(term) >= self.min_prefix_length:
+            matched = self._extensions(term)
+        merged: Dict[Hashable, Set[int]] = {}
+        for candidate in matched:
+            for key, found in self._postings.get(candidate, {}).items():
+                merged.setdefault(key, set()).update(found)
+        return merged
+
+    def _extensions(self, prefix: str) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + '\U0010ffff')
+        return self._vocabulary[start:end]
@@ -0,0 +1,133 @@
+"""
+Batch URL Validation
+Checks many URLs concurrently with HEAD requests over the shared HTTP client,
+dedupes them and caches each verdict with a TTL (shorter for failures)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from http_client import get_http_client, HttpClient
+from ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Servers that reject HEAD outright - retry these with a GET
+_HEAD_UNSUPPORTED = {405, 501}
+
+
+@dataclass
+class URLCheck:
+    """Verdict for one URL"""
+    url: str
+    is_valid: bool
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    error: Optional[str] = None
+    checked_at: float = 0.0
+
+
+def has_valid_format(url: str) -> bool:
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return False
+    return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
+
+
+class BatchURLValidator:
+    """Concurrent URL reachability checks with a verdict cache
+
+    check_many() returns a verdict for every input URL: malformed URLs fail
+    without a request, cached verdicts are reused and the remaining unique
+    URLs are checked concurrently (bounded by the HTTP client's per-host cap).
+    """
+
+    def __init__(self, http: Optional[HttpClient] = None, ttl_seconds: float = 3600.0,
+                 negative_ttl_seconds: float = 600.0, timeout: float = 10.0, max_entries: int = 10000):
+        self.http = http or get_http_client()
+        self.timeout = timeout
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.verdicts = TTLCache(ttl_seconds, max_entries)
+        self.stats = {'cache_hits': 0, 'checked': 0}
+
+    def check_many(self, urls: Iterable[str], timeout: Optional[float] = None) -> Dict[str, URLCheck]:
+        """Return {url: URLCheck} for every input URL"""
+        results: Dict[str, URLCheck] = {}
+        to_check: List[str] = []
+        for url in urls:
+            if url in results or url in to_check:
+                continue
+            if not url or not has_valid_format(url):
+                results[url] = URLCheck(url, False, error='invalid URL format', checked_at=time.time())
+                continue
+            cached = self.verdicts.get(url)
+            if cached is not None:
+                results[url] = cached
+                self.stats['cache_hits'] += 1
+            else:
+                to_check.append(url)
+
+        if to_check:
+            started = time.monotonic()
+            checks = self.http.run(self._check_all(to_check, timeout or self.timeout))
+            for check in checks:
+                ttl = None if check.is_valid else self.negative_ttl_seconds
+                self.verdicts.set(check.url, check, ttl)
+                results[check.url] = check
+            self.stats['checked'] += len(to_check)
+            logger.info(f"🔗 Validated {len(to_check)} URLs concurrently in {time.monotonic() - started:.1f}s "
+                        f"({len(results) - len(to_check)} cached/malformed)")
+
+        return results
+
+    def validate_many(self, urls: Iterable[str], timeout: Optional[float] = None) -> Dict[str, bool]:
+        """Return {url: is_valid} for every input URL"""
+        return {url: check.is_valid for url, check in self.check_many(urls, timeout).items()}
+
+    def is_valid(self, url: str) -> bool:
+        return self.check_many([url])[url].is_valid
+
+    def cached_verdict(self, url: str) -> Optional[bool]:
+        """Cached verdict without any network I/O (None if the URL was never checked)"""
+        if not url or not has_valid_format(url):
+            return False
+        cached = self.verdicts.get(url)
+        return cached.is_valid if cached is not None else None
+
+    async def _check_all(self, urls: List[str], timeout: float) -> List[URLCheck]:
+        return await asyncio.gather(*(self._check(url, timeout) for url in urls))
+
+    async def _check(self, url: str, timeout: float) -> URLCheck:
+        client = self.http.async_client
+        try:
+            response = await client.head(url, timeout=timeout, allow_redirects=True)
+            if response.status_code in _HEAD_UNSUPPORTED:
+                response = await client.get(url, timeout=timeout, allow_redirects=True)
+        except Exception as e:
+            return URLCheck(url, False, error=str(e), checked_at=time.time())
+        return URLCheck(url, response.status_code < 400, status_code=response.status_code,
+                        final_url=response.url, checked_at=time.time())
+
+
+_shared_validator: Optional[BatchURLValidator] = None
+_shared_validator_lock = threading.Lock()
+
+
+def get_url_validator() -> BatchURLValidator:
+    """Get the process-wide batch URL validator and its verdict cache"""
+    global _shared_validator
+    with _shared_validator_lock:
+        if _shared_validator is None:
+            _shared_validator = BatchURLValidator(
+                ttl_seconds=float(os.getenv('URL_VALIDATION_TTL', '3600')),
+                negative_ttl_seconds=float(os.getenv('URL_VALIDATION_NEGATIVE_TTL', '600')),
+                timeout=float(os.getenv('URL_VALIDATION_TIMEOUT', '10'))
+            )
+        return _shared_validator